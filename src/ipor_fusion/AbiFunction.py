@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence
+
+from eth_abi.abi import default_codec
+from eth_abi.decoding import TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_utils import function_signature_to_4byte_selector
+from hexbytes import HexBytes
+
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+
+@dataclass(frozen=True)
+class AbiCall:
+    """
+    Encoded call of one function on one contract. `to` and `data` fit
+    Multicall3.aggregate3 directly; `read` goes through TransactionExecutor.read, so
+    calls read inside a ReadBatch are aggregated with the rest of the round.
+    """
+
+    to: str
+    data: bytes
+    decode: Callable[[bytes], Any]
+
+    def read(self, transaction_executor: TransactionExecutor, block_identifier=None):
+        return self.decode(
+            transaction_executor.read(self.to, self.data, block_identifier)
+        )
+
+    @staticmethod
+    def read_many(
+        transaction_executor: TransactionExecutor,
+        calls: Sequence["AbiCall"],
+        block_identifier=None,
+    ) -> List[Any]:
+        with transaction_executor.batch(block_identifier) as batch:
+            futures = [batch.submit(call.read, transaction_executor) for call in calls]
+        return [future.result() for future in futures]
+
+
+class AbiFunction:
+    """
+    Function of a contract ABI with its selector and tuple codecs built once, so
+    encoding a call skips type-string parsing and registry lookups. Bindings emitted
+    by BindingGenerator hold one AbiFunction per function, with the selector
+    precomputed at generation time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        inputs: List[str],
+        outputs: List[str],
+        selector: Optional[bytes] = None,
+    ):
+        self.name = name
+        self.inputs = inputs
+        self.outputs = outputs
+        self.signature = f"{name}({','.join(inputs)})"
+        self.selector = selector or function_signature_to_4byte_selector(self.signature)
+        registry = default_codec._registry
+        self._encoder = TupleEncoder(
+            encoders=[registry.get_encoder(type_str) for type_str in inputs]
+        )
+        self._decoder = TupleDecoder(
+            decoders=[registry.get_decoder(type_str) for type_str in outputs]
+        )
+
+    def encode(self, *args) -> bytes:
+        return self.selector + self._encoder(args)
+
+    def decode(self, data) -> Any:
+        """A single output is returned bare, several as a tuple, none as None."""
+        values = self._decoder(default_codec.stream_class(bytes(HexBytes(data))))
+        if len(values) == 1:
+            return values[0]
+        return values or None
+
+    def call(self, contract: str, *args) -> AbiCall:
+        return AbiCall(contract, self.encode(*args), self.decode)
@@ -1,15 +1,16 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Iterator, List
 
 from eth_abi import encode, decode
 from eth_typing import ChecksumAddress
-from eth_utils import function_signature_to_4byte_selector
-from hexbytes import HexBytes
 from web3 import Web3
 from web3.types import TxReceipt, LogReceipt
 
+from ipor_fusion.EventTopics import EventTopics
 from ipor_fusion.Roles import Roles
+from ipor_fusion.Selectors import Selectors
 from ipor_fusion.TransactionExecutor import TransactionExecutor
+from ipor_fusion.TransactionHandle import TransactionHandle
 
 
 @dataclass
@@ -32,20 +33,32 @@ class AccessManager:
         return self._access_manager_address
 
     def grant_role(self, role_id: int, account: str, execution_delay) -> TxReceipt:
-        selector = function_signature_to_4byte_selector(
-            "grantRole(uint64,address,uint32)"
-        )
-        function = selector + encode(
-            ["uint64", "address", "uint32"], [role_id, account, execution_delay]
-        )
+        function = self.__grant_role(role_id, account, execution_delay)
         return self._transaction_executor.execute(
             self._access_manager_address, function
         )
 
-    def has_role(self, role_id: int, account: str) -> (bool, int):
-        selector = function_signature_to_4byte_selector("hasRole(uint64,address)")
+    def submit_grant_role(
+        self, role_id: int, account: str, execution_delay
+    ) -> TransactionHandle:
+        function = self.__grant_role(role_id, account, execution_delay)
+        return self._transaction_executor.submit(self._access_manager_address, function)
+
+    @staticmethod
+    def __grant_role(role_id: int, account: str, execution_delay) -> bytes:
+        selector = Selectors.GRANT_ROLE
+        return selector + encode(
+            ["uint64", "address", "uint32"], [role_id, account, execution_delay]
+        )
+
+    def has_role(
+        self, role_id: int, account: str, block_identifier=None
+    ) -> (bool, int):
+        selector = Selectors.HAS_ROLE
         function = selector + encode(["uint64", "address"], [role_id, account])
-        read = self._transaction_executor.read(self._access_manager_address, function)
+        read = self._transaction_executor.read(
+            self._access_manager_address, function, block_identifier
+        )
         is_member, execution_delay = decode(["bool", "uint32"], read)
         return is_member, execution_delay
 
@@ -59,7 +72,7 @@ class AccessManager:
         ]
 
     def get_accounts_with_role(self, role_id: int) -> List[RoleAccount]:
-        events = self.get_grant_role_events()
+        events = self.iter_grant_role_events()
         role_accounts = []
         for event in events:
             (_role_id,) = decode(["uint64"], event["topics"][1])
@@ -77,7 +90,7 @@ class AccessManager:
         return role_accounts
 
     def get_all_role_accounts(self) -> List[RoleAccount]:
-        events = self.get_grant_role_events()
+        events = self.iter_grant_role_events()
         role_accounts = []
         for event in events:
             (role_id,) = decode(["uint64"], event["topics"][1])
@@ -94,10 +107,10 @@ class AccessManager:
         return role_accounts
 
     def get_grant_role_events(self) -> List[LogReceipt]:
-        event_signature_hash = HexBytes(
-            Web3.keccak(text="RoleGranted(uint64,address,uint32,uint48,bool)")
-        ).to_0x_hex()
-        logs = self._transaction_executor.get_logs(
-            contract_address=self._access_manager_address, topics=[event_signature_hash]
+        return list(self.iter_grant_role_events())
+
+    def iter_grant_role_events(self) -> Iterator[LogReceipt]:
+        return self._transaction_executor.iter_logs(
+            contract_address=self._access_manager_address,
+            topics=[EventTopics.ROLE_GRANTED],
         )
-        return logs
@@ -0,0 +1,96 @@
+import asyncio
+from typing import List
+
+from eth_abi import encode, decode
+from eth_typing import ChecksumAddress
+from web3 import Web3
+from web3.types import TxReceipt, LogReceipt
+
+from ipor_fusion.AccessManager import RoleAccount
+from ipor_fusion.AsyncTransactionExecutor import AsyncTransactionExecutor
+from ipor_fusion.EventTopics import EventTopics
+from ipor_fusion.Roles import Roles
+from ipor_fusion.Selectors import Selectors
+
+
+class AsyncAccessManager:
+
+    def __init__(
+        self,
+        transaction_executor: AsyncTransactionExecutor,
+        access_manager_address: str,
+    ):
+        self._transaction_executor = transaction_executor
+        self._access_manager_address = access_manager_address
+
+    def address(self) -> str:
+        return self._access_manager_address
+
+    async def grant_role(
+        self, role_id: int, account: str, execution_delay
+    ) -> TxReceipt:
+        selector = Selectors.GRANT_ROLE
+        function = selector + encode(
+            ["uint64", "address", "uint32"], [role_id, account, execution_delay]
+        )
+        return await self._transaction_executor.execute(
+            self._access_manager_address, function
+        )
+
+    async def has_role(
+        self, role_id: int, account: str, block_identifier=None
+    ) -> (bool, int):
+        selector = Selectors.HAS_ROLE
+        function = selector + encode(["uint64", "address"], [role_id, account])
+        read = await self._transaction_executor.read(
+            self._access_manager_address, function, block_identifier
+        )
+        is_member, execution_delay = decode(["bool", "uint32"], read)
+        return is_member, execution_delay
+
+    async def owner(self) -> ChecksumAddress:
+        return (await self.owners())[0]
+
+    async def owners(self) -> List[ChecksumAddress]:
+        return [
+            role_account.account
+            for role_account in await self.get_accounts_with_role(Roles.OWNER_ROLE)
+        ]
+
+    async def get_accounts_with_role(self, role_id: int) -> List[RoleAccount]:
+        return [
+            role_account
+            for role_account in await self.get_all_role_accounts()
+            if role_account.role_id == role_id
+        ]
+
+    async def get_all_role_accounts(self) -> List[RoleAccount]:
+        events = await self.get_grant_role_events()
+        grants = []
+        for event in events:
+            (role_id,) = decode(["uint64"], event["topics"][1])
+            (account,) = decode(["address"], event["topics"][2])
+            grants.append((role_id, account))
+        memberships = await asyncio.gather(
+            *[self.has_role(role_id, account) for role_id, account in grants]
+        )
+        role_accounts = []
+        for (role_id, account), (is_member, execution_delay) in zip(
+            grants, memberships
+        ):
+            if is_member:
+                role_accounts.append(
+                    RoleAccount(
+                        account=Web3.to_checksum_address(account),
+                        role_id=role_id,
+                        is_member=is_member,
+                        execution_delay=execution_delay,
+                    )
+                )
+        return role_accounts
+
+    async def get_grant_role_events(self) -> List[LogReceipt]:
+        return await self._transaction_executor.get_logs(
+            contract_address=self._access_manager_address,
+            topics=[EventTopics.ROLE_GRANTED],
+        )
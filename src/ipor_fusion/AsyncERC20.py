@@ -0,0 +1,48 @@
+from eth_abi import encode, decode
+from web3.types import TxReceipt
+
+from ipor_fusion.AsyncTransactionExecutor import AsyncTransactionExecutor
+from ipor_fusion.Selectors import Selectors
+
+
+class AsyncERC20:
+
+    def __init__(
+        self, transaction_executor: AsyncTransactionExecutor, asset_address: str
+    ):
+        self._transaction_executor = transaction_executor
+        self._asset_address = asset_address
+
+    def address(self) -> str:
+        return self._asset_address
+
+    async def transfer(self, to: str, amount: int) -> TxReceipt:
+        sig = Selectors.TRANSFER
+        encoded_args = encode(["address", "uint256"], [to, amount])
+        return await self._transaction_executor.execute(
+            self._asset_address, sig + encoded_args
+        )
+
+    async def approve(self, spender: str, amount: int) -> TxReceipt:
+        sig = Selectors.APPROVE
+        encoded_args = encode(["address", "uint256"], [spender, amount])
+        return await self._transaction_executor.execute(
+            self._asset_address, sig + encoded_args
+        )
+
+    async def balance_of(self, account: str, block_identifier=None) -> int:
+        sig = Selectors.BALANCE_OF
+        encoded_args = encode(["address"], [account])
+        read = await self._transaction_executor.read(
+            self._asset_address, sig + encoded_args, block_identifier
+        )
+        (result,) = decode(["uint256"], read)
+        return result
+
+    async def decimals(self, block_identifier=None) -> int:
+        sig = Selectors.DECIMALS
+        read = await self._transaction_executor.read(
+            self._asset_address, sig, block_identifier
+        )
+        (result,) = decode(["uint256"], read)
+        return result
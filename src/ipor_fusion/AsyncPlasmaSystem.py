@@ -0,0 +1,73 @@
+from typing import List
+
+from ipor_fusion.AsyncAccessManager import AsyncAccessManager
+from ipor_fusion.AsyncERC20 import AsyncERC20
+from ipor_fusion.AsyncPlasmaVault import AsyncPlasmaVault
+from ipor_fusion.AsyncTransactionExecutor import AsyncTransactionExecutor
+from ipor_fusion.ExternalSystemsDataProvider import ExternalSystemsData
+from ipor_fusion.PlasmaVaultDataReader import PlasmaVaultData
+
+
+class AsyncPlasmaSystem:
+    """
+    asyncio counterpart of PlasmaSystem. Fuse actions do not do any I/O, so markets are
+    still built with PlasmaSystem and their actions passed to plasma_vault().execute.
+    """
+
+    def __init__(
+        self,
+        transaction_executor: AsyncTransactionExecutor,
+        chain_id: int,
+        plasma_vault_data: PlasmaVaultData,
+        external_systems_data: ExternalSystemsData,
+    ):
+        self._transaction_executor = transaction_executor
+        self._chain_id = chain_id
+        self._plasma_vault_data = plasma_vault_data
+        self._plasma_vault = AsyncPlasmaVault(
+            transaction_executor=transaction_executor,
+            plasma_vault_address=plasma_vault_data.plasma_vault_address,
+        )
+        self._access_manager = AsyncAccessManager(
+            transaction_executor=transaction_executor,
+            access_manager_address=plasma_vault_data.access_manager_address,
+        )
+        self._usdc = AsyncERC20(
+            transaction_executor=transaction_executor,
+            asset_address=external_systems_data.usdc_address,
+        )
+        self._usdt = AsyncERC20(
+            transaction_executor=transaction_executor,
+            asset_address=external_systems_data.usdt_address,
+        )
+        self._weth = AsyncERC20(
+            transaction_executor=transaction_executor,
+            asset_address=external_systems_data.weth_address,
+        )
+
+    def transaction_executor(self) -> AsyncTransactionExecutor:
+        return self._transaction_executor
+
+    def plasma_vault(self) -> AsyncPlasmaVault:
+        return self._plasma_vault
+
+    def access_manager(self) -> AsyncAccessManager:
+        return self._access_manager
+
+    def usdc(self) -> AsyncERC20:
+        return self._usdc
+
+    def usdt(self) -> AsyncERC20:
+        return self._usdt
+
+    def weth(self) -> AsyncERC20:
+        return self._weth
+
+    def fuses(self) -> List[str]:
+        return self._plasma_vault_data.fuses
+
+    def alpha(self) -> str:
+        return self._transaction_executor.get_account_address()
+
+    def chain_id(self):
+        return self._chain_id
@@ -0,0 +1,174 @@
+from typing import List, Union
+
+from eth_abi import encode, decode
+from web3.types import TxReceipt, LogReceipt
+
+from ipor_fusion.AsyncTransactionExecutor import AsyncTransactionExecutor
+from ipor_fusion.EventTopics import EventTopics
+from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
+
+
+class AsyncPlasmaVault:
+
+    def __init__(
+        self,
+        transaction_executor: AsyncTransactionExecutor,
+        plasma_vault_address: str,
+    ):
+        self._transaction_executor = transaction_executor
+        self._plasma_vault_address = plasma_vault_address
+
+    def address(self) -> str:
+        return self._plasma_vault_address
+
+    async def execute(self, actions: List[FuseAction]) -> TxReceipt:
+        function = self.__execute(actions)
+        return await self._transaction_executor.execute(
+            self._plasma_vault_address, function
+        )
+
+    async def deposit(self, assets: int, receiver: str) -> TxReceipt:
+        sig = Selectors.DEPOSIT
+        encoded_args = encode(["uint256", "address"], [assets, receiver])
+        return await self._transaction_executor.execute(
+            self._plasma_vault_address, sig + encoded_args
+        )
+
+    async def mint(self, shares: int, receiver: str) -> TxReceipt:
+        sig = Selectors.MINT
+        encoded_args = encode(["uint256", "address"], [shares, receiver])
+        return await self._transaction_executor.execute(
+            self._plasma_vault_address, sig + encoded_args
+        )
+
+    async def redeem(self, shares: int, receiver: str, owner: str) -> TxReceipt:
+        sig = Selectors.REDEEM
+        encoded_args = encode(
+            ["uint256", "address", "address"], [shares, receiver, owner]
+        )
+        return await self._transaction_executor.execute(
+            self._plasma_vault_address, sig + encoded_args
+        )
+
+    async def withdraw(self, assets: int, receiver: str, owner: str) -> TxReceipt:
+        sig = Selectors.WITHDRAW
+        encoded_args = encode(
+            ["uint256", "address", "address"], [assets, receiver, owner]
+        )
+        return await self._transaction_executor.execute(
+            self._plasma_vault_address, sig + encoded_args
+        )
+
+    async def balance_of(self, account: str, block_identifier=None) -> int:
+        sig = Selectors.BALANCE_OF
+        encoded_args = encode(["address"], [account])
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig + encoded_args, block_identifier
+        )
+        (result,) = decode(["uint256"], read)
+        return result
+
+    async def max_withdraw(self, account: str, block_identifier=None) -> int:
+        sig = Selectors.MAX_WITHDRAW
+        encoded_args = encode(["address"], [account])
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig + encoded_args, block_identifier
+        )
+        (result,) = decode(["uint256"], read)
+        return result
+
+    async def total_assets_in_market(self, market: int, block_identifier=None) -> int:
+        sig = Selectors.TOTAL_ASSETS_IN_MARKET
+        encoded_args = encode(["uint256"], [market])
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig + encoded_args, block_identifier
+        )
+        (result,) = decode(["uint256"], read)
+        return result
+
+    async def decimals(self, block_identifier=None) -> int:
+        sig = Selectors.DECIMALS
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
+        (result,) = decode(["uint256"], read)
+        return result
+
+    async def total_assets(self, block_identifier=None) -> int:
+        sig = Selectors.TOTAL_ASSETS
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
+        (result,) = decode(["uint256"], read)
+        return result
+
+    async def underlying_asset_address(self, block_identifier=None) -> str:
+        sig = Selectors.ASSET
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
+        (result,) = decode(["address"], read)
+        return result
+
+    async def convert_to_assets(self, amount: int, block_identifier=None) -> int:
+        sig = Selectors.CONVERT_TO_ASSETS
+        encoded_args = encode(["uint256"], [amount])
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig + encoded_args, block_identifier
+        )
+        (result,) = decode(["uint256"], read)
+        return result
+
+    async def get_access_manager_address(self, block_identifier=None) -> str:
+        sig = Selectors.GET_ACCESS_MANAGER_ADDRESS
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
+        (result,) = decode(["address"], read)
+        return result
+
+    async def get_rewards_claim_manager_address(self, block_identifier=None) -> str:
+        sig = Selectors.GET_REWARDS_CLAIM_MANAGER_ADDRESS
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
+        (result,) = decode(["address"], read)
+        return result
+
+    async def get_fuses(self, block_identifier=None) -> List[str]:
+        sig = Selectors.GET_FUSES
+        read = await self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
+        (result,) = decode(["address[]"], read)
+        return result
+
+    async def get_market_substrates(
+        self, market_id: int, block_identifier=None
+    ) -> bytes:
+        sig = Selectors.GET_MARKET_SUBSTRATES
+        encoded_args = encode(["uint256"], [market_id])
+        return await self._transaction_executor.read(
+            self._plasma_vault_address, sig + encoded_args, block_identifier
+        )
+
+    async def withdraw_manager_address(self) -> Union[str, None]:
+        events = await self.get_withdraw_manager_changed_events()
+        sorted_events = sorted(
+            events, key=lambda event: event["blockNumber"], reverse=True
+        )
+        if sorted_events:
+            (decoded_address,) = decode(["address"], sorted_events[0]["data"])
+            return decoded_address
+        return None
+
+    async def get_withdraw_manager_changed_events(self) -> List[LogReceipt]:
+        return await self._transaction_executor.get_logs(
+            contract_address=self._plasma_vault_address,
+            topics=[EventTopics.WITHDRAW_MANAGER_CHANGED],
+        )
+
+    @staticmethod
+    def __execute(actions: List[FuseAction]) -> bytes:
+        return Selectors.EXECUTE + FuseAction.encode_many(actions)
@@ -0,0 +1,95 @@
+import asyncio
+
+from eth_account import Account
+from web3 import Web3
+
+from ipor_fusion.AsyncPlasmaSystem import AsyncPlasmaSystem
+from ipor_fusion.AsyncPlasmaVault import AsyncPlasmaVault
+from ipor_fusion.AsyncTransactionExecutor import AsyncTransactionExecutor
+from ipor_fusion.ExternalSystemsDataProvider import ExternalSystemsDataProvider
+from ipor_fusion.PlasmaVaultDataReader import PlasmaVaultData
+
+
+class AsyncPlasmaVaultSystemFactory:
+    """
+    One factory (and so one pooled session) can serve any number of vaults:
+
+    factory = AsyncPlasmaVaultSystemFactory(provider_url, private_key)
+    systems = await asyncio.gather(*[factory.get(vault) for vault in vaults])
+    """
+
+    def __init__(
+        self,
+        provider_url: str,
+        private_key: str,
+        pool_size: int = AsyncTransactionExecutor.DEFAULT_POOL_SIZE,
+    ):
+        # pylint: disable=no-value-for-parameter
+        self._account = Account.from_key(private_key=private_key)
+        self._provider_url = provider_url
+        self._pool_size = pool_size
+        self._transaction_executor = None
+        self._connect_lock = asyncio.Lock()
+
+    async def transaction_executor(self) -> AsyncTransactionExecutor:
+        async with self._connect_lock:
+            if self._transaction_executor is None:
+                web3 = await AsyncTransactionExecutor.connect(
+                    self._provider_url, self._pool_size
+                )
+                self._transaction_executor = AsyncTransactionExecutor(
+                    web3, self._account
+                )
+        return self._transaction_executor
+
+    async def get(self, plasma_vault_address: str) -> AsyncPlasmaSystem:
+        transaction_executor = await self.transaction_executor()
+        plasma_vault_data, chain_id = await asyncio.gather(
+            self._read_plasma_vault_data(transaction_executor, plasma_vault_address),
+            transaction_executor.chain_id(),
+        )
+        external_systems_data = ExternalSystemsDataProvider.for_chain(chain_id)
+        return AsyncPlasmaSystem(
+            transaction_executor=transaction_executor,
+            chain_id=chain_id,
+            plasma_vault_data=plasma_vault_data,
+            external_systems_data=external_systems_data,
+        )
+
+    async def close(self):
+        if self._transaction_executor is not None:
+            await self._transaction_executor.close()
+
+    @staticmethod
+    async def _read_plasma_vault_data(
+        transaction_executor: AsyncTransactionExecutor, plasma_vault_address: str
+    ) -> PlasmaVaultData:
+        plasma_vault = AsyncPlasmaVault(transaction_executor, plasma_vault_address)
+        (
+            access_manager_address,
+            asset_address,
+            withdraw_manager_address,
+            rewards_claim_manager_address,
+            fuses,
+        ) = await asyncio.gather(
+            plasma_vault.get_access_manager_address(),
+            plasma_vault.underlying_asset_address(),
+            plasma_vault.withdraw_manager_address(),
+            plasma_vault.get_rewards_claim_manager_address(),
+            plasma_vault.get_fuses(),
+        )
+        withdraw_manager_address_checksum = None
+        if withdraw_manager_address:
+            withdraw_manager_address_checksum = Web3.to_checksum_address(
+                withdraw_manager_address
+            )
+        return PlasmaVaultData(
+            plasma_vault_address=plasma_vault_address,
+            access_manager_address=Web3.to_checksum_address(access_manager_address),
+            withdraw_manager_address=withdraw_manager_address_checksum,
+            asset_address=Web3.to_checksum_address(asset_address),
+            rewards_claim_manager_address=Web3.to_checksum_address(
+                rewards_claim_manager_address
+            ),
+            fuses=[Web3.to_checksum_address(fuse) for fuse in fuses],
+        )
@@ -0,0 +1,188 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3.types import TxReceipt, LogReceipt
+
+from ipor_fusion.JsonRpcBatch import JsonRpcBatch
+from ipor_fusion.LogFetcher import LogFetcher
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+
+class AsyncTransactionExecutor:
+    """
+    asyncio counterpart of TransactionExecutor. All requests of one executor go
+    through a single pooled aiohttp session, so one event loop can keep thousands
+    of reads and sends in flight.
+    """
+
+    DEFAULT_TRANSACTION_MAX_PRIORITY_FEE = (
+        TransactionExecutor.DEFAULT_TRANSACTION_MAX_PRIORITY_FEE
+    )
+    GAS_PRICE_MARGIN = TransactionExecutor.GAS_PRICE_MARGIN
+    DEFAULT_POOL_SIZE = 100
+    DEFAULT_TIMEOUT = 30
+
+    def __init__(self, web3: AsyncWeb3, account, gas_multiplier=1.25):
+        self._web3 = web3
+        self._account = account
+        self._gas_multiplier = gas_multiplier
+        self._nonce_lock = asyncio.Lock()
+        self._next_nonces: Dict[str, int] = {}
+        self._chain_id: Optional[int] = None
+
+    @staticmethod
+    async def connect(
+        provider_url: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> AsyncWeb3:
+        provider = AsyncHTTPProvider(provider_url)
+        session = ClientSession(
+            connector=TCPConnector(limit=pool_size),
+            timeout=ClientTimeout(total=timeout),
+        )
+        await provider.cache_async_session(session)
+        return AsyncWeb3(provider)
+
+    async def close(self):
+        await self._web3.provider.disconnect()
+
+    def get_account_address(self):
+        return self._account.address
+
+    async def execute(self, contract_address: str, function: bytes) -> TxReceipt:
+        tx_hash = await self.submit(contract_address, function)
+        receipt = await self._web3.eth.wait_for_transaction_receipt(tx_hash)
+        assert receipt["status"] == 1, "Transaction failed"
+        return receipt
+
+    async def submit(self, contract_address: str, function: bytes) -> HexBytes:
+        from_address = self._account.address
+        nonce = await self._next_nonce(from_address)
+        try:
+            transaction = await self._prepare_transaction(
+                from_address, contract_address, function, nonce
+            )
+            signed_tx = self._web3.eth.account.sign_transaction(
+                transaction, self._account.key
+            )
+            return await self._web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception:
+            async with self._nonce_lock:
+                self._next_nonces.pop(from_address, None)
+            raise
+
+    async def prepare_transaction(self, contract_address, function):
+        return await self._prepare_transaction(
+            self._account.address, contract_address, function
+        )
+
+    async def _prepare_transaction(
+        self, from_address, contract_address, function, nonce: Optional[int] = None
+    ):
+        data = f"0x{function.hex()}"
+        batch = JsonRpcBatch(self._web3)
+        batch.add("eth_gasPrice", [])
+        batch.add(
+            "eth_estimateGas",
+            [{"to": contract_address, "from": from_address, "data": data}],
+        )
+        batch.add("eth_chainId", [])
+        if nonce is None:
+            batch.add("eth_getTransactionCount", [from_address, "latest"])
+        gas_price, estimated_gas, chain_id, *chain_nonce = [
+            int(result, 16) for result in await batch.async_execute()
+        ]
+        if nonce is None:
+            (nonce,) = chain_nonce
+        return {
+            "chainId": chain_id,
+            "gas": int(self._gas_multiplier * estimated_gas),
+            "maxFeePerGas": self.calculate_max_fee_per_gas(gas_price),
+            "maxPriorityFeePerGas": self.get_max_priority_fee(gas_price),
+            "to": contract_address,
+            "from": from_address,
+            "nonce": nonce,
+            "data": data,
+        }
+
+    async def _next_nonce(self, address: str) -> int:
+        async with self._nonce_lock:
+            nonce = self._next_nonces.get(address)
+            if nonce is None:
+                nonce = await self._web3.eth.get_transaction_count(address, "pending")
+            self._next_nonces[address] = nonce + 1
+            return nonce
+
+    async def estimate_gas(self, contract_address, data) -> int:
+        return int(
+            self._gas_multiplier
+            * await self._web3.eth.estimate_gas(
+                {"to": contract_address, "from": self._account.address, "data": data}
+            )
+        )
+
+    async def read(self, contract, data, block_identifier=None) -> HexBytes:
+        return await self._web3.eth.call(
+            {"to": contract, "data": data}, block_identifier
+        )
+
+    def calculate_max_fee_per_gas(self, gas_price):
+        return gas_price + TransactionExecutor.percent_of(
+            gas_price, self.GAS_PRICE_MARGIN
+        )
+
+    def get_max_priority_fee(self, gas_price):
+        return min(self.DEFAULT_TRANSACTION_MAX_PRIORITY_FEE, gas_price // 10)
+
+    async def get_logs(
+        self, contract_address: str, topics: List[str], from_block=0, to_block="latest"
+    ) -> List[LogReceipt]:
+        """
+        Like LogFetcher: the whole range is asked for at once and only ranges the
+        provider rejects for their size are halved, with both halves fetched
+        concurrently.
+        """
+        from_block, to_block = await asyncio.gather(
+            self._block_number(from_block), self._block_number(to_block)
+        )
+        if from_block > to_block:
+            return []
+        return await self._get_logs(contract_address, topics, from_block, to_block)
+
+    async def _get_logs(
+        self, contract_address: str, topics: List[str], start: int, end: int
+    ) -> List[LogReceipt]:
+        try:
+            return await self._web3.eth.get_logs(
+                {
+                    "fromBlock": start,
+                    "toBlock": end,
+                    "address": contract_address,
+                    "topics": topics,
+                }
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if start == end or not LogFetcher.is_too_many_results(e):
+                raise
+        middle = (start + end) // 2
+        first, second = await asyncio.gather(
+            self._get_logs(contract_address, topics, start, middle),
+            self._get_logs(contract_address, topics, middle + 1, end),
+        )
+        return first + second
+
+    async def _block_number(self, block_identifier) -> int:
+        if isinstance(block_identifier, int):
+            return block_identifier
+        if block_identifier == "latest":
+            return await self._web3.eth.block_number
+        return (await self._web3.eth.get_block(block_identifier))["number"]
+
+    async def chain_id(self):
+        if self._chain_id is None:
+            self._chain_id = await self._web3.eth.chain_id
+        return self._chain_id
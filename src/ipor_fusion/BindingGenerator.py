@@ -0,0 +1,210 @@
+import json
+import keyword
+import re
+import sys
+from typing import Dict, List, Optional
+
+from eth_utils import event_signature_to_log_topic, function_signature_to_4byte_selector
+
+
+class BindingGenerator:
+    """
+    Emits the source of a typed binding class from a contract ABI (a plain ABI list or
+    a Foundry/Hardhat artifact with an "abi" key). Each function becomes an AbiFunction
+    constant with its selector precomputed, plus a method: view functions read through
+    TransactionExecutor.read and take a block_identifier, the others get `name` (execute)
+    and `submit_name` (submit). Events become topic constants.
+
+    python -m ipor_fusion.BindingGenerator PlasmaVault PlasmaVault.json > PlasmaVault.py
+    """
+
+    PYTHON_TYPES = {"address": "str", "bool": "bool", "string": "str"}
+    RESERVED_NAMES = {"address"}
+
+    def __init__(self, class_name: str, abi: List[Dict]):
+        self._class_name = class_name
+        self._abi = abi
+
+    @staticmethod
+    def from_artifact(class_name: str, path: str) -> "BindingGenerator":
+        with open(path, encoding="utf-8") as file:
+            artifact = json.load(file)
+        abi = artifact["abi"] if isinstance(artifact, dict) else artifact
+        return BindingGenerator(class_name, abi)
+
+    def generate(self) -> str:
+        functions = self._functions()
+        transacts = any(not self._is_view(entry) for _, _, entry in functions)
+        lines = [
+            f"# Generated by BindingGenerator from the {self._class_name} ABI.",
+            "# Do not edit by hand, regenerate instead.",
+        ]
+        if transacts:
+            lines.extend(["from web3.types import TxReceipt", ""])
+        lines.extend(
+            [
+                "from ipor_fusion.AbiFunction import AbiFunction",
+                "from ipor_fusion.TransactionExecutor import TransactionExecutor",
+            ]
+        )
+        if transacts:
+            lines.append("from ipor_fusion.TransactionHandle import TransactionHandle")
+        lines.extend(["", "", f"class {self._class_name}:"])
+        for constant, event in self._events():
+            signature = f"{event['name']}({','.join(self._types(event['inputs']))})"
+            topic = "0x" + event_signature_to_log_topic(signature).hex()
+            lines.append(f"    # {signature}")
+            lines.append(f'    {constant}_TOPIC = "{topic}"')
+        for constant, _, entry in functions:
+            inputs = self._types(entry["inputs"])
+            signature = f"{entry['name']}({','.join(inputs)})"
+            selector = function_signature_to_4byte_selector(signature).hex()
+            lines.extend(
+                [
+                    f"    {constant} = AbiFunction(",
+                    f'        "{entry["name"]}",',
+                    f"        {json.dumps(inputs)},",
+                    f"        {json.dumps(self._types(entry.get('outputs', [])))},",
+                    f'        bytes.fromhex("{selector}"),',
+                    "    )",
+                ]
+            )
+        lines.extend(
+            [
+                "",
+                "    def __init__(self, transaction_executor: TransactionExecutor, "
+                "address: str):",
+                "        self._transaction_executor = transaction_executor",
+                "        self._address = address",
+                "",
+                "    def address(self) -> str:",
+                "        return self._address",
+            ]
+        )
+        for constant, method, entry in functions:
+            lines.extend(self._method(constant, method, entry))
+        return "\n".join(lines) + "\n"
+
+    def _events(self):
+        """(constant prefix, ABI entry); overloads get _2, _3, ... suffixes."""
+        events = []
+        seen: Dict[str, int] = {}
+        for entry in self._entries("event"):
+            constant = self._snake(entry["name"]).upper()
+            seen[constant] = seen.get(constant, 0) + 1
+            if seen[constant] > 1:
+                constant = f"{constant}_{seen[constant]}"
+            events.append((constant, entry))
+        return events
+
+    def _functions(self):
+        """(constant, method name, ABI entry); overloads get _2, _3, ... suffixes."""
+        functions = []
+        seen: Dict[str, int] = {}
+        for entry in self._entries("function"):
+            method = self._snake(entry["name"])
+            seen[method] = seen.get(method, 0) + 1
+            if seen[method] > 1:
+                method = f"{method}_{seen[method]}"
+            if method in self.RESERVED_NAMES:
+                method += "_"
+            functions.append((method.upper().strip("_"), method, entry))
+        return functions
+
+    def _method(self, constant: str, method: str, entry: Dict) -> List[str]:
+        names = self._argument_names(entry["inputs"])
+        parameters = "".join(
+            f", {name}: {self._python_type(param)}"
+            for name, param in zip(names, entry["inputs"])
+        )
+        arguments = "".join(f", {name}" for name in names)
+        if self._is_view(entry):
+            return [
+                "",
+                f"    def {method}(self{parameters}, block_identifier=None)"
+                f" -> {self._return_type(entry.get('outputs', []))}:",
+                f"        return self.{constant}.call(self._address{arguments}).read(",
+                "            self._transaction_executor, block_identifier",
+                "        )",
+            ]
+        encoded = f"self.{constant}.encode({arguments.removeprefix(', ')})"
+        return [
+            "",
+            f"    def {method}(self{parameters}) -> TxReceipt:",
+            "        return self._transaction_executor.execute(",
+            f"            self._address, {encoded}",
+            "        )",
+            "",
+            f"    def submit_{method}(self{parameters}) -> TransactionHandle:",
+            "        return self._transaction_executor.submit(",
+            f"            self._address, {encoded}",
+            "        )",
+        ]
+
+    @staticmethod
+    def _is_view(entry: Dict) -> bool:
+        return entry.get("stateMutability") in {"view", "pure"} or entry.get(
+            "constant", False
+        )
+
+    def _entries(self, entry_type: str) -> List[Dict]:
+        return [entry for entry in self._abi if entry.get("type") == entry_type]
+
+    def _types(self, params: List[Dict]) -> List[str]:
+        return [self._canonical_type(param) for param in params]
+
+    def _canonical_type(self, param: Dict) -> str:
+        type_str = param["type"]
+        if type_str.startswith("tuple"):
+            components = ",".join(self._types(param["components"]))
+            return f"({components}){type_str[len('tuple'):]}"
+        return type_str
+
+    def _python_type(self, param: Dict) -> str:
+        type_str = param["type"]
+        if type_str.endswith("]"):
+            return "list"
+        if type_str.startswith("tuple"):
+            return "tuple"
+        if type_str.startswith(("uint", "int")):
+            return "int"
+        if type_str.startswith("bytes"):
+            return "bytes"
+        return self.PYTHON_TYPES.get(type_str, "object")
+
+    def _return_type(self, outputs: List[Dict]) -> str:
+        if not outputs:
+            return "None"
+        if len(outputs) == 1:
+            return self._python_type(outputs[0])
+        return "tuple"
+
+    def _argument_names(self, params: List[Dict]) -> List[str]:
+        names = []
+        for index, param in enumerate(params):
+            name = self._snake(param.get("name") or f"arg{index}")
+            if keyword.iskeyword(name) or name in {"self", "block_identifier"}:
+                name = f"_{name}"
+            names.append(name)
+        return names
+
+    @staticmethod
+    def _snake(name: str) -> str:
+        name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name.lstrip("_"))
+        return name.lower()
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in {2, 3}:
+        sys.exit("usage: BindingGenerator <ClassName> <abi.json> [output.py]")
+    source = BindingGenerator.from_artifact(argv[0], argv[1]).generate()
+    if len(argv) == 3:
+        with open(argv[2], "w", encoding="utf-8") as file:
+            file.write(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,32 @@
+from typing import Optional
+
 from eth_account import Account
 from web3 import Web3
 
 from ipor_fusion.CheatingTransactionExecutor import CheatingTransactionExecutor
+from ipor_fusion.EventStore import EventStore
 from ipor_fusion.PlasmaVaultSystemFactoryBase import PlasmaVaultSystemFactoryBase
+from ipor_fusion.ProviderFactory import ProviderFactory, ProviderSpec
+from ipor_fusion.VaultMetadataCache import VaultMetadataCache
 
 
 class CheatingPlasmaVaultSystemFactory(PlasmaVaultSystemFactoryBase):
 
-    def __init__(self, provider_url: str, private_key: str):
+    def __init__(
+        self,
+        provider_url: ProviderSpec,
+        private_key: str,
+        event_store_path: Optional[str] = None,
+        metadata_cache_path: Optional[str] = None,
+    ):
         # pylint: disable=no-value-for-parameter
         account = Account.from_key(private_key=private_key)
-        web3 = Web3(Web3.HTTPProvider(provider_url))
-        transaction_executor = CheatingTransactionExecutor(web3, account)
-        super().__init__(transaction_executor)
+        web3 = Web3(ProviderFactory.create(provider_url))
+        event_store = EventStore(event_store_path) if event_store_path else None
+        transaction_executor = CheatingTransactionExecutor(
+            web3, account, event_store=event_store
+        )
+        metadata_cache = (
+            VaultMetadataCache(metadata_cache_path) if metadata_cache_path else None
+        )
+        super().__init__(transaction_executor, metadata_cache)
@@ -1,7 +1,8 @@
 from eth_abi import encode, decode
-from eth_utils import function_signature_to_4byte_selector
 
+from ipor_fusion.Selectors import Selectors
 from ipor_fusion.TransactionExecutor import TransactionExecutor
+from ipor_fusion.TransactionHandle import TransactionHandle
 
 
 class ERC20:
@@ -14,28 +15,38 @@ class ERC20:
         return self._asset_address
 
     def transfer(self, to: str, amount: int):
-        sig = function_signature_to_4byte_selector("transfer(address,uint256)")
+        sig = Selectors.TRANSFER
         encoded_args = encode(["address", "uint256"], [to, amount])
         return self._transaction_executor.execute(
             self._asset_address, sig + encoded_args
         )
 
     def approve(self, spender: str, amount: int):
-        sig = function_signature_to_4byte_selector("approve(address,uint256)")
-        encoded_args = encode(["address", "uint256"], [spender, amount])
-        return self._transaction_executor.execute(
-            self._asset_address, sig + encoded_args
-        )
+        function = self.__approve(spender, amount)
+        return self._transaction_executor.execute(self._asset_address, function)
+
+    def submit_approve(self, spender: str, amount: int) -> TransactionHandle:
+        function = self.__approve(spender, amount)
+        return self._transaction_executor.submit(self._asset_address, function)
 
-    def balance_of(self, account: str) -> int:
-        sig = function_signature_to_4byte_selector("balanceOf(address)")
+    @staticmethod
+    def __approve(spender: str, amount: int) -> bytes:
+        sig = Selectors.APPROVE
+        return sig + encode(["address", "uint256"], [spender, amount])
+
+    def balance_of(self, account: str, block_identifier=None) -> int:
+        sig = Selectors.BALANCE_OF
         encoded_args = encode(["address"], [account])
-        read = self._transaction_executor.read(self._asset_address, sig + encoded_args)
+        read = self._transaction_executor.read(
+            self._asset_address, sig + encoded_args, block_identifier
+        )
         (result,) = decode(["uint256"], read)
         return result
 
-    def decimals(self) -> int:
-        decimals = function_signature_to_4byte_selector("decimals()")
-        read = self._transaction_executor.read(self._asset_address, decimals)
+    def decimals(self, block_identifier=None) -> int:
+        decimals = Selectors.DECIMALS
+        read = self._transaction_executor.read(
+            self._asset_address, decimals, block_identifier
+        )
         (result,) = decode(["uint256"], read)
         return result
@@ -0,0 +1,95 @@
+import json
+import sqlite3
+import threading
+from typing import List, Optional
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3.types import LogReceipt
+
+
+class EventStore:
+    """
+    On-disk (SQLite) store of contract logs keyed by (chain id, contract, topic0). It
+    remembers the last block synced for every key, so only the delta since then has to
+    be fetched. Only blocks at least `confirmations` deep are persisted, the tail above
+    them is always fetched again to stay safe from reorgs.
+    """
+
+    DEFAULT_CONFIRMATIONS = 64
+    _HEX_BYTES_FIELDS = ("blockHash", "data", "transactionHash")
+
+    def __init__(self, path: str, confirmations: int = DEFAULT_CONFIRMATIONS):
+        self._confirmations = confirmations
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "chain_id INTEGER, contract TEXT, topic0 TEXT, last_block INTEGER, "
+                "PRIMARY KEY (chain_id, contract, topic0))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS logs ("
+                "chain_id INTEGER, contract TEXT, topic0 TEXT, block_number INTEGER, "
+                "log_index INTEGER, log TEXT, "
+                "PRIMARY KEY (chain_id, contract, topic0, block_number, log_index))"
+            )
+
+    def confirmations(self) -> int:
+        return self._confirmations
+
+    def last_synced_block(
+        self, chain_id: int, contract: str, topic0: str
+    ) -> Optional[int]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_block FROM sync_state "
+                "WHERE chain_id = ? AND contract = ? AND topic0 = ?",
+                (chain_id, contract.lower(), topic0.lower()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def load(self, chain_id: int, contract: str, topic0: str) -> List[LogReceipt]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT log FROM logs WHERE chain_id = ? AND contract = ? AND topic0 = ? "
+                "ORDER BY block_number, log_index",
+                (chain_id, contract.lower(), topic0.lower()),
+            ).fetchall()
+        return [self._decode(row[0]) for row in rows]
+
+    def store(
+        self,
+        chain_id: int,
+        contract: str,
+        topic0: str,
+        logs: List[LogReceipt],
+        synced_to_block: int,
+    ):
+        key = (chain_id, contract.lower(), topic0.lower())
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    key + (log["blockNumber"], log["logIndex"], Web3.to_json(log))
+                    for log in logs
+                ],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)",
+                key + (synced_to_block,),
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _decode(self, raw: str) -> LogReceipt:
+        log = json.loads(raw)
+        for field in self._HEX_BYTES_FIELDS:
+            if field in log:
+                log[field] = HexBytes(log[field])
+        log["topics"] = [HexBytes(topic) for topic in log["topics"]]
+        return AttributeDict(log)
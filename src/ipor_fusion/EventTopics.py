@@ -0,0 +1,19 @@
+from eth_utils import event_signature_to_log_topic
+from hexbytes import HexBytes
+
+
+def _topic(signature: str) -> str:
+    return HexBytes(event_signature_to_log_topic(signature)).to_0x_hex()
+
+
+class EventTopics:
+    """Event topics (topic0) used in log queries, hashed once at import."""
+
+    ROLE_GRANTED = _topic("RoleGranted(uint64,address,uint32,uint48,bool)")
+    AUTHORITY_UPDATED = _topic("AuthorityUpdated(address)")
+    WITHDRAW_MANAGER_CHANGED = _topic("WithdrawManagerChanged(address)")
+    REWARDS_CLAIM_MANAGER_ADDRESS_CHANGED = _topic(
+        "RewardsClaimManagerAddressChanged(address)"
+    )
+    FUSE_ADDED = _topic("FuseAdded(address)")
+    FUSE_REMOVED = _topic("FuseRemoved(address)")
@@ -32,9 +32,14 @@ class ExternalSystemsDataProvider:
         self._chain_id = chain_id
 
     def get(self) -> ExternalSystemsData:
+        return self.for_chain(self._chain_id)
+
+    @classmethod
+    def for_chain(cls, chain_id: int) -> ExternalSystemsData:
+        """The addresses are known per chain, reading them needs no executor."""
         return ExternalSystemsData(
-            usdc_address=self._USDC.get(self._chain_id),
-            usdt_address=self._USDT.get(self._chain_id),
-            weth_address=self._WETH.get(self._chain_id),
-            dai_address=self._DAI.get(self._chain_id),
+            usdc_address=cls._USDC.get(chain_id),
+            usdt_address=cls._USDT.get(chain_id),
+            weth_address=cls._WETH.get(chain_id),
+            dai_address=cls._DAI.get(chain_id),
         )
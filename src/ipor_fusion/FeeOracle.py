@@ -0,0 +1,132 @@
+import threading
+import time
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+from hexbytes import HexBytes
+from web3.types import TxReceipt
+
+
+class FeeOracle:
+    """
+    EIP-1559 fees for a target inclusion latency in blocks, from eth_feeHistory. The
+    priority fee is the median over recent blocks of a reward percentile chosen by the
+    target (higher for NEXT_BLOCK), the max fee covers the base fee rising 12.5% for
+    every block of the target. Inclusion times of tracked transactions are fed back:
+    a target that was missed raises the priority fee for it, one that was met lowers
+    it back. A fee history is reused until a newer head is observed or it is older
+    than `max_age` seconds.
+    """
+
+    NEXT_BLOCK = 1
+    WITHIN_3_BLOCKS = 3
+    PERCENTILES = [25, 50, 75]
+    DEFAULT_BLOCK_COUNT = 20
+    BASE_FEE_GROWTH = 1.125
+    MAX_BOOST = 4.0
+    BOOST_UP = 1.25
+    BOOST_DOWN = 0.95
+    DEFAULT_MAX_AGE = 12.0
+    MAX_TRACKED = 1024
+
+    def __init__(
+        self,
+        target_blocks: int = WITHIN_3_BLOCKS,
+        block_count: int = DEFAULT_BLOCK_COUNT,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        self._target_blocks = target_blocks
+        self._block_count = block_count
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._head: Optional[int] = None
+        self._observed_head: Optional[int] = None
+        self._updated_at = 0.0
+        self._next_base_fee: Optional[int] = None
+        self._rewards: List[int] = []
+        self._boosts: Dict[int, float] = {}
+        self._tracked: Dict[HexBytes, Tuple[int, int]] = {}
+
+    def request_params(self) -> list:
+        return [hex(self._block_count), "latest", self.PERCENTILES]
+
+    def update(self, fee_history: dict):
+        """Takes a raw eth_feeHistory result and caches its reward percentiles."""
+        base_fees = [int(fee, 16) for fee in fee_history["baseFeePerGas"]]
+        block_rewards = [
+            [int(reward, 16) for reward in rewards]
+            for rewards in fee_history.get("reward") or []
+        ]
+        rewards = []
+        for index in range(len(self.PERCENTILES)):
+            # Empty blocks report zero rewards, they say nothing about competition
+            samples = [r[index] for r in block_rewards if len(r) > index and r[index]]
+            rewards.append(int(median(samples)) if samples else 0)
+        with self._lock:
+            self._head = int(fee_history["oldestBlock"], 16) + len(base_fees) - 2
+            # The last base fee is the one of the block after the newest
+            self._next_base_fee = base_fees[-1]
+            self._rewards = rewards
+            self._updated_at = time.monotonic()
+
+    def observe_block(self, block_number: int):
+        with self._lock:
+            if self._observed_head is None or block_number > self._observed_head:
+                self._observed_head = block_number
+
+    def is_fresh(self) -> bool:
+        """Whether the last fee history still covers the newest observed head."""
+        with self._lock:
+            if self._head is None:
+                return False
+            if self._observed_head is not None and self._observed_head > self._head:
+                return False
+            return time.monotonic() - self._updated_at < self._max_age
+
+    def fees(self, target_blocks: Optional[int] = None) -> Tuple[int, int]:
+        """(maxFeePerGas, maxPriorityFeePerGas) for the target inclusion latency."""
+        target_blocks = target_blocks or self._target_blocks
+        with self._lock:
+            if self._next_base_fee is None:
+                raise ValueError("No fee history, call update first")
+            if target_blocks <= self.NEXT_BLOCK:
+                index = 2
+            elif target_blocks <= self.WITHIN_3_BLOCKS:
+                index = 1
+            else:
+                index = 0
+            boost = self._boosts.get(target_blocks, 1.0)
+            priority_fee = int(self._rewards[index] * boost)
+            max_fee = int(
+                self._next_base_fee * self.BASE_FEE_GROWTH**target_blocks + priority_fee
+            )
+            return max_fee, priority_fee
+
+    def track(self, tx_hash, target_blocks: Optional[int] = None):
+        """Remembers when a transaction was sent, to learn from its inclusion time."""
+        with self._lock:
+            if self._head is not None:
+                if len(self._tracked) >= self.MAX_TRACKED:
+                    # Never mined nor forgotten, e.g. dropped from the mempool
+                    del self._tracked[next(iter(self._tracked))]
+                self._tracked[HexBytes(tx_hash)] = (
+                    self._head,
+                    target_blocks or self._target_blocks,
+                )
+
+    def observe_receipt(self, receipt: TxReceipt):
+        with self._lock:
+            tracked = self._tracked.pop(HexBytes(receipt["transactionHash"]), None)
+            if tracked is None:
+                return
+            sent_at, target_blocks = tracked
+            boost = self._boosts.get(target_blocks, 1.0)
+            if receipt["blockNumber"] - sent_at > target_blocks:
+                boost = min(boost * self.BOOST_UP, self.MAX_BOOST)
+            else:
+                boost = max(boost * self.BOOST_DOWN, 1.0)
+            self._boosts[target_blocks] = boost
+
+    def forget(self, tx_hash):
+        with self._lock:
+            self._tracked.pop(HexBytes(tx_hash), None)
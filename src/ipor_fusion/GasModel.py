@@ -0,0 +1,77 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional, Tuple
+
+from eth_abi import decode
+
+from ipor_fusion.Selectors import Selectors
+
+
+class GasModel:
+    """
+    Learns gas limits per call shape so routine transactions can skip eth_estimateGas.
+    The shape is (target, selector, fuse list, calldata size bucket); the fuse list is
+    read from PlasmaVault.execute((address,bytes)[]) calldata. Samples come from node
+    estimates only: receipt gasUsed is net of refunds, below what the call needs. Once
+    a shape has enough samples with a small spread, the largest one (times the margin)
+    is used as the gas limit.
+    """
+
+    EXECUTE_SELECTOR = Selectors.EXECUTE
+    DEFAULT_MIN_SAMPLES = 3
+    DEFAULT_MAX_SPREAD = 0.1
+    DEFAULT_MARGIN = 1.25
+    SAMPLES = 16
+    SIZE_BUCKET = 256
+
+    def __init__(
+        self,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        max_spread: float = DEFAULT_MAX_SPREAD,
+        margin: float = DEFAULT_MARGIN,
+    ):
+        self._min_samples = min_samples
+        self._max_spread = max_spread
+        self._margin = margin
+        self._lock = threading.Lock()
+        self._samples: Dict[Hashable, Deque[int]] = {}
+
+    def predict(self, contract_address: str, data: bytes) -> Optional[int]:
+        """Gas limit for a confident shape, None if the node has to estimate."""
+        key = self.shape(contract_address, data)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < self._min_samples:
+                return None
+            highest = max(samples)
+            if (highest - min(samples)) > self._max_spread * highest:
+                return None
+            return int(highest * self._margin)
+
+    def record(self, contract_address: str, data: bytes, gas: int):
+        key = self.shape(contract_address, data)
+        with self._lock:
+            samples = self._samples.setdefault(key, deque(maxlen=self.SAMPLES))
+            samples.append(gas)
+
+    def forget(self, contract_address: str, data: bytes):
+        """Drop a shape, e.g. after a transaction ran out of gas with its prediction."""
+        with self._lock:
+            self._samples.pop(self.shape(contract_address, data), None)
+
+    def shape(self, contract_address: str, data: bytes) -> Tuple:
+        data = bytes(data)
+        selector = data[:4]
+        fuses = ()
+        if selector == self.EXECUTE_SELECTOR:
+            try:
+                (actions,) = decode(["(address,bytes)[]"], data[4:])
+                fuses = tuple(fuse.lower() for fuse, _ in actions)
+            except Exception:  # pylint: disable=broad-exception-caught
+                fuses = ()
+        return (
+            contract_address.lower(),
+            selector,
+            fuses,
+            len(data) // self.SIZE_BUCKET,
+        )
@@ -0,0 +1,106 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from hexbytes import HexBytes
+
+
+class ImmutableReadCache:
+    """
+    eth_call results at finalized blocks, addressed by a hash of (chain id, block,
+    contract, calldata). Such results can never change, so entries need no
+    invalidation. A bounded in-memory LRU sits in front of an optional SQLite file
+    that survives restarts.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10_000
+    FINALIZED_REFRESH = 12.0
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[str] = None
+    ):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, HexBytes]" = OrderedDict()
+        self._finalized_block = -1
+        self._finalized_checked_at = 0.0
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS reads (key TEXT PRIMARY KEY, result BLOB)"
+                )
+
+    def is_final(self, block_identifier, fetch_finalized: Callable[[], int]) -> bool:
+        """
+        Block hashes and numbers at or below the finalized head never change. Nodes
+        without the "finalized" tag make every numbered read uncacheable.
+        """
+        if isinstance(block_identifier, bytes) or (
+            isinstance(block_identifier, str) and len(block_identifier) == 66
+        ):
+            return True
+        if not isinstance(block_identifier, int):
+            return False
+        if block_identifier > self._finalized_block and (
+            time.monotonic() - self._finalized_checked_at > self.FINALIZED_REFRESH
+        ):
+            self._finalized_checked_at = time.monotonic()
+            try:
+                self._finalized_block = fetch_finalized()
+            except Exception:  # pylint: disable=broad-exception-caught
+                return False
+        return block_identifier <= self._finalized_block
+
+    @staticmethod
+    def key(chain_id: int, block, contract: str, data) -> str:
+        digest = hashlib.sha256()
+        digest.update(str(chain_id).encode())
+        digest.update(str(block).encode())
+        digest.update(HexBytes(contract))
+        digest.update(HexBytes(data))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[HexBytes]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                return result
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT result FROM reads WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            result = HexBytes(row[0])
+            self._remember(key, result)
+            return result
+
+    def put(self, key: str, result):
+        result = HexBytes(result)
+        with self._lock:
+            self._remember(key, result)
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO reads VALUES (?, ?)",
+                        (key, bytes(result)),
+                    )
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: str, result: HexBytes):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
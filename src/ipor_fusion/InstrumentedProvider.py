@@ -0,0 +1,52 @@
+import time
+from typing import Any, List, Tuple
+
+from web3.providers import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from ipor_fusion.RpcMetrics import RpcMetrics
+
+
+class InstrumentedProvider(JSONBaseProvider):
+    """
+    Wraps a provider and records every JSON-RPC request into RpcMetrics. Requests of
+    a batch are each recorded with the latency of the whole batch.
+    """
+
+    def __init__(self, provider: JSONBaseProvider, metrics: RpcMetrics):
+        super().__init__()
+        self._provider = provider
+        self._metrics = metrics
+
+    def __str__(self) -> str:
+        return f"InstrumentedProvider({self._provider})"
+
+    def provider(self) -> JSONBaseProvider:
+        return self._provider
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        with self._metrics.measure(RpcMetrics.RPC, (method,)):
+            return self._provider.make_request(method, params)
+
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        start = time.perf_counter()
+        error = False
+        try:
+            return self._provider.make_batch_request(requests)
+        except NotImplementedError:
+            # Not sent at all, the caller falls back to single requests
+            start = None
+            raise
+        except Exception:
+            error = True
+            raise
+        finally:
+            if start is not None:
+                seconds = time.perf_counter() - start
+                for method, _ in requests:
+                    self._metrics.observe(RpcMetrics.RPC, (method,), seconds, error)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return self._provider.is_connected(show_traceback)
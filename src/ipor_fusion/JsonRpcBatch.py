@@ -0,0 +1,75 @@
+from typing import Any, List, Tuple
+
+from web3.exceptions import ContractLogicError, Web3RPCError
+from web3.types import RPCEndpoint, RPCResponse
+
+
+class JsonRpcBatch:
+    """
+    Sends independent JSON-RPC requests as a single batch array and returns the raw
+    results in the order they were added. Providers without batch support get the
+    requests one by one.
+    """
+
+    def __init__(self, web3):
+        self._provider = web3.provider
+        self._requests: List[Tuple[RPCEndpoint, Any]] = []
+
+    def add(self, method: str, params: List[Any]) -> int:
+        self._requests.append((RPCEndpoint(method), params))
+        return len(self._requests) - 1
+
+    def execute(self) -> List[Any]:
+        requests, self._requests = self._requests, []
+        responses = self._make_batch_request(requests)
+        return [
+            self.result(method, response)
+            for (method, _), response in zip(requests, responses)
+        ]
+
+    async def async_execute(self) -> List[Any]:
+        """Same as execute, for the async providers used by AsyncWeb3."""
+        requests, self._requests = self._requests, []
+        responses = await self._async_make_batch_request(requests)
+        return [
+            self.result(method, response)
+            for (method, _), response in zip(requests, responses)
+        ]
+
+    def _make_batch_request(self, requests) -> List[RPCResponse]:
+        if len(requests) > 1:
+            try:
+                responses = self._provider.make_batch_request(requests)
+                # A provider rejecting batches answers with a single error object
+                if isinstance(responses, list) and len(responses) == len(requests):
+                    return responses
+            except NotImplementedError:
+                pass
+        return [
+            self._provider.make_request(method, params) for method, params in requests
+        ]
+
+    async def _async_make_batch_request(self, requests) -> List[RPCResponse]:
+        if len(requests) > 1:
+            try:
+                responses = await self._provider.make_batch_request(requests)
+                if isinstance(responses, list) and len(responses) == len(requests):
+                    return responses
+            except NotImplementedError:
+                pass
+        return [
+            await self._provider.make_request(method, params)
+            for method, params in requests
+        ]
+
+    @staticmethod
+    def result(method: str, response: RPCResponse) -> Any:
+        error = response.get("error")
+        if error is None:
+            return response["result"]
+        if not isinstance(error, dict):
+            error = {"message": str(error)}
+        message = error.get("message", "")
+        if method in {"eth_call", "eth_estimateGas"} and "revert" in message:
+            raise ContractLogicError(message, data=error.get("data"))
+        raise Web3RPCError(f"{method}: {message}", rpc_response=response)
@@ -0,0 +1,117 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+from web3.types import LogReceipt
+
+
+class LogFetcher:
+    """
+    eth_getLogs over a block range, by default asked for in a single request. A chunk
+    the provider rejects for returning too many results (or spanning too many blocks)
+    is halved and retried; later chunks start from the reduced size and grow back while
+    requests succeed. Chunks are fetched concurrently and logs yielded in block order.
+    `max_chunk_size` caps the chunk size for providers with a known range limit.
+    """
+
+    DEFAULT_MAX_CHUNK_SIZE = None
+    DEFAULT_MAX_WORKERS = 4
+    # Result and range limits only; rate limits ("too many requests", "limit
+    # exceeded") must not be answered with more, smaller requests
+    TOO_MANY_RESULTS_ERRORS = (
+        "query returned more than",
+        "too many results",
+        "too many logs",
+        "max results",
+        "response size",
+        "block range",
+        "range is too large",
+        "range too large",
+        "range is too wide",
+        "too many blocks",
+    )
+
+    def __init__(
+        self,
+        web3,
+        max_chunk_size: Optional[int] = DEFAULT_MAX_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self._web3 = web3
+        self._max_chunk_size = max_chunk_size
+        self._max_workers = max_workers
+
+    def get_logs(
+        self, contract_address: str, topics: List[str], from_block=0, to_block="latest"
+    ) -> List[LogReceipt]:
+        return list(self.iter_logs(contract_address, topics, from_block, to_block))
+
+    def iter_logs(
+        self, contract_address: str, topics: List[str], from_block=0, to_block="latest"
+    ) -> Iterator[LogReceipt]:
+        from_block = self._block_number(from_block)
+        to_block = self._block_number(to_block)
+        if from_block > to_block:
+            return
+        max_chunk_size = self._max_chunk_size or to_block - from_block + 1
+        chunk_size = max_chunk_size
+        next_start = from_block
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            inflight = deque()
+            try:
+                while next_start <= to_block or inflight:
+                    while next_start <= to_block and len(inflight) < self._max_workers:
+                        end = min(next_start + chunk_size - 1, to_block)
+                        inflight.append(
+                            self._submit(
+                                pool, contract_address, topics, next_start, end
+                            )
+                        )
+                        next_start = end + 1
+                    start, end, future = inflight.popleft()
+                    try:
+                        logs = future.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        if start == end or not self.is_too_many_results(e):
+                            raise
+                        middle = (start + end) // 2
+                        chunk_size = min(chunk_size, middle - start + 1)
+                        # Both halves go before the chunks already in flight to keep order
+                        inflight.appendleft(
+                            self._submit(
+                                pool, contract_address, topics, middle + 1, end
+                            )
+                        )
+                        inflight.appendleft(
+                            self._submit(pool, contract_address, topics, start, middle)
+                        )
+                        continue
+                    chunk_size = min(chunk_size * 2, max_chunk_size)
+                    yield from logs
+            finally:
+                for _, _, future in inflight:
+                    future.cancel()
+
+    @classmethod
+    def is_too_many_results(cls, error: Exception) -> bool:
+        message = str(error).lower()
+        return any(pattern in message for pattern in cls.TOO_MANY_RESULTS_ERRORS)
+
+    def _submit(self, pool, contract_address, topics, start: int, end: int):
+        future = pool.submit(
+            self._web3.eth.get_logs,
+            {
+                "fromBlock": start,
+                "toBlock": end,
+                "address": contract_address,
+                "topics": topics,
+            },
+        )
+        return start, end, future
+
+    def _block_number(self, block_identifier) -> int:
+        if isinstance(block_identifier, int):
+            return block_identifier
+        if block_identifier == "latest":
+            return self._web3.eth.block_number
+        return self._web3.eth.get_block(block_identifier)["number"]
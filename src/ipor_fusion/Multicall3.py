@@ -0,0 +1,44 @@
+from typing import List, Tuple
+
+from eth_abi import encode, decode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from ipor_fusion.Selectors import Selectors
+
+
+class Multicall3:
+    """Thin client of the canonical Multicall3 contract (same address on every EVM chain)."""
+
+    MULTICALL3_ADDRESS = Web3.to_checksum_address(
+        "0xcA11bde05977b3631167028862bE2a173976CA11"
+    )
+
+    def __init__(self, web3, multicall_address: str = MULTICALL3_ADDRESS):
+        self._web3 = web3
+        self._multicall_address = multicall_address
+
+    def address(self) -> str:
+        return self._multicall_address
+
+    def aggregate3(
+        self, calls: List[Tuple[str, bytes]], block_identifier=None
+    ) -> List[Tuple[bool, bytes]]:
+        function = self.__aggregate3(calls)
+        read = self._web3.eth.call(
+            {"to": self._multicall_address, "data": function}, block_identifier
+        )
+        (results,) = decode(["(bool,bytes)[]"], read)
+        return results
+
+    def call(self, contract: str, data: bytes, block_identifier=None) -> HexBytes:
+        return self._web3.eth.call({"to": contract, "data": data}, block_identifier)
+
+    @staticmethod
+    def __aggregate3(calls: List[Tuple[str, bytes]]) -> bytes:
+        allow_failure = True
+        bytes_data = []
+        for contract, data in calls:
+            bytes_data.append([contract, allow_failure, bytes(data)])
+        encoded_arguments = encode(["(address,bool,bytes)[]"], [bytes_data])
+        return Selectors.AGGREGATE3 + encoded_arguments
@@ -0,0 +1,57 @@
+import threading
+from typing import Dict
+
+
+class NonceManager:
+    """
+    Hands out consecutive nonces per sender from a local counter so transactions can be
+    pipelined without querying eth_getTransactionCount before every send. The counter
+    is resynced from the node's pending nonce when a send fails or a gap is detected.
+    """
+
+    NONCE_ERRORS = ("nonce too low", "nonce too high")
+    ALREADY_KNOWN_ERRORS = ("already known", "known transaction")
+
+    def __init__(self, web3):
+        self._web3 = web3
+        self._lock = threading.Lock()
+        self._next_nonces: Dict[str, int] = {}
+
+    def next_nonce(self, address: str) -> int:
+        with self._lock:
+            nonce = self._next_nonces.get(address)
+            if nonce is None:
+                nonce = self._web3.eth.get_transaction_count(address, "pending")
+            self._next_nonces[address] = nonce + 1
+            return nonce
+
+    def reserve(self, address: str, count: int) -> range:
+        """Consecutive nonces for a bulk of transactions signed up front."""
+        with self._lock:
+            nonce = self._next_nonces.get(address)
+            if nonce is None:
+                nonce = self._web3.eth.get_transaction_count(address, "pending")
+            self._next_nonces[address] = nonce + count
+            return range(nonce, nonce + count)
+
+    def release(self, address: str, nonce: int):
+        """Give back a nonce whose transaction was never broadcast."""
+        with self._lock:
+            if self._next_nonces.get(address) == nonce + 1:
+                self._next_nonces[address] = nonce
+            else:
+                # Later nonces are already in flight, the chain has to tell us where to go on
+                self._next_nonces.pop(address, None)
+
+    def resync(self, address: str):
+        with self._lock:
+            self._next_nonces.pop(address, None)
+
+    def is_nonce_error(self, error: Exception) -> bool:
+        message = str(error).lower()
+        return any(nonce_error in message for nonce_error in self.NONCE_ERRORS)
+
+    def is_already_known(self, error: Exception) -> bool:
+        """The node already holds this exact signed transaction in its mempool."""
+        message = str(error).lower()
+        return any(known in message for known in self.ALREADY_KNOWN_ERRORS)
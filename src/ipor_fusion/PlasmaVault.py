@@ -1,15 +1,31 @@
-from typing import List, Union
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Union
 
 from eth_abi import encode, decode
-from eth_utils import function_signature_to_4byte_selector
-from hexbytes import HexBytes
-from web3 import Web3
+from web3.exceptions import ContractLogicError
 from web3.types import TxReceipt, LogReceipt
 
+from ipor_fusion.ERC20 import ERC20
+from ipor_fusion.EventTopics import EventTopics
+from ipor_fusion.Selectors import Selectors
 from ipor_fusion.TransactionExecutor import TransactionExecutor
+from ipor_fusion.TransactionHandle import TransactionHandle
 from ipor_fusion.fuse.FuseAction import FuseAction
 
 
+@dataclass(frozen=True)
+class PlasmaVaultSnapshot:
+    block_number: int
+    total_assets: int
+    total_assets_in_market: Mapping[int, int]
+    underlying_asset_address: str
+    underlying_balance: int
+    decimals: int
+    assets_per_share: int
+
+
+# pylint: disable=too-many-public-methods
 class PlasmaVault:
 
     def __init__(
@@ -17,6 +33,7 @@ class PlasmaVault:
     ):
         self._transaction_executor = transaction_executor
         self._plasma_vault_address = plasma_vault_address
+        self._fuse_market_ids: Dict[str, Optional[int]] = {}
 
     def address(self) -> str:
         return self._plasma_vault_address
@@ -25,6 +42,10 @@ class PlasmaVault:
         function = self.__execute(actions)
         return self._transaction_executor.execute(self._plasma_vault_address, function)
 
+    def submit(self, actions: List[FuseAction]) -> TransactionHandle:
+        function = self.__execute(actions)
+        return self._transaction_executor.submit(self._plasma_vault_address, function)
+
     def prepare_transaction(self, actions: List[FuseAction]) -> TxReceipt:
         function = self.__execute(actions)
         return self._transaction_executor.prepare_transaction(
@@ -36,14 +57,14 @@ class PlasmaVault:
         return self._transaction_executor.execute(self._plasma_vault_address, function)
 
     def mint(self, shares: int, receiver: str) -> TxReceipt:
-        sig = function_signature_to_4byte_selector("mint(uint256,address)")
+        sig = Selectors.MINT
         encoded_args = encode(["uint256", "address"], [shares, receiver])
         return self._transaction_executor.execute(
             self._plasma_vault_address, sig + encoded_args
         )
 
     def redeem(self, shares: int, receiver: str, owner: str) -> TxReceipt:
-        sig = function_signature_to_4byte_selector("redeem(uint256,address,address)")
+        sig = Selectors.REDEEM
         encoded_args = encode(
             ["uint256", "address", "address"], [shares, receiver, owner]
         )
@@ -51,110 +72,168 @@ class PlasmaVault:
             self._plasma_vault_address, sig + encoded_args
         )
 
-    def balance_of(self, account: str) -> int:
-        sig = function_signature_to_4byte_selector("balanceOf(address)")
+    def balance_of(self, account: str, block_identifier=None) -> int:
+        sig = Selectors.BALANCE_OF
         encoded_args = encode(["address"], [account])
         read = self._transaction_executor.read(
-            self._plasma_vault_address, sig + encoded_args
+            self._plasma_vault_address, sig + encoded_args, block_identifier
         )
         (result,) = decode(["uint256"], read)
         return result
 
-    def max_withdraw(self, account: str) -> int:
-        sig = function_signature_to_4byte_selector("maxWithdraw(address)")
+    def max_withdraw(self, account: str, block_identifier=None) -> int:
+        sig = Selectors.MAX_WITHDRAW
         encoded_args = encode(["address"], [account])
         read = self._transaction_executor.read(
-            self._plasma_vault_address, sig + encoded_args
+            self._plasma_vault_address, sig + encoded_args, block_identifier
         )
         (result,) = decode(["uint256"], read)
         return result
 
-    def total_assets_in_market(self, market: int) -> int:
-        sig = function_signature_to_4byte_selector("totalAssetsInMarket(uint256)")
+    def total_assets_in_market(self, market: int, block_identifier=None) -> int:
+        sig = Selectors.TOTAL_ASSETS_IN_MARKET
         encoded_args = encode(["uint256"], [market])
         read = self._transaction_executor.read(
-            self._plasma_vault_address, sig + encoded_args
+            self._plasma_vault_address, sig + encoded_args, block_identifier
         )
         (result,) = decode(["uint256"], read)
         return result
 
-    def decimals(self) -> int:
-        sig = function_signature_to_4byte_selector("decimals()")
-        read = self._transaction_executor.read(self._plasma_vault_address, sig)
+    def decimals(self, block_identifier=None) -> int:
+        sig = Selectors.DECIMALS
+        read = self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
         (result,) = decode(["uint256"], read)
         return result
 
-    def total_assets(self) -> int:
-        sig = function_signature_to_4byte_selector("totalAssets()")
-        read = self._transaction_executor.read(self._plasma_vault_address, sig)
+    def total_assets(self, block_identifier=None) -> int:
+        sig = Selectors.TOTAL_ASSETS
+        read = self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
         (result,) = decode(["uint256"], read)
         return result
 
-    def underlying_asset_address(self) -> str:
-        sig = function_signature_to_4byte_selector("asset()")
-        read = self._transaction_executor.read(self._plasma_vault_address, sig)
+    def underlying_asset_address(self, block_identifier=None) -> str:
+        sig = Selectors.ASSET
+        read = self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
         (result,) = decode(["address"], read)
         return result
 
-    def convert_to_assets(self, amount: int) -> int:
-        sig = function_signature_to_4byte_selector("convertToAssets(uint256)")
+    def convert_to_assets(self, amount: int, block_identifier=None) -> int:
+        sig = Selectors.CONVERT_TO_ASSETS
         encoded_args = encode(["uint256"], [amount])
         read = self._transaction_executor.read(
-            self._plasma_vault_address, sig + encoded_args
+            self._plasma_vault_address, sig + encoded_args, block_identifier
         )
         (result,) = decode(["uint256"], read)
         return result
 
-    def get_access_manager_address(self) -> str:
-        sig = function_signature_to_4byte_selector("getAccessManagerAddress()")
-        read = self._transaction_executor.read(self._plasma_vault_address, sig)
+    def get_access_manager_address(self, block_identifier=None) -> str:
+        sig = Selectors.GET_ACCESS_MANAGER_ADDRESS
+        read = self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
         (result,) = decode(["address"], read)
         return result
 
-    def get_rewards_claim_manager_address(self) -> str:
-        sig = function_signature_to_4byte_selector("getRewardsClaimManagerAddress()")
-        read = self._transaction_executor.read(self._plasma_vault_address, sig)
+    def get_rewards_claim_manager_address(self, block_identifier=None) -> str:
+        sig = Selectors.GET_REWARDS_CLAIM_MANAGER_ADDRESS
+        read = self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
         (result,) = decode(["address"], read)
         return result
 
-    def get_fuses(self) -> List[str]:
-        sig = function_signature_to_4byte_selector("getFuses()")
-        read = self._transaction_executor.read(self._plasma_vault_address, sig)
+    def get_fuses(self, block_identifier=None) -> List[str]:
+        sig = Selectors.GET_FUSES
+        read = self._transaction_executor.read(
+            self._plasma_vault_address, sig, block_identifier
+        )
         (result,) = decode(["address[]"], read)
         return result
 
-    def withdraw_manager_address(self) -> Union[str, None]:
-        events = self.get_withdraw_manager_changed_events()
-        sorted_events = sorted(
-            events, key=lambda event: event["blockNumber"], reverse=True
+    def snapshot(self, block="latest") -> PlasmaVaultSnapshot:
+        """
+        Vault state at one block, read with Multicall3: totals, assets in every market
+        of the vault's fuses, the vault's underlying balance and the share price.
+        """
+        executor = self._transaction_executor
+        block_number = executor.block_number(block)
+        with executor.batch(block_number) as batch:
+            total_assets = batch.submit(self.total_assets)
+            decimals = batch.submit(self.decimals)
+            asset = batch.submit(self.underlying_asset_address)
+            fuses = batch.submit(self.get_fuses)
+        market_ids = self._market_ids(fuses.result(), block_number)
+        underlying = ERC20(executor, asset.result())
+        with executor.batch(block_number) as batch:
+            in_markets = {
+                market_id: batch.submit(self.total_assets_in_market, market_id)
+                for market_id in market_ids
+            }
+            balance = batch.submit(underlying.balance_of, self._plasma_vault_address)
+            assets_per_share = batch.submit(
+                self.convert_to_assets, 10 ** decimals.result()
+            )
+        return PlasmaVaultSnapshot(
+            block_number=block_number,
+            total_assets=total_assets.result(),
+            total_assets_in_market=MappingProxyType(
+                {market_id: future.result() for market_id, future in in_markets.items()}
+            ),
+            underlying_asset_address=asset.result(),
+            underlying_balance=balance.result(),
+            decimals=decimals.result(),
+            assets_per_share=assets_per_share.result(),
         )
-        if sorted_events:
-            (decoded_address,) = decode(["address"], sorted_events[0]["data"])
+
+    def _market_ids(self, fuses: List[str], block_number: int) -> List[int]:
+        # A fuse's market never changes, so each one is asked only once
+        unknown = [fuse for fuse in fuses if fuse not in self._fuse_market_ids]
+        if unknown:
+            with self._transaction_executor.batch(block_number) as batch:
+                futures = {
+                    fuse: batch.submit(self._fuse_market_id, fuse) for fuse in unknown
+                }
+            for fuse, future in futures.items():
+                try:
+                    self._fuse_market_ids[fuse] = future.result()
+                except ContractLogicError:
+                    # Not a market fuse (e.g. a claim fuse)
+                    self._fuse_market_ids[fuse] = None
+        market_ids = {self._fuse_market_ids[fuse] for fuse in fuses}
+        return sorted(market_id for market_id in market_ids if market_id is not None)
+
+    def _fuse_market_id(self, fuse: str) -> int:
+        sig = Selectors.MARKET_ID
+        read = self._transaction_executor.read(fuse, sig)
+        (result,) = decode(["uint256"], read)
+        return result
+
+    def withdraw_manager_address(self) -> Union[str, None]:
+        # Logs come in block order, the last change wins
+        last_event = None
+        for event in self.iter_withdraw_manager_changed_events():
+            last_event = event
+        if last_event:
+            (decoded_address,) = decode(["address"], last_event["data"])
             return decoded_address
         return None
 
     @staticmethod
     def __execute(actions: List[FuseAction]) -> bytes:
-        bytes_data = []
-        for action in actions:
-            bytes_data.append([action.fuse, action.data])
-        bytes_ = "(address,bytes)[]"
-        encoded_arguments = encode([bytes_], [bytes_data])
-        return (
-            function_signature_to_4byte_selector("execute((address,bytes)[])")
-            + encoded_arguments
-        )
+        return Selectors.EXECUTE + FuseAction.encode_many(actions)
 
     @staticmethod
     def __deposit(assets: int, receiver: str) -> bytes:
-        args = ["uint256", "address"]
-        join = ",".join(args)
-        function_signature = f"deposit({join})"
-        selector = function_signature_to_4byte_selector(function_signature)
-        return selector + encode(args, [assets, receiver])
+        return Selectors.DEPOSIT + encode(["uint256", "address"], [assets, receiver])
 
     def withdraw(self, assets: int, receiver: str, owner: str) -> TxReceipt:
-        sig = function_signature_to_4byte_selector("withdraw(uint256,address,address)")
+        sig = Selectors.WITHDRAW
         encoded_args = encode(
             ["uint256", "address", "address"], [assets, receiver, owner]
         )
@@ -162,41 +241,39 @@ class PlasmaVault:
             self._plasma_vault_address, sig + encoded_args
         )
 
-    def get_market_substrates(self, market_id: int) -> bytes:
-        sig = function_signature_to_4byte_selector("getMarketSubstrates(uint256)")
+    def get_market_substrates(self, market_id: int, block_identifier=None) -> bytes:
+        sig = Selectors.GET_MARKET_SUBSTRATES
         encoded_args = encode(["uint256"], [market_id])
         return self._transaction_executor.read(
-            self._plasma_vault_address, sig + encoded_args
+            self._plasma_vault_address, sig + encoded_args, block_identifier
         )
 
     def transfer(self, to: str, value):
-        sig = function_signature_to_4byte_selector("transfer(address,uint256)")
+        sig = Selectors.TRANSFER
         encoded_args = encode(["address", "uint256"], [to, value])
         return self._transaction_executor.execute(
             self._plasma_vault_address, sig + encoded_args
         )
 
     def approve(self, account: str, amount: int):
-        sig = function_signature_to_4byte_selector("approve(address,uint256)")
+        sig = Selectors.APPROVE
         encoded_args = encode(["address", "uint256"], [account, amount])
         return self._transaction_executor.execute(
             self._plasma_vault_address, sig + encoded_args
         )
 
     def transfer_from(self, _from: str, to: str, amount: int):
-        sig = function_signature_to_4byte_selector(
-            "transferFrom(address,address,uint256)"
-        )
+        sig = Selectors.TRANSFER_FROM
         encoded_args = encode(["address", "address", "uint256"], [_from, to, amount])
         return self._transaction_executor.execute(
             self._plasma_vault_address, sig + encoded_args
         )
 
     def get_withdraw_manager_changed_events(self) -> List[LogReceipt]:
-        event_signature_hash = HexBytes(
-            Web3.keccak(text="WithdrawManagerChanged(address)")
-        ).to_0x_hex()
-        logs = self._transaction_executor.get_logs(
-            contract_address=self._plasma_vault_address, topics=[event_signature_hash]
+        return list(self.iter_withdraw_manager_changed_events())
+
+    def iter_withdraw_manager_changed_events(self) -> Iterator[LogReceipt]:
+        return self._transaction_executor.iter_logs(
+            contract_address=self._plasma_vault_address,
+            topics=[EventTopics.WITHDRAW_MANAGER_CHANGED],
         )
-        return logs
@@ -1,9 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import Optional
 
 from web3 import Web3
 
+from ipor_fusion.ERC20 import ERC20
+from ipor_fusion.EventTopics import EventTopics
 from ipor_fusion.PlasmaVault import PlasmaVault
 from ipor_fusion.TransactionExecutor import TransactionExecutor
+from ipor_fusion.VaultMetadataCache import VaultMetadataCache
 
 
 @dataclass
@@ -14,13 +18,67 @@ class PlasmaVaultData:
     asset_address: str
     rewards_claim_manager_address: str
     fuses: [str]
+    decimals: Optional[int] = None
+    asset_decimals: Optional[int] = None
 
 
 class PlasmaVaultDataReader:
-    def __init__(self, transaction_executor: TransactionExecutor):
+    """
+    Reads the addresses a PlasmaSystem is wired from. With a metadata cache, a cached
+    entry is reused as long as the vault emitted none of the CHANGE_EVENTS since the
+    block it was read at. That check asks for the whole range in one eth_getLogs; it is
+    only split when the provider rejects it, or when the executor caps log chunks.
+    """
+
+    CHANGE_EVENTS = [
+        EventTopics.FUSE_ADDED,
+        EventTopics.FUSE_REMOVED,
+        EventTopics.WITHDRAW_MANAGER_CHANGED,
+        EventTopics.REWARDS_CLAIM_MANAGER_ADDRESS_CHANGED,
+        EventTopics.AUTHORITY_UPDATED,
+    ]
+
+    def __init__(
+        self,
+        transaction_executor: TransactionExecutor,
+        metadata_cache: Optional[VaultMetadataCache] = None,
+    ):
         self._transaction_executor = transaction_executor
+        self._metadata_cache = metadata_cache
 
     def read(self, plasma_vault_address: str) -> PlasmaVaultData:
+        if self._metadata_cache is None:
+            return self._read(plasma_vault_address)
+        chain_id = self._transaction_executor.chain_id()
+        head = self._transaction_executor.block_number()
+        cached = self._metadata_cache.load_vault(chain_id, plasma_vault_address)
+        if cached is not None:
+            cached_block, data = cached
+            # A head behind the cached block (lagging node, reorg) proves nothing.
+            if cached_block == head or (
+                cached_block < head
+                and not self._changed_since(
+                    plasma_vault_address, cached_block + 1, head
+                )
+            ):
+                self._metadata_cache.store_vault(
+                    chain_id, plasma_vault_address, head, data
+                )
+                return PlasmaVaultData(**data)
+        plasma_vault_data = self._read(plasma_vault_address)
+        self._metadata_cache.store_vault(
+            chain_id, plasma_vault_address, head, asdict(plasma_vault_data)
+        )
+        return plasma_vault_data
+
+    def _changed_since(self, plasma_vault_address: str, from_block: int, to_block: int):
+        for _ in self._transaction_executor.iter_logs(
+            plasma_vault_address, [self.CHANGE_EVENTS], from_block, to_block
+        ):
+            return True
+        return False
+
+    def _read(self, plasma_vault_address: str) -> PlasmaVaultData:
         plasma_vault = PlasmaVault(self._transaction_executor, plasma_vault_address)
         access_manager_address = Web3.to_checksum_address(
             plasma_vault.get_access_manager_address()
@@ -39,7 +97,7 @@ class PlasmaVaultDataReader:
         )
         fuses = plasma_vault.get_fuses()
         checksum_fuses = [Web3.to_checksum_address(fuse) for fuse in fuses]
-        return PlasmaVaultData(
+        plasma_vault_data = PlasmaVaultData(
             plasma_vault_address=plasma_vault_address,
             access_manager_address=access_manager_address,
             withdraw_manager_address=withdraw_manager_address_checksum,
@@ -47,3 +105,14 @@ class PlasmaVaultDataReader:
             rewards_claim_manager_address=rewards_claim_manager_address,
             fuses=checksum_fuses,
         )
+        if self._metadata_cache is not None:
+            chain_id = self._transaction_executor.chain_id()
+            plasma_vault_data.decimals = self._metadata_cache.decimals(
+                chain_id, plasma_vault_address, plasma_vault.decimals
+            )
+            plasma_vault_data.asset_decimals = self._metadata_cache.decimals(
+                chain_id,
+                asset_address,
+                ERC20(self._transaction_executor, asset_address).decimals,
+            )
+        return plasma_vault_data
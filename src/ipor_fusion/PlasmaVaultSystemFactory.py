@@ -1,15 +1,38 @@
+from typing import Optional
+
 from eth_account import Account
 from web3 import Web3
 
+from ipor_fusion.EventStore import EventStore
 from ipor_fusion.PlasmaVaultSystemFactoryBase import PlasmaVaultSystemFactoryBase
+from ipor_fusion.ProviderFactory import ProviderFactory, ProviderSpec
+from ipor_fusion.RpcMetrics import RpcMetrics
 from ipor_fusion.TransactionExecutor import TransactionExecutor
+from ipor_fusion.VaultMetadataCache import VaultMetadataCache
 
 
 class PlasmaVaultSystemFactory(PlasmaVaultSystemFactoryBase):
 
-    def __init__(self, provider_url: str, private_key: str):
+    def __init__(
+        self,
+        provider_url: ProviderSpec,
+        private_key: str,
+        event_store_path: Optional[str] = None,
+        metadata_cache_path: Optional[str] = None,
+        hedge_reads: bool = False,
+        requests_per_second: Optional[float] = None,
+        metrics: Optional[RpcMetrics] = None,
+    ):
         # pylint: disable=no-value-for-parameter
         account = Account.from_key(private_key=private_key)
-        web3 = Web3(Web3.HTTPProvider(provider_url))
-        transaction_executor = TransactionExecutor(web3, account)
-        super().__init__(transaction_executor)
+        web3 = Web3(
+            ProviderFactory.create(provider_url, hedge_reads, requests_per_second)
+        )
+        event_store = EventStore(event_store_path) if event_store_path else None
+        transaction_executor = TransactionExecutor(
+            web3, account, event_store=event_store, metrics=metrics
+        )
+        metadata_cache = (
+            VaultMetadataCache(metadata_cache_path) if metadata_cache_path else None
+        )
+        super().__init__(transaction_executor, metadata_cache)
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from ipor_fusion.ExternalSystemsDataProvider import ExternalSystemsDataProvider
 from ipor_fusion.PlasmaSystem import PlasmaSystem
 from ipor_fusion.PlasmaVaultDataReader import PlasmaVaultDataReader
 from ipor_fusion.TransactionExecutor import TransactionExecutor
+from ipor_fusion.VaultMetadataCache import VaultMetadataCache
 
 
 class PlasmaVaultSystemFactoryBase:
@@ -9,11 +12,15 @@ class PlasmaVaultSystemFactoryBase:
     def __init__(
         self,
         transaction_executor: TransactionExecutor,
+        metadata_cache: Optional[VaultMetadataCache] = None,
     ):
         self._transaction_executor = transaction_executor
+        self._metadata_cache = metadata_cache
 
     def get(self, plasma_vault_address: str) -> PlasmaSystem:
-        plasma_vault_data_reader = PlasmaVaultDataReader(self._transaction_executor)
+        plasma_vault_data_reader = PlasmaVaultDataReader(
+            self._transaction_executor, self._metadata_cache
+        )
         plasma_vault_data = plasma_vault_data_reader.read(plasma_vault_address)
         chain_id = self._transaction_executor.chain_id()
         external_systems_data_provider = ExternalSystemsDataProvider(
@@ -0,0 +1,50 @@
+from typing import List, Optional, Union
+
+from web3 import IPCProvider, LegacyWebSocketProvider
+from web3.providers import BaseProvider
+
+from ipor_fusion.RoutingProvider import RoutingProvider
+from ipor_fusion.ScheduledProvider import ScheduledProvider
+from ipor_fusion.SessionRegistry import SessionRegistry
+
+ProviderSpec = Union[str, BaseProvider, List[Union[str, BaseProvider]]]
+
+
+class ProviderFactory:
+    """
+    Builds the synchronous web3 provider used by the system factories from a URI
+    (http(s)://, ws(s)://, ipc:// or a path to a .ipc socket), a pre-built provider,
+    or a list of either for multi-endpoint routing.
+    """
+
+    @staticmethod
+    def create(
+        provider: ProviderSpec,
+        hedge_reads: bool = False,
+        requests_per_second: Optional[float] = None,
+    ) -> BaseProvider:
+        specs = provider if isinstance(provider, list) else [provider]
+        providers = [ProviderFactory.from_uri(spec) for spec in specs]
+        if requests_per_second is not None:
+            providers = [
+                ScheduledProvider(provider, requests_per_second)
+                for provider in providers
+            ]
+        if len(providers) == 1:
+            return providers[0]
+        return RoutingProvider(providers, hedge=hedge_reads)
+
+    @staticmethod
+    def from_uri(uri: Union[str, BaseProvider]) -> BaseProvider:
+        if isinstance(uri, BaseProvider):
+            return uri
+        scheme = uri.split("://", 1)[0].lower() if "://" in uri else ""
+        if scheme in {"http", "https"}:
+            return SessionRegistry.http_provider(uri)
+        if scheme in {"ws", "wss"}:
+            return LegacyWebSocketProvider(uri)
+        if scheme == "ipc":
+            return IPCProvider(uri[len("ipc://") :])
+        if not scheme and uri.endswith(".ipc"):
+            return IPCProvider(uri)
+        raise ValueError(f"Unsupported provider URI: {uri}")
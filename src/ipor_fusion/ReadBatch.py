@@ -0,0 +1,214 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional
+
+from hexbytes import HexBytes
+from web3.exceptions import ContractLogicError
+
+from ipor_fusion.Multicall3 import Multicall3
+
+
+class _PendingRead:
+    def __init__(self, contract: str, data):
+        self.contract = contract
+        self.data = HexBytes(data)
+        self._event = threading.Event()
+        self._result = None
+        self._error = None
+
+    def resolve(self, result: HexBytes):
+        self._result = result
+        self._event.set()
+
+    def fail(self, error: Exception):
+        self._error = error
+        self._event.set()
+
+    def is_done(self) -> bool:
+        return self._event.is_set()
+
+    def result(self) -> HexBytes:
+        self._event.wait()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class _ReadCollector:
+    """Base of the read batchers: resolves collected eth_calls through Multicall3."""
+
+    DEFAULT_MAX_BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        multicall: Multicall3,
+        block_identifier=None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        self._multicall = multicall
+        self._block_identifier = block_identifier
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: List[_PendingRead] = []
+
+    def _flush(self, reads: List[_PendingRead]):
+        try:
+            if len(reads) == 1:
+                read = reads[0]
+                read.resolve(
+                    self._multicall.call(
+                        read.contract, read.data, self._block_identifier
+                    )
+                )
+                return
+            for start in range(0, len(reads), self._max_batch_size):
+                chunk = reads[start : start + self._max_batch_size]
+                results = self._multicall.aggregate3(
+                    [(read.contract, read.data) for read in chunk],
+                    self._block_identifier,
+                )
+                for read, (success, return_data) in zip(chunk, results):
+                    if success:
+                        read.resolve(HexBytes(return_data))
+                    else:
+                        read.fail(
+                            ContractLogicError(
+                                "execution reverted",
+                                data=HexBytes(return_data).to_0x_hex(),
+                            )
+                        )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for read in reads:
+                if not read.is_done():
+                    read.fail(e)
+
+
+class ReadBatch(_ReadCollector):
+    """
+    Explicit read batch. Submitted callables run concurrently and every eth_call they
+    issue through TransactionExecutor.read is parked until all of them are waiting,
+    then the whole round goes out as one Multicall3 aggregate3 call.
+
+    with transaction_executor.batch() as batch:
+        total_assets = batch.submit(plasma_vault.total_assets)
+        balance = batch.submit(usdc.balance_of, plasma_vault.address())
+    total_assets.result(), balance.result()
+    """
+
+    _local = threading.local()
+
+    def __init__(
+        self,
+        web3,
+        multicall: Multicall3,
+        block_identifier=None,
+        max_batch_size: int = _ReadCollector.DEFAULT_MAX_BATCH_SIZE,
+    ):
+        super().__init__(multicall, block_identifier, max_batch_size)
+        self._web3 = web3
+        self._tasks = []
+        self._active = 0
+
+    @classmethod
+    def current(cls) -> Optional["ReadBatch"]:
+        return getattr(cls._local, "batch", None)
+
+    def web3(self):
+        return self._web3
+
+    def block_identifier(self):
+        return self._block_identifier
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+        self._tasks.append((future, fn, args, kwargs))
+        return future
+
+    def execute(self):
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        self._active = len(tasks)
+        threads = [threading.Thread(target=self._run, args=task) for task in tasks]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def read(self, contract: str, data) -> HexBytes:
+        read = _PendingRead(contract, data)
+        with self._lock:
+            self._pending.append(read)
+            self._active -= 1
+            ready = self._take_round()
+        if ready:
+            self._flush(ready)
+        return read.result()
+
+    def _run(self, future: Future, fn, args, kwargs):
+        ReadBatch._local.batch = self
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            future.set_exception(e)
+        finally:
+            ReadBatch._local.batch = None
+            with self._lock:
+                self._active -= 1
+                ready = self._take_round()
+            if ready:
+                self._flush(ready)
+
+    def _take_round(self) -> List[_PendingRead]:
+        # A round is complete once every running task is parked on a read.
+        if self._active > 0 or not self._pending:
+            return []
+        ready, self._pending = self._pending, []
+        self._active += len(ready)
+        return ready
+
+    def __enter__(self) -> "ReadBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
+        else:
+            for future, _, _, _ in self._tasks:
+                future.cancel()
+            self._tasks = []
+
+
+class ReadCoalescer(_ReadCollector):
+    """
+    Implicit read batching: eth_calls issued by any thread within the same time window
+    are merged into one Multicall3 aggregate3 call.
+    """
+
+    def __init__(
+        self,
+        multicall: Multicall3,
+        window: float,
+        max_batch_size: int = _ReadCollector.DEFAULT_MAX_BATCH_SIZE,
+    ):
+        super().__init__(multicall, None, max_batch_size)
+        self._window = window
+
+    def read(self, contract: str, data) -> HexBytes:
+        read = _PendingRead(contract, data)
+        with self._lock:
+            self._pending.append(read)
+            leader = len(self._pending) == 1
+            ready = []
+            if len(self._pending) >= self._max_batch_size:
+                ready, self._pending = self._pending, []
+        if ready:
+            self._flush(ready)
+        elif leader:
+            time.sleep(self._window)
+            with self._lock:
+                ready, self._pending = self._pending, []
+            if ready:
+                self._flush(ready)
+        return read.result()
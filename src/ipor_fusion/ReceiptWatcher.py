@@ -0,0 +1,188 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from hexbytes import HexBytes
+from web3.exceptions import (
+    MethodUnavailable,
+    TimeExhausted,
+    TransactionNotFound,
+    Web3RPCError,
+)
+from web3.types import TxReceipt
+
+log = logging.getLogger(__name__)
+
+
+class ReceiptWatcher:
+    """
+    Single watcher for all in-flight transactions of a Web3 instance. A background
+    thread follows new blocks and resolves every pending hash from one
+    eth_getBlockReceipts call per block, instead of each caller polling its own hash.
+    Nodes without eth_getBlockReceipts are polled per pending hash once per new head.
+    """
+
+    DEFAULT_POLL_INTERVAL = 0.25
+    RECENT_BLOCKS = 32
+    START_BLOCKS_BACK = 2
+    METHOD_NOT_FOUND_ERRORS = ("method not found", "does not exist")
+
+    def __init__(
+        self,
+        web3,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        on_block: Optional[Callable[[int], None]] = None,
+    ):
+        self._web3 = web3
+        self._poll_interval = poll_interval
+        self._on_block = on_block
+        self._lock = threading.Lock()
+        self._pending: Dict[HexBytes, threading.Event] = {}
+        self._receipts: Dict[HexBytes, TxReceipt] = {}
+        # Receipts of the last blocks, for hashes registered after their block was seen
+        self._recent: "OrderedDict[int, Dict[HexBytes, TxReceipt]]" = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+        self._last_block: Optional[int] = None
+        self._block_receipts_supported = hasattr(web3.eth, "get_block_receipts")
+
+    def watch(self, tx_hash) -> threading.Event:
+        tx_hash = HexBytes(tx_hash)
+        with self._lock:
+            event = self._pending.get(tx_hash)
+            if event is None:
+                event = threading.Event()
+                self._pending[tx_hash] = event
+                for receipts in self._recent.values():
+                    if tx_hash in receipts:
+                        self._resolve(tx_hash, receipts[tx_hash])
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            return event
+
+    def wait(self, tx_hash, timeout: float = 120) -> TxReceipt:
+        tx_hash = HexBytes(tx_hash)
+        event = self.watch(tx_hash)
+        if not event.wait(timeout):
+            with self._lock:
+                self._pending.pop(tx_hash, None)
+            raise TimeExhausted(
+                f"Transaction {tx_hash.to_0x_hex()} is not in the chain after {timeout} seconds"
+            )
+        with self._lock:
+            self._pending.pop(tx_hash, None)
+            return self._receipts.pop(tx_hash)
+
+    def receipt(self, tx_hash) -> Optional[TxReceipt]:
+        """Receipt of a watched hash if it is already mined, without blocking."""
+        with self._lock:
+            return self._receipts.get(HexBytes(tx_hash))
+
+    def forget(self, tx_hash):
+        with self._lock:
+            tx_hash = HexBytes(tx_hash)
+            self._pending.pop(tx_hash, None)
+            self._receipts.pop(tx_hash, None)
+
+    def _run(self):
+        try:
+            # Pick up from where we stopped, but never replay a long idle period
+            start = self._web3.eth.block_number - self.START_BLOCKS_BACK
+            if self._last_block is None or self._last_block < start:
+                self._last_block = start
+            while self._has_unresolved():
+                block_number = self._web3.eth.block_number
+                self._process_blocks(block_number)
+                if self._on_block is not None:
+                    self._on_block(block_number)
+                time.sleep(self._poll_interval)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            log.warning("Receipt watcher stopped: %s", e)
+        finally:
+            with self._lock:
+                self._thread = None
+                restart = self._has_unresolved_locked()
+            if restart:
+                time.sleep(self._poll_interval)
+                self._restart()
+
+    def _restart(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _process_blocks(self, head: int):
+        for block_number in range(self._last_block + 1, head + 1):
+            receipts = self._fetch_block_receipts(block_number)
+            if receipts is None:
+                # One receipt poll per pending hash covers every block up to the head
+                self._poll_pending()
+                if self._block_receipts_supported:
+                    # A transient failure: the block is fetched again on the next
+                    # round, hashes watched later may have been mined in it
+                    return
+                break
+            self._store_block(block_number, receipts)
+            self._last_block = block_number
+        self._last_block = max(self._last_block, head)
+
+    def _store_block(self, block_number: int, receipts: Dict[HexBytes, TxReceipt]):
+        with self._lock:
+            self._recent[block_number] = receipts
+            while len(self._recent) > self.RECENT_BLOCKS:
+                self._recent.popitem(last=False)
+            for tx_hash, receipt in receipts.items():
+                if tx_hash in self._pending:
+                    self._resolve(tx_hash, receipt)
+
+    def _poll_pending(self):
+        with self._lock:
+            unresolved = [
+                tx_hash
+                for tx_hash, event in self._pending.items()
+                if not event.is_set()
+            ]
+        for tx_hash in unresolved:
+            try:
+                receipt = self._web3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+            with self._lock:
+                if tx_hash in self._pending:
+                    self._resolve(tx_hash, receipt)
+
+    def _fetch_block_receipts(
+        self, block_number: int
+    ) -> Optional[Dict[HexBytes, TxReceipt]]:
+        if not self._block_receipts_supported:
+            return None
+        try:
+            receipts = self._web3.eth.get_block_receipts(block_number)
+        except Web3RPCError as e:
+            if self._is_method_not_found(e):
+                log.info("eth_getBlockReceipts unavailable, polling per hash: %s", e)
+                self._block_receipts_supported = False
+            else:
+                log.info("eth_getBlockReceipts failed, polling per hash: %s", e)
+            return None
+        return {HexBytes(receipt["transactionHash"]): receipt for receipt in receipts}
+
+    def _is_method_not_found(self, error: Web3RPCError) -> bool:
+        if isinstance(error, MethodUnavailable):
+            return True
+        message = str(error).lower()
+        return any(text in message for text in self.METHOD_NOT_FOUND_ERRORS)
+
+    def _resolve(self, tx_hash: HexBytes, receipt: TxReceipt):
+        self._receipts[tx_hash] = receipt
+        self._pending[tx_hash].set()
+
+    def _has_unresolved(self) -> bool:
+        with self._lock:
+            return self._has_unresolved_locked()
+
+    def _has_unresolved_locked(self) -> bool:
+        return any(not event.is_set() for event in self._pending.values())
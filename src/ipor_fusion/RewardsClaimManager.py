@@ -1,11 +1,11 @@
 from typing import List
 
 from eth_abi import encode, decode
-from eth_utils import function_signature_to_4byte_selector
 from web3.types import TxReceipt
 
-from ipor_fusion.TransactionExecutor import TransactionExecutor
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.TransactionExecutor import TransactionExecutor
 
 
 class RewardsClaimManager:
@@ -27,18 +27,18 @@ class RewardsClaimManager:
             self._rewards_claim_manager_address, function
         )
 
-    def balance_of(self) -> int:
-        signature = function_signature_to_4byte_selector("balanceOf()")
+    def balance_of(self, block_identifier=None) -> int:
+        signature = Selectors.REWARDS_BALANCE_OF
         read = self._transaction_executor.read(
-            self._rewards_claim_manager_address, signature
+            self._rewards_claim_manager_address, signature, block_identifier
         )
         (result,) = decode(["uint256"], read)
         return result
 
-    def get_vesting_data(self) -> (int, int, int, int):
-        signature = function_signature_to_4byte_selector("getVestingData()")
+    def get_vesting_data(self, block_identifier=None) -> (int, int, int, int):
+        signature = Selectors.GET_VESTING_DATA
         read = self._transaction_executor.read(
-            self._rewards_claim_manager_address, signature
+            self._rewards_claim_manager_address, signature, block_identifier
         )
         (
             (
@@ -55,21 +55,19 @@ class RewardsClaimManager:
             last_update_balance,
         )
 
-    def get_rewards_fuses(self) -> List[str]:
-        signature = function_signature_to_4byte_selector("getRewardsFuses()")
+    def get_rewards_fuses(self, block_identifier=None) -> List[str]:
+        signature = Selectors.GET_REWARDS_FUSES
         read = self._transaction_executor.read(
-            self._rewards_claim_manager_address, signature
+            self._rewards_claim_manager_address, signature, block_identifier
         )
         (result,) = decode(["address[]"], read)
         return result
 
-    def is_reward_fuse_supported(self, fuse) -> bool:
-        signature = function_signature_to_4byte_selector(
-            "isRewardFuseSupported(address)"
-        )
+    def is_reward_fuse_supported(self, fuse, block_identifier=None) -> bool:
+        signature = Selectors.IS_REWARD_FUSE_SUPPORTED
         function = signature + encode(["address"], [fuse])
         read = self._transaction_executor.read(
-            self._rewards_claim_manager_address, function
+            self._rewards_claim_manager_address, function, block_identifier
         )
         (result,) = decode(["bool"], read)
         return result
@@ -82,23 +80,13 @@ class RewardsClaimManager:
 
     @staticmethod
     def __claim_rewards(claims: List[FuseAction]) -> bytes:
-        bytes_data = []
-        for action in claims:
-            bytes_data.append([action.fuse, action.data])
-        bytes_ = "(address,bytes)[]"
-        encoded_arguments = encode([bytes_], [bytes_data])
-        return (
-            function_signature_to_4byte_selector("claimRewards((address,bytes)[])")
-            + encoded_arguments
-        )
+        return Selectors.CLAIM_REWARDS + FuseAction.encode_many(claims)
 
     @staticmethod
     def __transfer(asset: str, to: str, amount: int) -> bytes:
-        args = ["address", "address", "uint256"]
-        join = ",".join(args)
-        function_signature = f"transfer({join})"
-        selector = function_signature_to_4byte_selector(function_signature)
-        return selector + encode(args, [asset, to, amount])
+        return Selectors.REWARDS_TRANSFER + encode(
+            ["address", "address", "uint256"], [asset, to, amount]
+        )
 
     def update_balance(self):
         function = self.__update_balance()
@@ -108,6 +96,4 @@ class RewardsClaimManager:
 
     @staticmethod
     def __update_balance():
-        function_signature = "updateBalance()"
-        selector = function_signature_to_4byte_selector(function_signature)
-        return selector
+        return Selectors.UPDATE_BALANCE
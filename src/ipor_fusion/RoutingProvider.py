@@ -0,0 +1,190 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable, List, Tuple
+
+from web3.providers import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+
+class _Endpoint:
+    """Latency and error EWMAs of one endpoint."""
+
+    ALPHA = 0.2
+    LATENCY_SAMPLES = 64
+    RECOVERY_TIME = 30.0
+
+    def __init__(self, provider: JSONBaseProvider, max_error_rate: float):
+        self.provider = provider
+        self._max_error_rate = max_error_rate
+        self._lock = threading.Lock()
+        self._latency = 0.0
+        self._error_rate = 0.0
+        self._last_failure = 0.0
+        self._latencies = deque(maxlen=self.LATENCY_SAMPLES)
+
+    def record_success(self, latency: float):
+        with self._lock:
+            self._latency += self.ALPHA * (latency - self._latency)
+            self._error_rate -= self.ALPHA * self._error_rate
+            self._latencies.append(latency)
+
+    def record_failure(self):
+        with self._lock:
+            self._error_rate += self.ALPHA * (1 - self._error_rate)
+            self._last_failure = time.monotonic()
+
+    def is_healthy(self) -> bool:
+        with self._lock:
+            # An unhealthy endpoint gets probed again once it has been quiet a while
+            return (
+                self._error_rate <= self._max_error_rate
+                or time.monotonic() - self._last_failure > self.RECOVERY_TIME
+            )
+
+    def latency(self) -> float:
+        with self._lock:
+            return self._latency
+
+    def p95(self) -> float:
+        with self._lock:
+            if not self._latencies:
+                return 0.0
+            latencies = sorted(self._latencies)
+            return latencies[int(0.95 * (len(latencies) - 1))]
+
+
+class RoutingProvider(JSONBaseProvider):
+    """
+    Provider over several JSON-RPC endpoints. Reads go to the healthy endpoint with the
+    lowest latency EWMA and fail over to the next ones on transport errors. With
+    hedging, a read still pending after the endpoint's p95 latency is also sent to the
+    runner-up and the first answer wins. Transactions are broadcast to all endpoints
+    in parallel.
+    """
+
+    SEND_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+    DEFAULT_MAX_ERROR_RATE = 0.5
+    DEFAULT_MIN_HEDGE_DELAY = 0.05
+
+    def __init__(
+        self,
+        providers: List[JSONBaseProvider],
+        hedge: bool = False,
+        max_error_rate: float = DEFAULT_MAX_ERROR_RATE,
+        min_hedge_delay: float = DEFAULT_MIN_HEDGE_DELAY,
+    ):
+        super().__init__()
+        if not providers:
+            raise ValueError("At least one provider is required")
+        self._endpoints = [
+            _Endpoint(provider, max_error_rate) for provider in providers
+        ]
+        self._hedge = hedge
+        self._min_hedge_delay = min_hedge_delay
+        self._pool = ThreadPoolExecutor(max_workers=4 * len(providers))
+
+    def __str__(self) -> str:
+        return f"RoutingProvider({', '.join(str(e.provider) for e in self._endpoints)})"
+
+    def providers(self) -> List[JSONBaseProvider]:
+        return [endpoint.provider for endpoint in self._endpoints]
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if method in self.SEND_METHODS:
+            return self._broadcast(
+                lambda provider: provider.make_request(method, params)
+            )
+        return self._read(lambda provider: provider.make_request(method, params))
+
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        if any(method in self.SEND_METHODS for method, _ in requests):
+            return self._broadcast(
+                lambda provider: provider.make_batch_request(requests)
+            )
+        return self._read(lambda provider: provider.make_batch_request(requests))
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(
+            endpoint.provider.is_connected(show_traceback)
+            for endpoint in self._endpoints
+        )
+
+    def _ranked(self) -> List[_Endpoint]:
+        healthy = [endpoint for endpoint in self._endpoints if endpoint.is_healthy()]
+        unhealthy = [
+            endpoint for endpoint in self._endpoints if endpoint not in healthy
+        ]
+        return sorted(healthy, key=_Endpoint.latency) + unhealthy
+
+    def _read(self, call: Callable):
+        ranked = self._ranked()
+        if not self._hedge or len(ranked) == 1:
+            return self._failover(ranked, call)
+        primary, backup = ranked[0], ranked[1]
+        first = self._pool.submit(self._timed, primary, call)
+        delay = max(primary.p95(), self._min_hedge_delay)
+        done, _ = wait([first], timeout=delay)
+        if done:
+            try:
+                return first.result()
+            except Exception:  # pylint: disable=broad-exception-caught
+                return self._failover(ranked[1:], call)
+        second = self._pool.submit(self._timed, backup, call)
+        error = None
+        for future in as_completed([first, second]):
+            try:
+                return future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = e
+        if len(ranked) > 2:
+            return self._failover(ranked[2:], call)
+        raise error
+
+    def _failover(self, endpoints: List[_Endpoint], call: Callable):
+        error = None
+        for endpoint in endpoints:
+            try:
+                return self._timed(endpoint, call)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = e
+        raise error
+
+    def _broadcast(self, call: Callable):
+        futures = [
+            self._pool.submit(self._timed, endpoint, call)
+            for endpoint in self._endpoints
+        ]
+        pending = set(futures)
+        responses = []
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    error = e
+                    continue
+                # Other endpoints may answer "already known" once one has accepted it
+                if isinstance(response, dict) and "error" in response:
+                    responses.append(response)
+                    continue
+                return response
+        if responses:
+            return responses[0]
+        raise error
+
+    @staticmethod
+    def _timed(endpoint: _Endpoint, call: Callable):
+        start = time.monotonic()
+        try:
+            result = call(endpoint.provider)
+        except Exception:
+            endpoint.record_failure()
+            raise
+        endpoint.record_success(time.monotonic() - start)
+        return result
@@ -0,0 +1,103 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class RpcCacheStats:
+    hits: int
+    misses: int
+    block_number: Optional[int]
+
+
+class RpcCache:
+    """
+    Memoizes RPC responses. Chain-constant values (chain id) are kept forever, block
+    scoped values (gas price, eth_call results) until a newer block is observed.
+
+    Block-scoped caching is only enabled with a block_time: the head is probed with
+    eth_blockNumber at most once per block_time, and observe_block lets anything that
+    sees new heads (receipts, subscriptions) invalidate earlier.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, web3, block_time: Optional[float] = None):
+        self._web3 = web3
+        self._block_time = block_time
+        self._lock = threading.Lock()
+        self._constants: Dict[Hashable, Any] = {}
+        self._block_values: Dict[Hashable, Any] = {}
+        self._block_number: Optional[int] = None
+        self._block_checked_at = 0.0
+        self._hits = 0
+        self._misses = 0
+
+    def is_block_cache_enabled(self) -> bool:
+        return self._block_time is not None
+
+    def constant(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        value = self.lookup_constant(key)
+        if value is self._MISSING:
+            value = fetch()
+            self.store_constant(key, value)
+        return value
+
+    def block_scoped(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        value = self.lookup(key)
+        if value is self._MISSING:
+            value = fetch()
+            self.store(key, value)
+        return value
+
+    def lookup_constant(self, key: Hashable) -> Any:
+        with self._lock:
+            return self._count(self._constants.get(key, self._MISSING))
+
+    def store_constant(self, key: Hashable, value: Any):
+        with self._lock:
+            self._constants[key] = value
+
+    def lookup(self, key: Hashable) -> Any:
+        if not self.is_block_cache_enabled():
+            return self._MISSING
+        self._refresh_head()
+        with self._lock:
+            return self._count(self._block_values.get(key, self._MISSING))
+
+    def store(self, key: Hashable, value: Any):
+        if self.is_block_cache_enabled():
+            with self._lock:
+                self._block_values[key] = value
+
+    def is_missing(self, value: Any) -> bool:
+        return value is self._MISSING
+
+    def observe_block(self, block_number: int):
+        with self._lock:
+            if self._block_number is None or block_number > self._block_number:
+                self._block_number = block_number
+                self._block_values.clear()
+            self._block_checked_at = time.monotonic()
+
+    def invalidate(self):
+        """Drop block-scoped values, e.g. after our own transaction changed state."""
+        with self._lock:
+            self._block_values.clear()
+
+    def stats(self) -> RpcCacheStats:
+        with self._lock:
+            return RpcCacheStats(self._hits, self._misses, self._block_number)
+
+    def _refresh_head(self):
+        if time.monotonic() - self._block_checked_at < self._block_time:
+            return
+        self.observe_block(self._web3.eth.block_number)
+
+    def _count(self, value: Any) -> Any:
+        if value is self._MISSING:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
@@ -0,0 +1,157 @@
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hexbytes import HexBytes
+
+from ipor_fusion.Selectors import Selectors
+
+
+class _Series:
+    """Count, errors and latency histogram of one label set."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.bucket_counts = [0] * len(buckets)
+
+    def observe(self, buckets: Tuple[float, ...], seconds: float, error: bool):
+        self.count += 1
+        self.errors += int(error)
+        self.total_seconds += seconds
+        for index, upper_bound in enumerate(buckets):
+            if seconds <= upper_bound:
+                self.bucket_counts[index] += 1
+
+
+class RpcMetrics:
+    """
+    Request counters and latency histograms. `rpc` series are labelled by JSON-RPC
+    method (recorded by InstrumentedProvider), `contract` series by kind (read, submit,
+    ...), contract address and function (recorded by TransactionExecutor), so a vault's
+    cost shows up under its address; functions are named from the Selectors table.
+    Listeners get every observation; `to_prometheus` and `serve` export the text
+    exposition format. Passing metrics to TransactionExecutor wraps the given Web3's
+    provider in place, so every user of that Web3 instance is recorded.
+    """
+
+    RPC = "rpc"
+    CONTRACT = "contract"
+    LABELS = {RPC: ("method",), CONTRACT: ("kind", "contract", "function")}
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    PREFIX = "ipor_fusion"
+
+    def __init__(self, function_names: Optional[Dict[bytes, str]] = None):
+        self._function_names = function_names or Selectors.signatures()
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, Tuple[str, ...]], _Series] = {}
+        self._listeners: List[Callable[[str, Tuple[str, ...], float, bool], None]] = []
+
+    def add_listener(
+        self, listener: Callable[[str, Tuple[str, ...], float, bool], None]
+    ):
+        self._listeners.append(listener)
+
+    def function_label(self, data) -> str:
+        selector = bytes(HexBytes(data)[:4])
+        return self._function_names.get(selector) or f"0x{selector.hex()}"
+
+    def observe(
+        self, metric: str, labels: Tuple[str, ...], seconds: float, error: bool = False
+    ):
+        with self._lock:
+            series = self._series.get((metric, labels))
+            if series is None:
+                series = _Series(self.BUCKETS)
+                self._series[(metric, labels)] = series
+            series.observe(self.BUCKETS, seconds, error)
+        for listener in self._listeners:
+            listener(metric, labels, seconds, error)
+
+    @contextmanager
+    def measure(self, metric: str, labels: Tuple[str, ...]):
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.observe(metric, labels, time.perf_counter() - start, error)
+
+    def counts(self, metric: str) -> Dict[Tuple[str, ...], int]:
+        with self._lock:
+            return {
+                labels: series.count
+                for (name, labels), series in self._series.items()
+                if name == metric
+            }
+
+    def to_prometheus(self) -> str:
+        """Each metric family is one block: its TYPE line, then all of its samples."""
+        lines = []
+        with self._lock:
+            series = sorted(self._series.items())
+            for metric, label_names in self.LABELS.items():
+                name = f"{self.PREFIX}_{metric}"
+                samples = [
+                    (self._labels_text(label_names, labels), values)
+                    for (series_metric, labels), values in series
+                    if series_metric == metric
+                ]
+                lines.append(f"# TYPE {name}_requests_total counter")
+                for labels, values in samples:
+                    lines.append(f"{name}_requests_total{{{labels}}} {values.count}")
+                lines.append(f"# TYPE {name}_errors_total counter")
+                for labels, values in samples:
+                    lines.append(f"{name}_errors_total{{{labels}}} {values.errors}")
+                lines.append(f"# TYPE {name}_latency_seconds histogram")
+                for labels, values in samples:
+                    lines.extend(self._histogram_lines(name, labels, values))
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def _labels_text(cls, label_names: Tuple[str, ...], labels: Tuple[str, ...]) -> str:
+        return ",".join(
+            f'{key}="{cls._escape(value)}"' for key, value in zip(label_names, labels)
+        )
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    def _histogram_lines(self, name: str, labels: str, values: _Series) -> List[str]:
+        lines = []
+        upper_bounds = [str(bound) for bound in self.BUCKETS] + ["+Inf"]
+        counts = values.bucket_counts + [values.count]
+        for upper_bound, count in zip(upper_bounds, counts):
+            lines.append(
+                f'{name}_latency_seconds_bucket{{{labels},le="{upper_bound}"}} {count}'
+            )
+        lines.append(f"{name}_latency_seconds_sum{{{labels}}} {values.total_seconds}")
+        lines.append(f"{name}_latency_seconds_count{{{labels}}} {values.count}")
+        return lines
+
+    def serve(self, port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+        """Exposes /metrics for Prometheus from a daemon thread."""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                body = metrics.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
@@ -0,0 +1,165 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from requests import HTTPError
+from web3.providers import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+
+class ScheduledProvider(JSONBaseProvider):
+    """
+    Wraps the provider of one endpoint with a request scheduler. Requests wait in a
+    priority queue (send > estimate > read > log scan), spend tokens from a bucket
+    refilled at `requests_per_second`, and are limited by an AIMD concurrency window:
+    +1 per window of successful requests, halved on HTTP 429 / rate-limit errors.
+    Rate-limited requests are queued again after a backoff.
+    """
+
+    SEND = 0
+    ESTIMATE = 1
+    READ = 2
+    LOG_SCAN = 3
+    PRIORITIES = {
+        "eth_sendRawTransaction": SEND,
+        "eth_sendTransaction": SEND,
+        "eth_estimateGas": ESTIMATE,
+        "eth_getLogs": LOG_SCAN,
+    }
+    RATE_LIMIT_ERRORS = ("rate limit", "too many requests", "compute units")
+    RATE_LIMIT_CODES = {429}
+    DEFAULT_MAX_CONCURRENCY = 32
+    RATE_LIMIT_RETRIES = 3
+    BACKOFF = 0.5
+
+    def __init__(
+        self,
+        provider: JSONBaseProvider,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__()
+        self._provider = provider
+        self._rate = requests_per_second
+        self._burst = burst or max(1, int(requests_per_second or 1))
+        self._tokens = float(self._burst)
+        self._refilled_at = time.monotonic()
+        self._max_concurrency = max_concurrency
+        self._concurrency = float(max_concurrency)
+        self._in_flight = 0
+        self._queue: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def __str__(self) -> str:
+        return f"ScheduledProvider({self._provider})"
+
+    def provider(self) -> JSONBaseProvider:
+        return self._provider
+
+    def concurrency(self) -> int:
+        with self._condition:
+            return int(self._concurrency)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self._schedule(
+            self.PRIORITIES.get(method, self.READ),
+            1,
+            lambda: self._provider.make_request(method, params),
+        )
+
+    def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        priority = min(self.PRIORITIES.get(method, self.READ) for method, _ in requests)
+        return self._schedule(
+            priority,
+            len(requests),
+            lambda: self._provider.make_batch_request(requests),
+        )
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return self._provider.is_connected(show_traceback)
+
+    def _schedule(self, priority: int, cost: int, call):
+        retries = 0
+        while True:
+            self._acquire(priority, cost)
+            rate_limited = False
+            try:
+                response = call()
+                rate_limited = self.is_rate_limited_response(response)
+            except HTTPError as e:
+                rate_limited = self.is_rate_limited_error(e)
+                if not rate_limited or retries == self.RATE_LIMIT_RETRIES:
+                    raise
+            finally:
+                self._release(rate_limited)
+            if not rate_limited or retries == self.RATE_LIMIT_RETRIES:
+                return response
+            retries += 1
+            time.sleep(self.BACKOFF * 2**retries)
+
+    def _acquire(self, priority: int, cost: int):
+        cost = min(cost, self._burst)
+        entry = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._queue, entry)
+            while True:
+                wait_time = None
+                if self._queue[0] == entry and self._in_flight < max(
+                    1, int(self._concurrency)
+                ):
+                    wait_time = self._take_tokens(cost)
+                    if wait_time == 0:
+                        heapq.heappop(self._queue)
+                        self._in_flight += 1
+                        # The next request in line may be able to go as well
+                        self._condition.notify_all()
+                        return
+                self._condition.wait(wait_time)
+
+    def _take_tokens(self, cost: int) -> float:
+        """Takes the tokens, or returns how long to wait until they are available."""
+        if self._rate is None:
+            return 0
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._refilled_at) * self._rate
+        )
+        self._refilled_at = now
+        if self._tokens >= cost:
+            self._tokens -= cost
+            return 0
+        return (cost - self._tokens) / self._rate
+
+    def _release(self, rate_limited: bool):
+        with self._condition:
+            self._in_flight -= 1
+            if rate_limited:
+                self._concurrency = max(1.0, self._concurrency / 2)
+            else:
+                self._concurrency = min(
+                    self._max_concurrency, self._concurrency + 1 / self._concurrency
+                )
+            self._condition.notify_all()
+
+    def is_rate_limited_error(self, error: HTTPError) -> bool:
+        response = error.response
+        return response is not None and response.status_code == 429
+
+    def is_rate_limited_response(self, response) -> bool:
+        responses = response if isinstance(response, list) else [response]
+        for item in responses:
+            error = item.get("error") if isinstance(item, dict) else None
+            if not isinstance(error, dict):
+                continue
+            message = str(error.get("message", "")).lower()
+            if error.get("code") in self.RATE_LIMIT_CODES or any(
+                pattern in message for pattern in self.RATE_LIMIT_ERRORS
+            ):
+                return True
+        return False
@@ -0,0 +1,107 @@
+from typing import Dict
+
+from eth_utils import function_signature_to_4byte_selector
+
+_SIGNATURES: Dict[bytes, str] = {}
+
+
+def _selector(signature: str) -> bytes:
+    selector = function_signature_to_4byte_selector(signature)
+    _SIGNATURES[selector] = signature
+    return selector
+
+
+class Selectors:
+    """Function selectors used by the wrappers and fuses, hashed once at import."""
+
+    # ERC20 / ERC4626
+    TRANSFER = _selector("transfer(address,uint256)")
+    TRANSFER_FROM = _selector("transferFrom(address,address,uint256)")
+    APPROVE = _selector("approve(address,uint256)")
+    BALANCE_OF = _selector("balanceOf(address)")
+    DECIMALS = _selector("decimals()")
+    ASSET = _selector("asset()")
+    TOTAL_ASSETS = _selector("totalAssets()")
+    CONVERT_TO_ASSETS = _selector("convertToAssets(uint256)")
+    MAX_WITHDRAW = _selector("maxWithdraw(address)")
+    DEPOSIT = _selector("deposit(uint256,address)")
+    MINT = _selector("mint(uint256,address)")
+    WITHDRAW = _selector("withdraw(uint256,address,address)")
+    REDEEM = _selector("redeem(uint256,address,address)")
+
+    # PlasmaVault
+    EXECUTE = _selector("execute((address,bytes)[])")
+    TOTAL_ASSETS_IN_MARKET = _selector("totalAssetsInMarket(uint256)")
+    GET_ACCESS_MANAGER_ADDRESS = _selector("getAccessManagerAddress()")
+    GET_REWARDS_CLAIM_MANAGER_ADDRESS = _selector("getRewardsClaimManagerAddress()")
+    GET_FUSES = _selector("getFuses()")
+    GET_MARKET_SUBSTRATES = _selector("getMarketSubstrates(uint256)")
+    MARKET_ID = _selector("MARKET_ID()")
+
+    # AccessManager
+    GRANT_ROLE = _selector("grantRole(uint64,address,uint32)")
+    HAS_ROLE = _selector("hasRole(uint64,address)")
+
+    # WithdrawManager
+    UPDATE_WITHDRAW_WINDOW = _selector("updateWithdrawWindow(uint256)")
+    REQUEST = _selector("request(uint256)")
+    RELEASE_FUNDS = _selector("releaseFunds()")
+    GET_WITHDRAW_WINDOW = _selector("getWithdrawWindow()")
+
+    # RewardsClaimManager
+    REWARDS_BALANCE_OF = _selector("balanceOf()")
+    GET_VESTING_DATA = _selector("getVestingData()")
+    GET_REWARDS_FUSES = _selector("getRewardsFuses()")
+    IS_REWARD_FUSE_SUPPORTED = _selector("isRewardFuseSupported(address)")
+    CLAIM_REWARDS = _selector("claimRewards((address,bytes)[])")
+    REWARDS_TRANSFER = _selector("transfer(address,address,uint256)")
+    UPDATE_BALANCE = _selector("updateBalance()")
+
+    # Multicall3
+    AGGREGATE3 = _selector("aggregate3((address,bool,bytes)[])")
+
+    # Fuses
+    AAVE_V3_SUPPLY_ENTER = _selector("enter((address,uint256,uint256))")
+    AAVE_V3_SUPPLY_EXIT = _selector("exit((address,uint256))")
+    COMPOUND_V3_SUPPLY_ENTER = _selector("enter((address,uint256))")
+    COMPOUND_V3_SUPPLY_EXIT = _selector("exit((address,uint256))")
+    ERC4626_SUPPLY_ENTER = _selector("enter((address,uint256))")
+    ERC4626_SUPPLY_EXIT = _selector("exit((address,uint256))")
+    FLUID_INSTADAPP_SUPPLY_ENTER = _selector("enter((uint256,address))")
+    FLUID_INSTADAPP_SUPPLY_EXIT = _selector("exit((uint256,address))")
+    GEARBOX_SUPPLY_ENTER = _selector("enter((uint256,address))")
+    GEARBOX_SUPPLY_EXIT = _selector("exit((uint256,address))")
+    GEARBOX_STAKE_ENTER = _selector("enter((uint256,address))")
+    GEARBOX_STAKE_EXIT = _selector("exit((uint256,address))")
+    UNISWAP_V3_SWAP_ENTER = _selector("enter((uint256,uint256,bytes))")
+    UNISWAP_V3_NEW_POSITION_ENTER = _selector(
+        "enter((address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,uint256))"
+    )
+    UNISWAP_V3_NEW_POSITION_EXIT = _selector("exit((uint256[]))")
+    UNISWAP_V3_MODIFY_POSITION_ENTER = _selector(
+        "enter((address,address,uint256,uint256,uint256,uint256,uint256,uint256))"
+    )
+    UNISWAP_V3_MODIFY_POSITION_EXIT = _selector(
+        "exit((uint256,uint128,uint256,uint256,uint256))"
+    )
+    UNISWAP_V3_COLLECT_ENTER = _selector("enter((uint256[]))")
+    RAMSES_V2_NEW_POSITION_ENTER = _selector(
+        "enter((address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,uint256,uint256))"
+    )
+    RAMSES_V2_NEW_POSITION_EXIT = _selector("exit((uint256[]))")
+    RAMSES_V2_MODIFY_POSITION_ENTER = _selector(
+        "enter((address,address,uint256,uint256,uint256,uint256,uint256,uint256))"
+    )
+    RAMSES_V2_MODIFY_POSITION_EXIT = _selector(
+        "exit((uint256,uint128,uint256,uint256,uint256))"
+    )
+    RAMSES_V2_COLLECT_ENTER = _selector("enter((uint256[]))")
+    RAMSES_V2_CLAIM = _selector("claim(uint256[],address[][])")
+    UNIVERSAL_TOKEN_SWAPPER_ENTER = _selector(
+        "enter((address,address,uint256,(address[],bytes[])))"
+    )
+
+    @staticmethod
+    def signatures() -> Dict[bytes, str]:
+        """Selector to signature, e.g. for RpcMetrics function labels."""
+        return dict(_SIGNATURES)
@@ -0,0 +1,94 @@
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from ipor_fusion.SharedSessionHTTPProvider import SharedSessionHTTPProvider
+
+
+class SessionRegistry:
+    """
+    Process-wide requests sessions, one per endpoint origin (scheme://host:port), so
+    every provider, executor and factory talking to an endpoint shares one connection
+    pool. Pool size, keep-alive, gzip and the request timeout are set with `configure`
+    before the first session for an endpoint is created.
+    """
+
+    DEFAULT_POOL_SIZE = 32
+    DEFAULT_TIMEOUT = 30.0
+
+    _lock = threading.Lock()
+    _sessions: Dict[str, Session] = {}
+    _pool_size = DEFAULT_POOL_SIZE
+    _timeout = DEFAULT_TIMEOUT
+    _keep_alive = True
+    _gzip = True
+
+    @classmethod
+    def configure(
+        cls,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        keep_alive: Optional[bool] = None,
+        gzip: Optional[bool] = None,
+    ):
+        with cls._lock:
+            if pool_size is not None:
+                cls._pool_size = pool_size
+            if timeout is not None:
+                cls._timeout = timeout
+            if keep_alive is not None:
+                cls._keep_alive = keep_alive
+            if gzip is not None:
+                cls._gzip = gzip
+
+    @classmethod
+    def timeout(cls) -> float:
+        return cls._timeout
+
+    @classmethod
+    def session(cls, endpoint_uri: str) -> Session:
+        key = cls._origin(endpoint_uri)
+        with cls._lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                session = cls._create_session()
+                cls._sessions[key] = session
+            return session
+
+    @classmethod
+    def http_provider(cls, endpoint_uri: str) -> SharedSessionHTTPProvider:
+        return SharedSessionHTTPProvider(
+            endpoint_uri,
+            cls.session(endpoint_uri),
+            request_kwargs={"timeout": cls._timeout},
+        )
+
+    @classmethod
+    def close_all(cls):
+        with cls._lock:
+            sessions, cls._sessions = cls._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    @classmethod
+    def _create_session(cls) -> Session:
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=cls._pool_size, pool_maxsize=cls._pool_size
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Accept-Encoding"] = (
+            "gzip, deflate" if cls._gzip else "identity"
+        )
+        if not cls._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @staticmethod
+    def _origin(endpoint_uri: str) -> str:
+        parts = urlsplit(endpoint_uri)
+        return f"{parts.scheme}://{parts.netloc}".lower()
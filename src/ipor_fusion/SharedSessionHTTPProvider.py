@@ -0,0 +1,26 @@
+from requests import Session
+from web3 import HTTPProvider
+from web3._utils.http_session_manager import HTTPSessionManager
+
+
+class SharedSessionHTTPProvider(HTTPProvider):
+    """
+    HTTPProvider that sends every request, from any thread, through one requests
+    session. web3 caches sessions per thread, so worker threads (read batches, log
+    chunks, the receipt watcher, routing) would otherwise open their own connections.
+    """
+
+    def __init__(self, endpoint_uri: str, session: Session, **kwargs):
+        super().__init__(endpoint_uri, session=session, **kwargs)
+        self._request_session_manager = _SharedSessionManager(session)
+
+
+class _SharedSessionManager(HTTPSessionManager):
+    def __init__(self, session: Session):
+        super().__init__()
+        self._session = session
+
+    def cache_and_return_session(
+        self, endpoint_uri, session=None, request_timeout=None
+    ):
+        return self._session
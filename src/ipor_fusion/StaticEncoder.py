@@ -0,0 +1,124 @@
+import re
+from functools import lru_cache
+from typing import Callable, List, Sequence
+
+from eth_abi.exceptions import EncodingTypeError, ValueOutOfBounds
+from eth_utils import is_address, to_canonical_address
+
+_Packer = Callable[[object], bytes]
+
+
+class StaticEncoder:
+    """
+    Encoder for a flat tuple of static ABI types, e.g. "(address,uint256)". The
+    signature is compiled once into one 32-byte word packer per field, so encoding
+    skips the eth_abi registry and encoder dispatch while keeping its bounds and type
+    checks (and exceptions). The output is identical to eth_abi.encode.
+    """
+
+    _INTEGER = re.compile(r"^(u?)int(\d*)$")
+    _FIXED_BYTES = re.compile(r"^bytes(\d+)$")
+
+    def __init__(self, signature: str):
+        self.signature = signature
+        self.types = self.parse(signature)
+        self._packers: List[_Packer] = [
+            self._packer(type_str) for type_str in self.types
+        ]
+
+    def encode(self, values: Sequence) -> bytes:
+        if len(values) != len(self._packers):
+            raise EncodingTypeError(
+                f"{self.signature} takes {len(self._packers)} values, got {len(values)}"
+            )
+        return b"".join([packer(value) for packer, value in zip(self._packers, values)])
+
+    def size(self) -> int:
+        return 32 * len(self._packers)
+
+    @staticmethod
+    def parse(signature: str) -> List[str]:
+        if not signature.startswith("(") or not signature.endswith(")"):
+            raise ValueError(f"Expected a tuple signature, got {signature}")
+        inner = signature[1:-1]
+        types = inner.split(",") if inner else []
+        for type_str in types:
+            if any(char in type_str for char in "()[]") or type_str in {
+                "bytes",
+                "string",
+            }:
+                raise ValueError(f"{type_str} in {signature} is not a static type")
+        return types
+
+    @classmethod
+    def _packer(cls, type_str: str) -> _Packer:
+        if type_str == "address":
+            return cls.address
+        if type_str == "bool":
+            return cls._bool
+        integer = cls._INTEGER.match(type_str)
+        bits = int(integer.group(2) or 256) if integer else 0
+        if integer and 8 <= bits <= 256 and bits % 8 == 0:
+            return cls._uint(bits) if integer.group(1) else cls._int(bits)
+        fixed_bytes = cls._FIXED_BYTES.match(type_str)
+        if fixed_bytes and 1 <= int(fixed_bytes.group(1)) <= 32:
+            return cls._fixed_bytes(int(fixed_bytes.group(1)))
+        raise ValueError(f"Unsupported static type {type_str}")
+
+    @classmethod
+    def address(cls, value) -> bytes:
+        if isinstance(value, (bytes, bytearray)) and len(value) == 20:
+            return bytes(12) + bytes(value)
+        if not isinstance(value, str):
+            raise EncodingTypeError(f"Value {value!r} is not an address")
+        return cls._address_word(value)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _address_word(value: str) -> bytes:
+        """The same addresses recur across actions, so validated words are cached."""
+        if not is_address(value):
+            raise EncodingTypeError(f"Value {value!r} is not an address")
+        return bytes(12) + to_canonical_address(value)
+
+    @staticmethod
+    def uint(value: int, bits: int = 256) -> bytes:
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise EncodingTypeError(f"Value {value!r} is not an integer")
+        if value < 0 or value >> bits:
+            raise ValueOutOfBounds(f"Value {value} does not fit in uint{bits}")
+        return value.to_bytes(32, "big")
+
+    @classmethod
+    def _uint(cls, bits: int) -> _Packer:
+        return lambda value: cls.uint(value, bits)
+
+    @staticmethod
+    def _int(bits: int) -> _Packer:
+        lower, upper = -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+
+        def pack(value) -> bytes:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise EncodingTypeError(f"Value {value!r} is not an integer")
+            if not lower <= value <= upper:
+                raise ValueOutOfBounds(f"Value {value} does not fit in int{bits}")
+            return value.to_bytes(32, "big", signed=True)
+
+        return pack
+
+    @staticmethod
+    def _bool(value) -> bytes:
+        if not isinstance(value, bool):
+            raise EncodingTypeError(f"Value {value!r} is not a bool")
+        return (1 if value else 0).to_bytes(32, "big")
+
+    @staticmethod
+    def _fixed_bytes(size: int) -> _Packer:
+        def pack(value) -> bytes:
+            if not isinstance(value, (bytes, bytearray)):
+                raise EncodingTypeError(f"Value {value!r} is not bytes{size}")
+            if len(value) > size:
+                raise ValueOutOfBounds(f"Value {value!r} does not fit in bytes{size}")
+            return bytes(value).ljust(32, b"\x00")
+
+        return pack
@@ -1,49 +1,375 @@
-from typing import List
+import itertools
+import multiprocessing
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from eth_account import Account
+from eth_utils import keccak
 
 from hexbytes import HexBytes
 from web3.types import TxReceipt, LogReceipt
 
+from ipor_fusion.EventStore import EventStore
+from ipor_fusion.FeeOracle import FeeOracle
+from ipor_fusion.GasModel import GasModel
+from ipor_fusion.ImmutableReadCache import ImmutableReadCache
+from ipor_fusion.InstrumentedProvider import InstrumentedProvider
+from ipor_fusion.JsonRpcBatch import JsonRpcBatch
+from ipor_fusion.LogFetcher import LogFetcher
+from ipor_fusion.Multicall3 import Multicall3
+from ipor_fusion.NonceManager import NonceManager
+from ipor_fusion.RawRpc import RawRpc
+from ipor_fusion.ReadBatch import ReadBatch, ReadCoalescer
+from ipor_fusion.ReceiptWatcher import ReceiptWatcher
+from ipor_fusion.RpcCache import RpcCache, RpcCacheStats
+from ipor_fusion.RpcMetrics import RpcMetrics
+from ipor_fusion.TransactionHandle import TransactionHandle
+from ipor_fusion.TransactionLifecycle import TransactionLifecycle
+
 
+# pylint: disable=too-many-instance-attributes
 class TransactionExecutor:
     DEFAULT_TRANSACTION_MAX_PRIORITY_FEE = 2_000_000_000
     GAS_PRICE_MARGIN = 25
+    NONCE_RETRIES = 1
+    OUT_OF_GAS_RATIO = 0.97
+    PREPARE_WORKERS = 8
+    MIN_PARALLEL_SIGNING = 64
+    SIGNING_CHUNK_SIZE = 16
 
-    def __init__(self, web3, account, gas_multiplier=1.25):
+    def __init__(
+        self,
+        web3,
+        account,
+        gas_multiplier=1.25,
+        read_batch_window: Optional[float] = None,
+        block_time: Optional[float] = None,
+        log_chunk_size: Optional[int] = LogFetcher.DEFAULT_MAX_CHUNK_SIZE,
+        event_store: Optional[EventStore] = None,
+        gas_model: Optional[GasModel] = None,
+        fee_oracle: Optional[FeeOracle] = None,
+        replace_after_blocks: Optional[int] = None,
+        metrics: Optional[RpcMetrics] = None,
+        read_cache: Optional[ImmutableReadCache] = None,
+    ):
+        self._metrics = metrics
+        # Created first so it talks to the transport directly, it records its own calls
+        self._raw_rpc = RawRpc(web3, metrics)
+        # Instruments the caller's Web3 in place, see RpcMetrics
+        if metrics is not None and not isinstance(web3.provider, InstrumentedProvider):
+            web3.provider = InstrumentedProvider(web3.provider, metrics)
         self._web3 = web3
         self._account = account
         self._gas_multiplier = gas_multiplier
+        self._nonce_manager = NonceManager(web3)
+        self._rpc_cache = RpcCache(web3, block_time)
+        self._lifecycle = TransactionLifecycle(
+            self._send_transaction, replace_after_blocks
+        )
+        self._receipt_watcher = ReceiptWatcher(web3, on_block=self._on_block)
+        self._multicall = Multicall3(web3)
+        self._log_fetcher = LogFetcher(web3, log_chunk_size)
+        self._event_store = event_store
+        self._gas_model = gas_model
+        self._fee_oracle = fee_oracle
+        self._read_cache = read_cache
+        self._read_coalescer = None
+        if read_batch_window is not None:
+            self._read_coalescer = ReadCoalescer(self._multicall, read_batch_window)
+        self._signing_lock = threading.Lock()
+        self._signing_pool = None
+        self._signing_workers = None
 
     def get_account_address(self):
         return self._account.address
 
     def execute(self, contract_address: str, function: bytes) -> TxReceipt:
-        transaction = self.prepare_transaction(contract_address, function)
+        with self._measure("execute", contract_address, function):
+            return self._execute(contract_address, function)
+
+    def _execute(self, contract_address: str, function: bytes) -> TxReceipt:
+        predicted_gas = None
+        if self._gas_model is not None:
+            predicted_gas = self._gas_model.predict(contract_address, function)
+        handle = self.submit(contract_address, function)
+        if (
+            predicted_gas is not None
+            and handle.transaction()["gas"] == predicted_gas
+            and self._is_out_of_gas(handle)
+        ):
+            # The learned limit was too low for this call, let the node estimate again
+            self._gas_model.forget(contract_address, function)
+            handle = self.submit(contract_address, function)
+        return handle.wait()
+
+    def _is_out_of_gas(self, handle: TransactionHandle) -> bool:
+        receipt = handle.receipt()
+        gas_limit = handle.transaction()["gas"]
+        return (
+            receipt["status"] == 0
+            and receipt["gasUsed"] >= gas_limit * self.OUT_OF_GAS_RATIO
+        )
+
+    def submit(self, contract_address: str, function: bytes) -> TransactionHandle:
+        """Broadcast without waiting for the receipt; nonces are assigned locally."""
+        with self._measure("submit", contract_address, function):
+            return self._submit(contract_address, function)
+
+    def _submit(self, contract_address: str, function: bytes) -> TransactionHandle:
+        from_address = self._sender_address()
+        retries = self.NONCE_RETRIES
+        while True:
+            nonce = self._nonce_manager.next_nonce(from_address)
+            try:
+                transaction = self._prepare_transaction(
+                    from_address, contract_address, function, nonce
+                )
+                tx_hash = self._send_transaction(transaction)
+                self._rpc_cache.invalidate()
+                return self._handle(tx_hash, transaction)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if not self._nonce_manager.is_nonce_error(e):
+                    self._nonce_manager.release(from_address, nonce)
+                    raise
+                # Someone else used the account, start again from the node's view
+                self._nonce_manager.resync(from_address)
+                if retries == 0:
+                    raise
+                retries -= 1
+
+    def speed_up(self, handle: TransactionHandle) -> HexBytes:
+        """Re-broadcasts a pending transaction with bumped fees."""
+        return self._lifecycle.speed_up(handle)
+
+    def cancel(self, handle: TransactionHandle) -> HexBytes:
+        """Replaces a pending transaction with a zero-value transfer to the sender."""
+        return self._lifecycle.cancel(handle)
+
+    def _handle(self, tx_hash: HexBytes, transaction) -> TransactionHandle:
+        if self._fee_oracle is not None:
+            self._fee_oracle.track(tx_hash)
+        return self._lifecycle.track(
+            TransactionHandle(
+                self._receipt_watcher, tx_hash, transaction, self._on_receipt
+            )
+        )
+
+    def _on_block(self, block_number: int):
+        self._rpc_cache.observe_block(block_number)
+        if self._fee_oracle is not None:
+            self._fee_oracle.observe_block(block_number)
+        self._lifecycle.on_block(block_number)
+
+    def sign_many(
+        self, calls: List[Tuple[str, bytes]], max_workers: Optional[int] = None
+    ) -> List[HexBytes]:
+        """
+        Raw transactions for (contract, calldata) calls, with consecutive nonces. They
+        are not broadcast, so the next nonce is read from the node again afterwards.
+        """
+        from_address = self._sender_address()
+        try:
+            return [
+                raw for _, raw in self._iter_signed(from_address, calls, max_workers)
+            ]
+        finally:
+            self._nonce_manager.resync(from_address)
+
+    def send_many(
+        self, calls: List[Tuple[str, bytes]], max_workers: Optional[int] = None
+    ) -> List[TransactionHandle]:
+        """Signs like sign_many and broadcasts each transaction as soon as it is signed."""
+        from_address = self._sender_address()
+        handles = []
+        try:
+            for transaction, raw_transaction in self._iter_signed(
+                from_address, calls, max_workers
+            ):
+                tx_hash = self._send_raw_transaction(
+                    raw_transaction, keccak(raw_transaction)
+                )
+                handles.append(self._handle(tx_hash, transaction))
+        except Exception:
+            # Nonces after the failed one were reserved but never used
+            self._nonce_manager.resync(from_address)
+            raise
+        finally:
+            self._rpc_cache.invalidate()
+        return handles
+
+    def _iter_signed(self, from_address, calls, max_workers: Optional[int]):
+        transactions = self._prepare_many(from_address, calls)
+        key = self._account.key
+        if len(transactions) < self.MIN_PARALLEL_SIGNING:
+            for transaction in transactions:
+                yield transaction, self._sign(transaction, key)
+            return
+        raw_transactions = self._signing_processes(max_workers).map(
+            self._sign,
+            transactions,
+            itertools.repeat(key),
+            chunksize=self.SIGNING_CHUNK_SIZE,
+        )
+        yield from zip(transactions, raw_transactions)
+
+    def _signing_processes(self, max_workers: Optional[int]) -> ProcessPoolExecutor:
+        """
+        Signing and RLP encoding are CPU bound, so they are spread over processes.
+        Forking would copy the receipt watcher and read pool threads' locks, so the
+        pool is spawned, once: each worker pays for importing web3 and eth_account.
+        """
+        with self._signing_lock:
+            if self._signing_pool is not None and self._signing_workers != max_workers:
+                self._signing_pool.shutdown()
+                self._signing_pool = None
+            if self._signing_pool is None:
+                self._signing_pool = ProcessPoolExecutor(
+                    max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._signing_workers = max_workers
+            return self._signing_pool
+
+    def close(self):
+        """Stops the signing processes started by sign_many and send_many."""
+        with self._signing_lock:
+            if self._signing_pool is not None:
+                self._signing_pool.shutdown()
+                self._signing_pool = None
+
+    def _prepare_many(self, from_address, calls) -> List[dict]:
+        nonces = self._nonce_manager.reserve(from_address, len(calls))
+        try:
+            with ThreadPoolExecutor(self.PREPARE_WORKERS) as pool:
+                return list(
+                    pool.map(
+                        lambda call, nonce: self._prepare_transaction(
+                            from_address, call[0], call[1], nonce
+                        ),
+                        calls,
+                        nonces,
+                    )
+                )
+        except Exception:
+            self._nonce_manager.resync(from_address)
+            raise
+
+    @staticmethod
+    def _sign(transaction, key) -> HexBytes:
+        # pylint: disable=no-value-for-parameter
+        return Account.sign_transaction(transaction, key).raw_transaction
+
+    def _on_receipt(self, handle: TransactionHandle, receipt: TxReceipt):
+        self._rpc_cache.observe_block(receipt["blockNumber"])
+        self._rpc_cache.invalidate()
+        if self._fee_oracle is not None:
+            self._fee_oracle.observe_block(receipt["blockNumber"])
+            self._fee_oracle.observe_receipt(receipt)
+            # Versions that lost to the mined one will never get a receipt
+            for tx_hash in handle.versions():
+                self._fee_oracle.forget(tx_hash)
+
+    def _sender_address(self) -> str:
+        return self._account.address
+
+    def _send_transaction(self, transaction) -> HexBytes:
         signed_tx = self._web3.eth.account.sign_transaction(
             transaction, self._account.key
         )
-        tx_hash = self._web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        receipt = self._web3.eth.wait_for_transaction_receipt(tx_hash)
-        assert receipt["status"] == 1, "Transaction failed"
-        return receipt
+        return self._send_raw_transaction(signed_tx.raw_transaction, signed_tx.hash)
+
+    def _send_raw_transaction(self, raw_transaction, tx_hash) -> HexBytes:
+        try:
+            return self._web3.eth.send_raw_transaction(raw_transaction)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if not self._nonce_manager.is_already_known(e):
+                raise
+            # An earlier broadcast of the same bytes made it, sending again would not
+            return HexBytes(tx_hash)
 
     def prepare_transaction(self, contract_address, function):
-        nonce = self._web3.eth.get_transaction_count(self._account.address)
-        gas_price = self._web3.eth.gas_price
-        max_fee_per_gas = self.calculate_max_fee_per_gas(gas_price)
-        max_priority_fee_per_gas = self.get_max_priority_fee(gas_price)
-        data = f"0x{function.hex()}"
-        estimated_gas = self.estimate_gas(contract_address, data)
+        return self._prepare_transaction(
+            self._account.address, contract_address, function
+        )
+
+    def _prepare_transaction(
+        self, from_address, contract_address, function, nonce: Optional[int] = None
+    ):
+        # Kept as bytes, the JSON encoder and the signer take it as is
+        data = bytes(function)
+        chain_id = self._rpc_cache.lookup_constant("eth_chainId")
+        batch = JsonRpcBatch(self._web3)
+        resolve_gas = self._request_gas(batch, from_address, contract_address, data)
+        resolve_fees = self._request_fees(batch)
+        if self._rpc_cache.is_missing(chain_id):
+            chain_id_request = batch.add("eth_chainId", [])
+        if nonce is None:
+            nonce_request = batch.add(
+                "eth_getTransactionCount", [from_address, "latest"]
+            )
+        results = batch.execute()
+        if self._rpc_cache.is_missing(chain_id):
+            chain_id = int(results[chain_id_request], 16)
+            self._rpc_cache.store_constant("eth_chainId", chain_id)
+        if nonce is None:
+            nonce = int(results[nonce_request], 16)
+        max_fee_per_gas, max_priority_fee_per_gas = resolve_fees(results)
         return {
-            "chainId": self._web3.eth.chain_id,
-            "gas": estimated_gas,
+            "chainId": chain_id,
+            "gas": resolve_gas(results),
             "maxFeePerGas": max_fee_per_gas,
             "maxPriorityFeePerGas": max_priority_fee_per_gas,
             "to": contract_address,
-            "from": self._account.address,
+            "from": from_address,
             "nonce": nonce,
             "data": data,
         }
 
+    def _request_gas(self, batch: JsonRpcBatch, from_address, contract_address, data):
+        """Adds what the gas limit needs to the batch, returns how to read it back."""
+        if self._gas_model is not None:
+            predicted_gas = self._gas_model.predict(contract_address, data)
+            if predicted_gas is not None:
+                return lambda results: predicted_gas
+        request = batch.add(
+            "eth_estimateGas",
+            [{"to": contract_address, "from": from_address, "data": data}],
+        )
+
+        def resolve(results) -> int:
+            estimated_gas = int(results[request], 16)
+            if self._gas_model is not None:
+                self._gas_model.record(contract_address, data, estimated_gas)
+            return int(self._gas_multiplier * estimated_gas)
+
+        return resolve
+
+    def _request_fees(self, batch: JsonRpcBatch):
+        """Adds what the fees need to the batch, returns how to read them back."""
+        if self._fee_oracle is not None:
+            # Sampled once per head, whatever our own sends do to the block cache
+            if self._fee_oracle.is_fresh():
+                return lambda results: self._fee_oracle.fees()
+            request = batch.add("eth_feeHistory", self._fee_oracle.request_params())
+
+            def resolve_fee_history(results):
+                self._fee_oracle.update(results[request])
+                return self._fee_oracle.fees()
+
+            return resolve_fee_history
+        gas_price = self._rpc_cache.lookup("eth_gasPrice")
+        if not self._rpc_cache.is_missing(gas_price):
+            return lambda results: self._gas_price_fees(gas_price)
+        request = batch.add("eth_gasPrice", [])
+
+        def resolve_gas_price(results):
+            fetched_gas_price = int(results[request], 16)
+            self._rpc_cache.store("eth_gasPrice", fetched_gas_price)
+            return self._gas_price_fees(fetched_gas_price)
+
+        return resolve_gas_price
+
     def estimate_gas(self, contract_address, data) -> int:
         return int(
             self._gas_multiplier
@@ -52,8 +378,78 @@ class TransactionExecutor:
             )
         )
 
-    def read(self, contract, data) -> HexBytes:
-        return self._web3.eth.call({"to": contract, "data": data})
+    def read(self, contract, data, block_identifier=None) -> HexBytes:
+        with self._measure("read", contract, data):
+            if block_identifier is None:
+                return self._read_current(contract, data)
+            return self._read_at(contract, data, block_identifier)
+
+    def _read_current(self, contract, data) -> HexBytes:
+        batch = ReadBatch.current()
+        if batch is not None and batch.web3() is not self._web3:
+            batch = None
+        if batch is not None and batch.block_identifier() is not None:
+            return self._read_at(contract, data, batch.block_identifier())
+        return self._rpc_cache.block_scoped(
+            ("eth_call", contract, HexBytes(data)),
+            lambda: self._read(batch, contract, data),
+        )
+
+    def _read_at(self, contract, data, block_identifier) -> HexBytes:
+        cache_key = None
+        if self._read_cache is not None and self._read_cache.is_final(
+            block_identifier, lambda: self._web3.eth.get_block("finalized")["number"]
+        ):
+            block = block_identifier
+            if not isinstance(block, int):
+                block = HexBytes(block).to_0x_hex()
+            cache_key = ImmutableReadCache.key(self.chain_id(), block, contract, data)
+            result = self._read_cache.get(cache_key)
+            if result is not None:
+                return result
+        batch = ReadBatch.current()
+        if (
+            batch is not None
+            and batch.web3() is self._web3
+            and batch.block_identifier() == block_identifier
+        ):
+            result = batch.read(contract, data)
+        else:
+            result = self._call(contract, data, block_identifier)
+        if cache_key is not None:
+            self._read_cache.put(cache_key, result)
+        return result
+
+    def read_raw(self, contract, data, block_identifier="latest") -> memoryview:
+        """eth_call returning a memoryview of the result, bypassing batching and caches."""
+        with self._measure("read_raw", contract, data):
+            return self._raw_rpc.call(contract, data, block_identifier)
+
+    def _measure(self, kind: str, contract, data):
+        if self._metrics is None:
+            return nullcontext()
+        return self._metrics.measure(
+            RpcMetrics.CONTRACT, (kind, contract, self._metrics.function_label(data))
+        )
+
+    def _read(self, batch: Optional[ReadBatch], contract, data) -> HexBytes:
+        if batch is not None:
+            return batch.read(contract, data)
+        if self._read_coalescer is not None:
+            return self._read_coalescer.read(contract, data)
+        return self._call(contract, data)
+
+    def _call(self, contract, data, block_identifier=None) -> HexBytes:
+        """Unbatched reads skip web3's request formatting and go out as raw bytes."""
+        return HexBytes(self._raw_rpc.call(contract, data, block_identifier))
+
+    def batch(self, block_identifier=None) -> ReadBatch:
+        return ReadBatch(self._web3, self._multicall, block_identifier)
+
+    def _gas_price_fees(self, gas_price):
+        return self.calculate_max_fee_per_gas(gas_price), self.get_max_priority_fee(
+            gas_price
+        )
 
     def calculate_max_fee_per_gas(self, gas_price):
         return gas_price + self.percent_of(gas_price, self.GAS_PRICE_MARGIN)
@@ -68,18 +464,59 @@ class TransactionExecutor:
     def get_logs(
         self, contract_address: str, topics: List[str], from_block=0, to_block="latest"
     ) -> List[LogReceipt]:
-        event_filter = self._web3.eth.filter(
-            {
-                "fromBlock": from_block,
-                "toBlock": to_block,
-                "address": contract_address,
-                "topics": topics,
-            }
+        return list(self.iter_logs(contract_address, topics, from_block, to_block))
+
+    def iter_logs(
+        self, contract_address: str, topics: List[str], from_block=0, to_block="latest"
+    ) -> Iterator[LogReceipt]:
+        if (
+            self._event_store is not None
+            and len(topics) == 1
+            and from_block == 0
+            and to_block == "latest"
+        ):
+            return self._iter_stored_logs(contract_address, topics[0])
+        return self._log_fetcher.iter_logs(
+            contract_address, topics, from_block, to_block
         )
-        return event_filter.get_all_entries()
+
+    def _iter_stored_logs(self, contract_address: str, topic0: str):
+        chain_id = self.chain_id()
+        head = self._web3.eth.block_number
+        confirmed_block = head - self._event_store.confirmations()
+        last_synced_block = self._event_store.last_synced_block(
+            chain_id, contract_address, topic0
+        )
+        start = 0 if last_synced_block is None else last_synced_block + 1
+        yield from self._event_store.load(chain_id, contract_address, topic0)
+        if start <= confirmed_block:
+            new_logs = self._log_fetcher.get_logs(
+                contract_address, [topic0], start, confirmed_block
+            )
+            self._event_store.store(
+                chain_id, contract_address, topic0, new_logs, confirmed_block
+            )
+            yield from new_logs
+            start = confirmed_block + 1
+        # Blocks that can still be reorged are fetched every time, never stored
+        yield from self._log_fetcher.iter_logs(contract_address, [topic0], start, head)
+
+    def block_number(self, block_identifier="latest") -> int:
+        """Resolves a block tag or hash to a number, to pin several reads to it."""
+        if isinstance(block_identifier, int):
+            return block_identifier
+        if block_identifier in {None, "latest"}:
+            return self._web3.eth.block_number
+        return self._web3.eth.get_block(block_identifier)["number"]
 
     def chain_id(self):
-        return self._web3.eth.chain_id
+        return self._rpc_cache.constant("eth_chainId", lambda: self._web3.eth.chain_id)
+
+    def metrics(self) -> Optional[RpcMetrics]:
+        return self._metrics
+
+    def cache_stats(self) -> RpcCacheStats:
+        return self._rpc_cache.stats()
 
     def prank(self, account: str):
         raise NotImplementedError("Use CheatingTransactionExecutor for pranks")
@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt, TxParams
+
+from ipor_fusion.ReceiptWatcher import ReceiptWatcher
+
+
+class TransactionHandle:
+    """
+    Broadcast transaction returned by TransactionExecutor.submit. Replacements (fee
+    bumps, cancellations) with the same nonce are added as new versions; the handle
+    resolves with whichever version gets mined.
+    """
+
+    DEFAULT_TIMEOUT = 120
+    POLL_INTERVAL = 0.25
+
+    def __init__(
+        self,
+        receipt_watcher: ReceiptWatcher,
+        tx_hash: HexBytes,
+        transaction: TxParams,
+        on_receipt: Optional[Callable[["TransactionHandle", TxReceipt], None]] = None,
+    ):
+        self._receipt_watcher = receipt_watcher
+        self._on_receipt = on_receipt
+        self._lock = threading.Lock()
+        self._versions: List[Tuple[HexBytes, TxParams]] = []
+        self._mined: Optional[Tuple[HexBytes, TxParams]] = None
+        self._receipt = None
+        self._resolved = threading.Event()
+        self.replace(tx_hash, transaction)
+
+    def tx_hash(self) -> HexBytes:
+        """Hash of the mined version once known, otherwise of the latest broadcast."""
+        return self._current()[0]
+
+    def nonce(self) -> int:
+        return self._current()[1]["nonce"]
+
+    def transaction(self) -> TxParams:
+        return self._current()[1]
+
+    def versions(self) -> List[HexBytes]:
+        with self._lock:
+            return [tx_hash for tx_hash, _ in self._versions]
+
+    def replace(self, tx_hash: HexBytes, transaction: TxParams):
+        """Adds a broadcast version of this transaction with the same nonce."""
+        tx_hash = HexBytes(tx_hash)
+        self._receipt_watcher.watch(tx_hash)
+        with self._lock:
+            self._versions.append((tx_hash, transaction))
+
+    def is_mined(self) -> bool:
+        return self._receipt is not None or self._find_mined() is not None
+
+    def wait(self, timeout: float = DEFAULT_TIMEOUT) -> TxReceipt:
+        receipt = self.receipt(timeout)
+        assert receipt["status"] == 1, "Transaction failed"
+        return receipt
+
+    def receipt(self, timeout: float = DEFAULT_TIMEOUT) -> TxReceipt:
+        """Mined receipt, whatever its status."""
+        with self._lock:
+            resolving = self._receipt is not None
+        if resolving:
+            self._resolved.wait()
+            return self._receipt
+        deadline = time.monotonic() + timeout
+        while True:
+            mined = self._find_mined()
+            if mined is not None:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeExhausted(
+                    f"Transaction {self.tx_hash().to_0x_hex()} is not in the chain "
+                    f"after {timeout} seconds"
+                )
+            newest_hash = self.versions()[-1]
+            self._receipt_watcher.watch(newest_hash).wait(
+                min(remaining, self.POLL_INTERVAL)
+            )
+        version, receipt = mined
+        with self._lock:
+            versions = None
+            if self._receipt is None:
+                self._mined = version
+                self._receipt = receipt
+                versions = list(self._versions)
+        if versions is None:
+            # Another thread (the watcher or a waiter) resolves the handle
+            self._resolved.wait()
+            return self._receipt
+        try:
+            # The other versions can never be mined with this nonce taken
+            for tx_hash, _ in versions:
+                self._receipt_watcher.forget(tx_hash)
+            if self._on_receipt is not None:
+                self._on_receipt(self, receipt)
+        finally:
+            self._resolved.set()
+        return receipt
+
+    def _find_mined(self):
+        with self._lock:
+            versions = list(self._versions)
+        for version in versions:
+            receipt = self._receipt_watcher.receipt(version[0])
+            if receipt is not None:
+                return version, receipt
+        return None
+
+    def _current(self) -> Tuple[HexBytes, TxParams]:
+        with self._lock:
+            return self._mined or self._versions[-1]
+
+    def __repr__(self) -> str:
+        return (
+            f"TransactionHandle(tx_hash={self.tx_hash().to_0x_hex()}, "
+            f"nonce={self.nonce()})"
+        )
@@ -0,0 +1,102 @@
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+from hexbytes import HexBytes
+from web3.types import TxParams
+
+from ipor_fusion.TransactionHandle import TransactionHandle
+
+log = logging.getLogger(__name__)
+
+
+class TransactionLifecycle:
+    """
+    Follows submitted transactions block by block. A transaction still pending
+    `replace_after_blocks` after its last broadcast is sent again with the same nonce
+    and fees bumped by FEE_BUMP_PERCENT, up to `max_replacements` times. Cancelling
+    replaces it with a zero-value transfer to the sender. The handle resolves with
+    whichever version is mined.
+    """
+
+    FEE_BUMP_PERCENT = 13
+    CANCEL_GAS = 21_000
+    DEFAULT_MAX_REPLACEMENTS = 5
+
+    def __init__(
+        self,
+        send: Callable[[TxParams], HexBytes],
+        replace_after_blocks: Optional[int] = None,
+        max_replacements: int = DEFAULT_MAX_REPLACEMENTS,
+    ):
+        self._send = send
+        self._replace_after_blocks = replace_after_blocks
+        self._max_replacements = max_replacements
+        self._lock = threading.Lock()
+        # handle -> (block of the last broadcast, replacements sent)
+        self._tracked: Dict[TransactionHandle, list] = {}
+        self._block_number: Optional[int] = None
+
+    def track(self, handle: TransactionHandle) -> TransactionHandle:
+        with self._lock:
+            self._tracked[handle] = [self._block_number, 0]
+        return handle
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._tracked)
+
+    def on_block(self, block_number: int):
+        with self._lock:
+            self._block_number = block_number
+            tracked = list(self._tracked.items())
+        for handle, state in tracked:
+            if handle.is_mined():
+                # Resolves the handle, so the versions that lost stop being watched
+                handle.receipt(0)
+                with self._lock:
+                    self._tracked.pop(handle, None)
+                continue
+            if self._replace_after_blocks is None:
+                continue
+            sent_at, replacements = state
+            if sent_at is None:
+                state[0] = block_number
+            elif (
+                block_number - sent_at >= self._replace_after_blocks
+                and replacements < self._max_replacements
+            ):
+                try:
+                    self.speed_up(handle)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    # Typically "nonce too low": a version got mined in the meantime
+                    log.warning("Replacing %s failed: %s", handle, e)
+                state[0] = block_number
+                state[1] = replacements + 1
+
+    def speed_up(self, handle: TransactionHandle) -> HexBytes:
+        """Broadcasts the latest version again with bumped fees."""
+        return self._replace(handle, self.bumped(handle.transaction()))
+
+    def cancel(self, handle: TransactionHandle) -> HexBytes:
+        """Replaces the transaction with a zero-value transfer to the sender."""
+        transaction = self.bumped(handle.transaction())
+        transaction.update(
+            {"to": transaction["from"], "data": b"", "value": 0, "gas": self.CANCEL_GAS}
+        )
+        return self._replace(handle, transaction)
+
+    def bumped(self, transaction: TxParams) -> TxParams:
+        transaction = dict(transaction)
+        for field in ("maxFeePerGas", "maxPriorityFeePerGas"):
+            fee = transaction[field]
+            transaction[field] = fee + fee * self.FEE_BUMP_PERCENT // 100 + 1
+        return transaction
+
+    def _replace(self, handle: TransactionHandle, transaction: TxParams) -> HexBytes:
+        tx_hash = self._send(transaction)
+        handle.replace(tx_hash, transaction)
+        with self._lock:
+            if handle in self._tracked:
+                self._tracked[handle][0] = self._block_number
+        return tx_hash
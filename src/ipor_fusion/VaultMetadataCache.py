@@ -0,0 +1,75 @@
+import json
+import sqlite3
+import threading
+from typing import Callable, Optional, Tuple
+
+
+class VaultMetadataCache:
+    """
+    SQLite store of vault metadata (as a JSON object) together with the block it was
+    read at, and of token decimals. Vault entries are revalidated by the reader from
+    change events emitted after that block; decimals never change once read.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS vaults (
+                    chain_id INTEGER NOT NULL,
+                    vault TEXT NOT NULL,
+                    block_number INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (chain_id, vault)
+                )
+                """
+            )
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS decimals (
+                    chain_id INTEGER NOT NULL,
+                    token TEXT NOT NULL,
+                    decimals INTEGER NOT NULL,
+                    PRIMARY KEY (chain_id, token)
+                )
+                """
+            )
+
+    def load_vault(self, chain_id: int, vault: str) -> Optional[Tuple[int, dict]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT block_number, data FROM vaults WHERE chain_id = ? AND vault = ?",
+                (chain_id, vault.lower()),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def store_vault(self, chain_id: int, vault: str, block_number: int, data: dict):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO vaults VALUES (?, ?, ?, ?)",
+                (chain_id, vault.lower(), block_number, json.dumps(data)),
+            )
+
+    def decimals(self, chain_id: int, token: str, fetch: Callable[[], int]) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT decimals FROM decimals WHERE chain_id = ? AND token = ?",
+                (chain_id, token.lower()),
+            ).fetchone()
+        if row is not None:
+            return row[0]
+        decimals = fetch()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO decimals VALUES (?, ?, ?)",
+                (chain_id, token.lower(), decimals),
+            )
+        return decimals
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
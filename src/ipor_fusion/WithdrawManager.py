@@ -1,7 +1,7 @@
 from eth_abi import encode, decode
-from eth_utils import function_signature_to_4byte_selector
 from web3.types import TxReceipt
 
+from ipor_fusion.Selectors import Selectors
 from ipor_fusion.TransactionExecutor import TransactionExecutor
 
 
@@ -23,7 +23,7 @@ class WithdrawManager:
         )
 
     def update_withdraw_window(self, window: int):
-        selector = function_signature_to_4byte_selector("updateWithdrawWindow(uint256)")
+        selector = Selectors.UPDATE_WITHDRAW_WINDOW
         function = selector + encode(["uint256"], [window])
         return self._transaction_executor.execute(
             self._withdraw_manager_address, function
@@ -31,19 +31,19 @@ class WithdrawManager:
 
     @staticmethod
     def __request(to_withdraw: int) -> bytes:
-        selector = function_signature_to_4byte_selector("request(uint256)")
+        selector = Selectors.REQUEST
         return selector + encode(["uint256"], [to_withdraw])
 
     def release_funds(self):
-        selector = function_signature_to_4byte_selector("releaseFunds()")
+        selector = Selectors.RELEASE_FUNDS
         return self._transaction_executor.execute(
             self._withdraw_manager_address, selector
         )
 
-    def get_withdraw_window(self) -> int:
-        signature = function_signature_to_4byte_selector("getWithdrawWindow()")
+    def get_withdraw_window(self, block_identifier=None) -> int:
+        signature = Selectors.GET_WITHDRAW_WINDOW
         read = self._transaction_executor.read(
-            self._withdraw_manager_address, signature
+            self._withdraw_manager_address, signature, block_identifier
         )
         (result,) = decode(["uint256"], read)
         return result
@@ -1,8 +1,8 @@
-from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
-
-from ipor_fusion.MarketId import MarketId
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.fuse.FuseActionTemplate import FuseActionTemplate
+from ipor_fusion.MarketId import MarketId
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 class AaveV3SupplyFuse:
@@ -27,6 +27,13 @@ class AaveV3SupplyFuse:
             self.fuse_address, aave_v3_supply_fuse_enter_data.function_call()
         )
 
+    def supply_template(self, market_id: MarketId) -> FuseActionTemplate:
+        """Template of `supply` with an `amount` field."""
+        action = self.supply(market_id, 0)
+        return FuseActionTemplate(
+            [action], {"amount": (0, AaveV3SupplyFuseEnterData.AMOUNT_OFFSET)}
+        )
+
     def withdraw(self, market_id: MarketId, amount: int) -> FuseAction:
         aave_v3_supply_fuse_exit_data = AaveV3SupplyFuseExitData(
             market_id.market_id, amount
@@ -37,36 +44,40 @@ class AaveV3SupplyFuse:
 
 
 class AaveV3SupplyFuseEnterData:
+    _encoder = StaticEncoder("(address,uint256,uint256)")
+    AMOUNT_OFFSET = 4 + 32
+
     def __init__(self, asset: str, amount: int, user_e_mode_category_id: int):
         self.asset = asset
         self.amount = amount
         self.user_e_mode_category_id = user_e_mode_category_id
 
     def encode(self) -> bytes:
-        return encode(
-            ["address", "uint256", "uint256"],
-            [self.asset, self.amount, self.user_e_mode_category_id],
+        return self._encoder.encode(
+            [self.asset, self.amount, self.user_e_mode_category_id]
         )
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("enter((address,uint256,uint256))")
+        return Selectors.AAVE_V3_SUPPLY_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
 
 
 class AaveV3SupplyFuseExitData:
+    _encoder = StaticEncoder("(address,uint256)")
+
     def __init__(self, asset: str, amount: int):
         self.asset = asset
         self.amount = amount
 
     def encode(self) -> bytes:
-        return encode(["address", "uint256"], [self.asset, self.amount])
+        return self._encoder.encode([self.asset, self.amount])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("exit((address,uint256))")
+        return Selectors.AAVE_V3_SUPPLY_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,8 +1,7 @@
-from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
-
-from ipor_fusion.MarketId import MarketId
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.MarketId import MarketId
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 class CompoundV3SupplyFuse:
@@ -31,32 +30,36 @@ class CompoundV3SupplyFuse:
 
 
 class CompoundV3SupplyFuseEnterData:
+    _encoder = StaticEncoder("(address,uint256)")
+
     def __init__(self, asset: str, amount: int):
         self.asset = asset
         self.amount = amount
 
     def encode(self) -> bytes:
-        return encode(["address", "uint256"], [self.asset, self.amount])
+        return self._encoder.encode([self.asset, self.amount])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("enter((address,uint256))")
+        return Selectors.COMPOUND_V3_SUPPLY_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
 
 
 class CompoundV3SupplyFuseExitData:
+    _encoder = StaticEncoder("(address,uint256)")
+
     def __init__(self, asset: str, amount: int):
         self.asset = asset
         self.amount = amount
 
     def encode(self) -> bytes:
-        return encode(["address", "uint256"], [self.asset, self.amount])
+        return self._encoder.encode([self.asset, self.amount])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("exit((address,uint256))")
+        return Selectors.COMPOUND_V3_SUPPLY_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,10 +1,10 @@
 from typing import List
 
-from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.FuseAction import FuseAction
 from ipor_fusion.MarketId import MarketId
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 class Erc4626SupplyFuse:
@@ -32,32 +32,37 @@ class Erc4626SupplyFuse:
 
 
 class Erc4626SupplyFuseEnterData:
+    _encoder = StaticEncoder("(address,uint256)")
+    AMOUNT_OFFSET = 4 + 32
+
     def __init__(self, address: str, amount: int):
         self.address = address
         self.amount = amount
 
     def encode(self) -> bytes:
-        return encode(["address", "uint256"], [self.address, self.amount])
+        return self._encoder.encode([self.address, self.amount])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("enter((address,uint256))")
+        return Selectors.ERC4626_SUPPLY_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
 
 
 class Erc4626SupplyFuseExitData:
+    _encoder = StaticEncoder("(address,uint256)")
+
     def __init__(self, address: str, amount: int):
         self.address = address
         self.amount = amount
 
     def encode(self) -> bytes:
-        return encode(["address", "uint256"], [self.address, self.amount])
+        return self._encoder.encode([self.address, self.amount])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("exit((address,uint256))")
+        return Selectors.ERC4626_SUPPLY_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,7 +1,5 @@
 from typing import List
 
-from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.Erc4626SupplyFuse import (
     Erc4626SupplyFuseExitData,
@@ -9,6 +7,8 @@ from ipor_fusion.fuse.Erc4626SupplyFuse import (
 )
 from ipor_fusion.fuse.FuseAction import FuseAction
 from ipor_fusion.MarketId import MarketId
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 # Assuming the MarketId, Fuse, and FuseActionDynamicStruct classes are defined as per previous translations
@@ -94,36 +94,40 @@ class FluidInstadappSupplyFuse:
 
 
 class FluidInstadappStakingSupplyFuseEnterData:
+    _encoder = StaticEncoder("(uint256,address)")
+
     def __init__(self, fluid_token_amount: int, staking_pool_address: str):
         self.fluid_token_amount = fluid_token_amount
         self.staking_pool_address = staking_pool_address
 
     def encode(self) -> bytes:
-        return encode(
-            ["uint256", "address"], [self.fluid_token_amount, self.staking_pool_address]
+        return self._encoder.encode(
+            [self.fluid_token_amount, self.staking_pool_address]
         )
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("enter((uint256,address))")
+        return Selectors.FLUID_INSTADAPP_SUPPLY_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
 
 
 class FluidInstadappStakingSupplyFuseExitData:
+    _encoder = StaticEncoder("(uint256,address)")
+
     def __init__(self, fluid_token_amount: int, staking_pool_address: str):
         self.fluid_token_amount = fluid_token_amount
         self.staking_pool_address = staking_pool_address
 
     def encode(self) -> bytes:
-        return encode(
-            ["uint256", "address"], [self.fluid_token_amount, self.staking_pool_address]
+        return self._encoder.encode(
+            [self.fluid_token_amount, self.staking_pool_address]
         )
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("exit((uint256,address))")
+        return Selectors.FLUID_INSTADAPP_SUPPLY_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
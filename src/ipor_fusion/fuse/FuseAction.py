@@ -2,6 +2,11 @@ from typing import List
 
 from eth_abi import encode
 
+from ipor_fusion.StaticEncoder import StaticEncoder
+
+ARRAY_OFFSET = (32).to_bytes(32, "big")
+DATA_OFFSET = (64).to_bytes(32, "big")
+
 
 class FuseAction:
     def __init__(self, fuse: str, data: bytes):
@@ -14,6 +19,28 @@ class FuseAction:
         """
         return encode(["address", "bytes"], [self.fuse, self.data])
 
+    @staticmethod
+    def encode_many(actions: List["FuseAction"]) -> bytes:
+        """
+        Actions as one ABI-encoded (address,bytes)[] argument, packed word by word;
+        identical to eth_abi.encode(["(address,bytes)[]"], ...).
+        """
+        heads = []
+        tails = []
+        offset = 32 * len(actions)
+        for action in actions:
+            data = bytes(action.data)
+            padded = data + bytes(-len(data) % 32)
+            heads.append(offset.to_bytes(32, "big"))
+            tails.append(StaticEncoder.address(action.fuse))
+            tails.append(DATA_OFFSET)
+            tails.append(len(data).to_bytes(32, "big"))
+            tails.append(padded)
+            offset += 96 + len(padded)
+        return b"".join(
+            [ARRAY_OFFSET, len(actions).to_bytes(32, "big"), *heads, *tails]
+        )
+
     def __str__(self) -> str:
         return f"FuseActionDynamicStruct(fuse={self.fuse}, data={self.data.hex()})"
 
@@ -0,0 +1,50 @@
+from typing import Dict, List, Tuple
+
+from ipor_fusion.StaticEncoder import StaticEncoder
+from ipor_fusion.fuse.FuseAction import FuseAction
+
+
+class FuseActionTemplate:
+    """
+    Fuse actions encoded once, with named uint256 fields patched in place at fixed
+    byte offsets of preallocated buffers. Building actions for a new value copies the
+    buffers instead of ABI-encoding again. A template is not thread-safe; use one per
+    thread.
+
+    template = aave_v3_market.supply_template()
+    actions = [template.action(amount=amount) for amount in candidates]
+    """
+
+    def __init__(self, actions: List[FuseAction], fields: Dict[str, Tuple[int, int]]):
+        """`fields` maps a name to (action index, byte offset in its data)."""
+        self._fuses = [action.fuse for action in actions]
+        self._buffers = [bytearray(action.data) for action in actions]
+        for name, (index, offset) in fields.items():
+            if offset < 0 or offset + 32 > len(self._buffers[index]):
+                raise ValueError(f"Field {name} at {offset} is outside action {index}")
+        self._fields = fields
+
+    def fields(self) -> List[str]:
+        return list(self._fields)
+
+    def set(self, **values: int) -> "FuseActionTemplate":
+        for name, value in values.items():
+            field = self._fields.get(name)
+            if field is None:
+                raise ValueError(f"Unknown template field {name}")
+            index, offset = field
+            self._buffers[index][offset : offset + 32] = StaticEncoder.uint(value)
+        return self
+
+    def actions(self, **values: int) -> List[FuseAction]:
+        self.set(**values)
+        return [
+            FuseAction(fuse, bytes(buffer))
+            for fuse, buffer in zip(self._fuses, self._buffers)
+        ]
+
+    def action(self, **values: int) -> FuseAction:
+        if len(self._buffers) != 1:
+            raise ValueError("Template holds several actions, use actions()")
+        self.set(**values)
+        return FuseAction(self._fuses[0], bytes(self._buffers[0]))
@@ -1,7 +1,6 @@
-from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
-
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 class GearboxStakeFuse:
@@ -23,32 +22,36 @@ class GearboxStakeFuse:
 
 
 class GearboxV3FarmdSupplyFuseEnterData:
+    _encoder = StaticEncoder("(uint256,address)")
+
     def __init__(self, d_token_amount: int, farmd_token: str):
         self.d_token_amount = d_token_amount
         self.farmd_token = farmd_token
 
     def encode(self) -> bytes:
-        return encode(["uint256", "address"], [self.d_token_amount, self.farmd_token])
+        return self._encoder.encode([self.d_token_amount, self.farmd_token])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("enter((uint256,address))")
+        return Selectors.GEARBOX_STAKE_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
 
 
 class GearboxV3FarmdSupplyFuseExitData:
+    _encoder = StaticEncoder("(uint256,address)")
+
     def __init__(self, d_token_amount: int, farmd_token: str):
         self.d_token_amount = d_token_amount
         self.farmd_token = farmd_token
 
     def encode(self) -> bytes:
-        return encode(["uint256", "address"], [self.d_token_amount, self.farmd_token])
+        return self._encoder.encode([self.d_token_amount, self.farmd_token])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("exit((uint256,address))")
+        return Selectors.GEARBOX_STAKE_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,14 +1,15 @@
 from typing import List
 
-from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.MarketId import MarketId
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 from ipor_fusion.fuse.Erc4626SupplyFuse import (
     Erc4626SupplyFuseExitData,
     Erc4626SupplyFuseEnterData,
 )
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.fuse.FuseActionTemplate import FuseActionTemplate
 
 
 class GearboxSupplyFuse:
@@ -61,6 +62,13 @@ class GearboxSupplyFuse:
             ),
         ]
 
+    def supply_and_stake_template(self, market_id: MarketId) -> FuseActionTemplate:
+        """Template of `supply_and_stake` with an `amount` field."""
+        actions = self.supply_and_stake(market_id, 0)
+        return FuseActionTemplate(
+            actions, {"amount": (0, Erc4626SupplyFuseEnterData.AMOUNT_OFFSET)}
+        )
+
     def unstake_and_withdraw(
         self, market_id: MarketId, amount: int
     ) -> List[FuseAction]:
@@ -82,32 +90,36 @@ class GearboxSupplyFuse:
 
 
 class GearboxV3FarmdSupplyFuseEnterData:
+    _encoder = StaticEncoder("(uint256,address)")
+
     def __init__(self, d_token_amount: int, farmd_token: str):
         self.d_token_amount = d_token_amount
         self.farmd_token = farmd_token
 
     def encode(self) -> bytes:
-        return encode(["uint256", "address"], [self.d_token_amount, self.farmd_token])
+        return self._encoder.encode([self.d_token_amount, self.farmd_token])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("enter((uint256,address))")
+        return Selectors.GEARBOX_SUPPLY_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
 
 
 class GearboxV3FarmdSupplyFuseExitData:
+    _encoder = StaticEncoder("(uint256,address)")
+
     def __init__(self, d_token_amount: int, farmd_token: str):
         self.d_token_amount = d_token_amount
         self.farmd_token = farmd_token
 
     def encode(self) -> bytes:
-        return encode(["uint256", "address"], [self.d_token_amount, self.farmd_token])
+        return self._encoder.encode([self.d_token_amount, self.farmd_token])
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("exit((uint256,address))")
+        return Selectors.GEARBOX_SUPPLY_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
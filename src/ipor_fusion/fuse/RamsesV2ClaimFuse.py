@@ -1,15 +1,13 @@
 from typing import List
 
 from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
 
 
 class RamsesV2ClaimFuseData:
-    _args_signature = "uint256[],address[][]"
-    _function_signature = f"claim({_args_signature})"
-    _function_selector = function_signature_to_4byte_selector(_function_signature)
+    _function_selector = Selectors.RAMSES_V2_CLAIM
     _arg_types = ["uint256[]", "address[][]"]
 
     def __init__(self, token_ids: List[int], token_rewards: List[List[str]]):
@@ -1,16 +1,15 @@
 from typing import List
 
 from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
 
 
 class RamsesV2CollectFuseEnterData:
 
     _args_signature = "(uint256[])"
-    _function_signature = f"enter({_args_signature})"
-    _function_selector = function_signature_to_4byte_selector(_function_signature)
+    _function_selector = Selectors.RAMSES_V2_COLLECT_ENTER
 
     def __init__(self, token_ids: List[int]):
         self.token_ids = token_ids
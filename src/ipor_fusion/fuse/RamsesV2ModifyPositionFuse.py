@@ -1,7 +1,6 @@
-from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
-
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 class RamsesV2ModifyPositionFuseEnterData:
@@ -9,8 +8,8 @@ class RamsesV2ModifyPositionFuseEnterData:
     _args_signature = (
         "(address,address,uint256,uint256,uint256,uint256,uint256,uint256)"
     )
-    _function_signature = f"enter({_args_signature})"
-    _function_selector = function_signature_to_4byte_selector(_function_signature)
+    _function_selector = Selectors.RAMSES_V2_MODIFY_POSITION_ENTER
+    _encoder = StaticEncoder(_args_signature)
 
     def __init__(
         self,
@@ -33,20 +32,17 @@ class RamsesV2ModifyPositionFuseEnterData:
         self.deadline = deadline
 
     def __encode(self) -> bytes:
-        return encode(
-            [self._args_signature],
+        return self._encoder.encode(
             [
-                [
-                    self.token0,
-                    self.token1,
-                    self.token_id,
-                    self.amount0_desired,
-                    self.amount1_desired,
-                    self.amount0_min,
-                    self.amount1_min,
-                    self.deadline,
-                ]
-            ],
+                self.token0,
+                self.token1,
+                self.token_id,
+                self.amount0_desired,
+                self.amount1_desired,
+                self.amount0_min,
+                self.amount1_min,
+                self.deadline,
+            ]
         )
 
     def function_call(self) -> bytes:
@@ -56,8 +52,8 @@ class RamsesV2ModifyPositionFuseEnterData:
 class RamsesV2ModifyPositionFuseExitData:
 
     _args_signature = "(uint256,uint128,uint256,uint256,uint256)"
-    _function_signature = f"exit({_args_signature})"
-    _function_selector = function_signature_to_4byte_selector(_function_signature)
+    _function_selector = Selectors.RAMSES_V2_MODIFY_POSITION_EXIT
+    _encoder = StaticEncoder(_args_signature)
 
     def __init__(
         self,
@@ -74,17 +70,14 @@ class RamsesV2ModifyPositionFuseExitData:
         self.deadline = deadline
 
     def __encode(self) -> bytes:
-        return encode(
-            [self._args_signature],
+        return self._encoder.encode(
             [
-                [
-                    self.token_id,
-                    self.liquidity,
-                    self.amount0_min,
-                    self.amount1_min,
-                    self.deadline,
-                ]
-            ],
+                self.token_id,
+                self.liquidity,
+                self.amount0_min,
+                self.amount1_min,
+                self.deadline,
+            ]
         )
 
     def function_call(self) -> bytes:
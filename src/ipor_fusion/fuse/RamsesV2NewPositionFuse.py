@@ -1,14 +1,15 @@
 from typing import List
 
 from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 class RamsesV2NewPositionFuseEnterData:
     _args_signature = "(address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,uint256,uint256)"
-    _function_signature = f"enter({_args_signature})"
+    _encoder = StaticEncoder(_args_signature)
 
     def __init__(
         self,
@@ -37,27 +38,24 @@ class RamsesV2NewPositionFuseEnterData:
         self._ve_ram_token_id = ve_ram_token_id
 
     def encode(self) -> bytes:
-        return encode(
-            [self._args_signature],
+        return self._encoder.encode(
             [
-                [
-                    self._token0,
-                    self._token1,
-                    self._fee,
-                    self._tick_lower,
-                    self._tick_upper,
-                    self._amount0_desired,
-                    self._amount1_desired,
-                    self._amount0_min,
-                    self._amount1_min,
-                    self._deadline,
-                    self._ve_ram_token_id,
-                ]
-            ],
+                self._token0,
+                self._token1,
+                self._fee,
+                self._tick_lower,
+                self._tick_upper,
+                self._amount0_desired,
+                self._amount1_desired,
+                self._amount0_min,
+                self._amount1_min,
+                self._deadline,
+                self._ve_ram_token_id,
+            ]
         )
 
     def function_selector(self) -> bytes:
-        return function_signature_to_4byte_selector(self._function_signature)
+        return Selectors.RAMSES_V2_NEW_POSITION_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -65,7 +63,6 @@ class RamsesV2NewPositionFuseEnterData:
 
 class RamsesV2NewPositionFuseExitData:
     _args_signature = "(uint256[])"
-    _function_signature = f"exit({_args_signature})"
 
     def __init__(self, token_ids: List[int]):
         self._token_ids = token_ids
@@ -74,7 +71,7 @@ class RamsesV2NewPositionFuseExitData:
         return encode([self._args_signature], [[self._token_ids]])
 
     def function_selector(self) -> bytes:
-        return function_signature_to_4byte_selector(self._function_signature)
+        return Selectors.RAMSES_V2_NEW_POSITION_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,9 +1,9 @@
 from typing import List
 
 from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
 
 
 class UniswapV3CollectFuseEnterData:
@@ -15,7 +15,7 @@ class UniswapV3CollectFuseEnterData:
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("enter((uint256[]))")
+        return Selectors.UNISWAP_V3_COLLECT_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,10 +1,13 @@
-from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
-
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 class UniswapV3ModifyPositionFuseEnterData:
+    _encoder = StaticEncoder(
+        "(address,address,uint256,uint256,uint256,uint256,uint256,uint256)"
+    )
+
     def __init__(
         self,
         token0: str,
@@ -26,33 +29,30 @@ class UniswapV3ModifyPositionFuseEnterData:
         self.deadline = deadline
 
     def encode(self) -> bytes:
-        return encode(
-            ["(address,address,uint256,uint256,uint256,uint256,uint256,uint256)"],
+        return self._encoder.encode(
             [
-                [
-                    self.token0,
-                    self.token1,
-                    self.token_id,
-                    self.amount0_desired,
-                    self.amount1_desired,
-                    self.amount0_min,
-                    self.amount1_min,
-                    self.deadline,
-                ]
-            ],
+                self.token0,
+                self.token1,
+                self.token_id,
+                self.amount0_desired,
+                self.amount1_desired,
+                self.amount0_min,
+                self.amount1_min,
+                self.deadline,
+            ]
         )
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector(
-            "enter((address,address,uint256,uint256,uint256,uint256,uint256,uint256))"
-        )
+        return Selectors.UNISWAP_V3_MODIFY_POSITION_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
 
 
 class UniswapV3ModifyPositionFuseExitData:
+    _encoder = StaticEncoder("(uint256,uint128,uint256,uint256,uint256)")
+
     def __init__(
         self,
         token_id: int,
@@ -68,24 +68,19 @@ class UniswapV3ModifyPositionFuseExitData:
         self.deadline = deadline
 
     def encode(self) -> bytes:
-        return encode(
-            ["(uint256,uint128,uint256,uint256,uint256)"],
+        return self._encoder.encode(
             [
-                [
-                    self.token_id,
-                    self.liquidity,
-                    self.amount0_min,
-                    self.amount1_min,
-                    self.deadline,
-                ]
-            ],
+                self.token_id,
+                self.liquidity,
+                self.amount0_min,
+                self.amount1_min,
+                self.deadline,
+            ]
         )
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector(
-            "exit((uint256,uint128,uint256,uint256,uint256))"
-        )
+        return Selectors.UNISWAP_V3_MODIFY_POSITION_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,12 +1,17 @@
 from typing import List
 
 from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.StaticEncoder import StaticEncoder
 
 
 class UniswapV3NewPositionFuseEnterData:
+    _encoder = StaticEncoder(
+        "(address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,uint256)"
+    )
+
     def __init__(
         self,
         token0: str,
@@ -32,31 +37,24 @@ class UniswapV3NewPositionFuseEnterData:
         self.deadline = deadline
 
     def encode(self) -> bytes:
-        return encode(
-            [
-                "(address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,uint256)"
-            ],
+        return self._encoder.encode(
             [
-                [
-                    self.token0,
-                    self.token1,
-                    self.fee,
-                    self.tick_lower,
-                    self.tick_upper,
-                    self.amount0_desired,
-                    self.amount1_desired,
-                    self.amount0_min,
-                    self.amount1_min,
-                    self.deadline,
-                ]
-            ],
+                self.token0,
+                self.token1,
+                self.fee,
+                self.tick_lower,
+                self.tick_upper,
+                self.amount0_desired,
+                self.amount1_desired,
+                self.amount0_min,
+                self.amount1_min,
+                self.deadline,
+            ]
         )
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector(
-            "enter((address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,uint256))"
-        )
+        return Selectors.UNISWAP_V3_NEW_POSITION_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -71,7 +69,7 @@ class UniswapV3NewPositionFuseExitData:
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("exit((uint256[]))")
+        return Selectors.UNISWAP_V3_NEW_POSITION_EXIT
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,8 +1,8 @@
 from eth_abi import encode
 from eth_abi.packed import encode_packed
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
 
 
 class UniswapV3SwapPathFuseEnterData:
@@ -32,7 +32,7 @@ class UniswapV3SwapFuseEnterData:
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector("enter((uint256,uint256,bytes))")
+        return Selectors.UNISWAP_V3_SWAP_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -1,9 +1,9 @@
 from typing import List
 
 from eth_abi import encode
-from eth_utils import function_signature_to_4byte_selector
 
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.Selectors import Selectors
 
 
 class UniversalTokenSwapperData:
@@ -56,9 +56,7 @@ class UniversalTokenSwapperEnterData:
 
     @staticmethod
     def function_selector() -> bytes:
-        return function_signature_to_4byte_selector(
-            "enter((address,address,uint256,(address[],bytes[])))"
-        )
+        return Selectors.UNIVERSAL_TOKEN_SWAPPER_ENTER
 
     def function_call(self) -> bytes:
         return self.function_selector() + self.encode()
@@ -8,6 +8,7 @@ from ipor_fusion.TransactionExecutor import TransactionExecutor
 from ipor_fusion.error.UnsupportedFuseError import UnsupportedFuseError
 from ipor_fusion.fuse.AaveV3SupplyFuse import AaveV3SupplyFuse
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.fuse.FuseActionTemplate import FuseActionTemplate
 
 
 class AaveV3Market:
@@ -50,6 +51,15 @@ class AaveV3Market:
         market_id = MarketId(AaveV3SupplyFuse.PROTOCOL_ID, self.USDC)
         return self._aave_v3_supply_fuse.supply(market_id, amount)
 
+    def supply_template(self) -> FuseActionTemplate:
+        if not hasattr(self, "_aave_v3_supply_fuse"):
+            raise UnsupportedFuseError(
+                "AaveV3SupplyFuse is not supported by PlasmaVault"
+            )
+
+        market_id = MarketId(AaveV3SupplyFuse.PROTOCOL_ID, self.USDC)
+        return self._aave_v3_supply_fuse.supply_template(market_id)
+
     def withdraw(self, amount: int) -> FuseAction:
         if not hasattr(self, "_aave_v3_supply_fuse"):
             raise UnsupportedFuseError(
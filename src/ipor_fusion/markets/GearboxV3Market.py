@@ -7,6 +7,7 @@ from ipor_fusion.MarketId import MarketId
 from ipor_fusion.TransactionExecutor import TransactionExecutor
 from ipor_fusion.error.UnsupportedFuseError import UnsupportedFuseError
 from ipor_fusion.fuse.FuseAction import FuseAction
+from ipor_fusion.fuse.FuseActionTemplate import FuseActionTemplate
 from ipor_fusion.fuse.GearboxSupplyFuse import GearboxSupplyFuse
 
 
@@ -67,6 +68,15 @@ class GearboxV3Market:
         market_id = MarketId(GearboxSupplyFuse.PROTOCOL_ID, self._pool.address())
         return self._gearbox_supply_fuse.supply_and_stake(market_id, amount)
 
+    def supply_and_stake_template(self) -> FuseActionTemplate:
+        if not hasattr(self, "_gearbox_supply_fuse"):
+            raise UnsupportedFuseError(
+                "GearboxSupplyFuse is not supported by PlasmaVault"
+            )
+
+        market_id = MarketId(GearboxSupplyFuse.PROTOCOL_ID, self._pool.address())
+        return self._gearbox_supply_fuse.supply_and_stake_template(market_id)
+
     def unstake_and_withdraw(self, amount: int) -> List[FuseAction]:
         if not hasattr(self, "_gearbox_supply_fuse"):
             raise UnsupportedFuseError(
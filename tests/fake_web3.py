@@ -0,0 +1,173 @@
+from types import SimpleNamespace
+
+from eth_abi import decode, encode
+from eth_account import Account
+from eth_account.typed_transactions import TypedTransaction
+from eth_utils import keccak
+from hexbytes import HexBytes
+from web3.exceptions import ContractLogicError, TransactionNotFound
+from web3.providers.async_base import AsyncBaseProvider
+
+from ipor_fusion.Multicall3 import Multicall3
+from ipor_fusion.Selectors import Selectors
+
+
+class FakeRpcError(Exception):
+    """Raised by a handler to answer with a JSON-RPC error object."""
+
+
+class FakeProvider:
+    def __init__(self, handlers=None, batch_supported=True):
+        self.handlers = handlers or {}
+        self.batch_supported = batch_supported
+        self.requests = []
+        self.batches = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        return self._respond(method, params)
+
+    def make_batch_request(self, requests):
+        if not self.batch_supported:
+            raise NotImplementedError("batch requests are not supported")
+        self.batches.append([method for method, _ in requests])
+        return [self._respond(method, params) for method, params in requests]
+
+    def methods(self):
+        return [method for method, _ in self.requests] + [
+            method for batch in self.batches for method in batch
+        ]
+
+    def _respond(self, method, params):
+        try:
+            return {"jsonrpc": "2.0", "id": 1, "result": self.handlers[method](params)}
+        except FakeRpcError as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "error": {"code": -32000, "message": str(e)},
+            }
+
+
+class FakeAsyncProvider(AsyncBaseProvider):
+    """FakeProvider behind the async provider interface AsyncWeb3 expects."""
+
+    def __init__(self, handlers=None, batch_supported=True):
+        super().__init__()
+        self.fake = FakeProvider(handlers, batch_supported)
+        self.connected = True
+
+    async def make_request(self, method, params):
+        return self.fake.make_request(method, params)
+
+    async def make_batch_request(self, requests):
+        return self.fake.make_batch_request(requests)
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def is_connected(self, show_traceback=False):
+        return self.connected
+
+
+def fake_web3(eth=None, provider=None):
+    return SimpleNamespace(eth=eth or SimpleNamespace(), provider=provider)
+
+
+def executor_provider(estimated_gas=21_000, gas_price=1_000_000_000):
+    return FakeProvider(
+        {
+            "eth_chainId": lambda params: "0x1",
+            "eth_estimateGas": lambda params: hex(estimated_gas),
+            "eth_gasPrice": lambda params: hex(gas_price),
+        }
+    )
+
+
+class FakeChainEth:
+    """
+    Chain that mines sent transactions in the next block. `outcome(transaction)`
+    gives (status, gas used), or None to leave the transaction pending. Every read of
+    block_number advances the head by one block.
+    """
+
+    account = Account
+
+    def __init__(self, outcome=None, head=100):
+        self.head = head
+        self.pending_nonce = 0
+        self.sent = []
+        self.receipt_queries = 0
+        self._receipts = {}
+        self.outcome = outcome or (lambda transaction: (1, transaction["gas"] // 2))
+
+    @property
+    def block_number(self):
+        self.head += 1
+        return self.head
+
+    def get_transaction_count(self, _address, _block_identifier):
+        return self.pending_nonce
+
+    def send_raw_transaction(self, raw_transaction):
+        transaction = TypedTransaction.from_bytes(HexBytes(raw_transaction)).as_dict()
+        tx_hash = HexBytes(keccak(HexBytes(raw_transaction)))
+        self.sent.append(transaction)
+        outcome = self.outcome(transaction)
+        if outcome is not None:
+            status, gas_used = outcome
+            self._receipts[tx_hash] = {
+                "transactionHash": tx_hash,
+                "blockNumber": self.head + 1,
+                "status": status,
+                "gasUsed": gas_used,
+                "effectiveGasPrice": transaction["maxFeePerGas"],
+            }
+        return tx_hash
+
+    def get_transaction_receipt(self, tx_hash):
+        self.receipt_queries += 1
+        receipt = self._receipts.get(HexBytes(tx_hash))
+        if receipt is None or receipt["blockNumber"] > self.head:
+            raise TransactionNotFound(f"{HexBytes(tx_hash).to_0x_hex()} not mined")
+        return receipt
+
+
+class FakeMulticallEth:
+    """
+    eth module answering eth_call with `answer(target, calldata)`, which returns the
+    result bytes or raises ContractLogicError. Multicall3 aggregate3 calls are
+    unpacked and answered call by call. `calls` records (target, calldata, block) of
+    every answered call, `requests` the block of every eth_call.
+    """
+
+    def __init__(self, answer, head=100):
+        self.answer = answer
+        self.block_number = head
+        self.calls = []
+        self.requests = []
+
+    def call(self, transaction, block_identifier=None):
+        self.requests.append(block_identifier)
+        data = bytes(transaction["data"])
+        if transaction["to"] != Multicall3.MULTICALL3_ADDRESS:
+            return self._answer(transaction["to"], data, block_identifier)
+        if data[:4] != Selectors.AGGREGATE3:
+            raise ValueError(f"Unexpected multicall {data[:4].hex()}")
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        results = []
+        for target, _, call_data in calls:
+            try:
+                results.append(
+                    [True, self._answer(target, call_data, block_identifier)]
+                )
+            except ContractLogicError:
+                results.append([False, b""])
+        return encode(["(bool,bytes)[]"], [results])
+
+    def _answer(self, target, data, block_identifier):
+        self.calls.append((target.lower(), bytes(data), block_identifier))
+        return self.answer(target.lower(), bytes(data))
@@ -0,0 +1,130 @@
+import asyncio
+
+from eth_abi import encode
+from eth_account import Account
+from web3 import AsyncWeb3
+
+from fake_web3 import FakeAsyncProvider, FakeRpcError
+from ipor_fusion.AsyncERC20 import AsyncERC20
+from ipor_fusion.AsyncPlasmaVaultSystemFactory import AsyncPlasmaVaultSystemFactory
+from ipor_fusion.AsyncTransactionExecutor import AsyncTransactionExecutor
+from ipor_fusion.Selectors import Selectors
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+ASSET = "0xaf88d065e77c8cC2239327C5EDb3A432268e5831"
+MANAGER = "0x1F7bc4dA1a0c2e49d7eF542F74CD46a3FE592cb1"
+KEY = "0x" + "11" * 32
+ACCOUNT = Account.from_key(KEY)  # pylint: disable=no-value-for-parameter
+ANSWERS = {
+    Selectors.BALANCE_OF: encode(["uint256"], [7]),
+    Selectors.GET_ACCESS_MANAGER_ADDRESS: encode(["address"], [MANAGER]),
+    Selectors.ASSET: encode(["address"], [ASSET]),
+    Selectors.GET_REWARDS_CLAIM_MANAGER_ADDRESS: encode(["address"], [MANAGER]),
+    Selectors.GET_FUSES: encode(["address[]"], [[MANAGER]]),
+}
+
+
+def answer(params):
+    return "0x" + ANSWERS[bytes.fromhex(params[0]["data"][2:10])].hex()
+
+
+def logs_handler(max_range):
+    def get_logs(params):
+        start, end = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+        if end - start + 1 > max_range:
+            raise FakeRpcError("query returned more than 10000 results")
+        return [log(number) for number in range(start, end + 1) if number % 250 == 0]
+
+    return get_logs
+
+
+def log(block_number):
+    return {
+        "address": VAULT,
+        "topics": [],
+        "data": "0x",
+        "blockNumber": hex(block_number),
+        "blockHash": "0x" + "ab" * 32,
+        "transactionHash": "0x" + "cd" * 32,
+        "transactionIndex": "0x0",
+        "logIndex": "0x0",
+        "removed": False,
+    }
+
+
+def async_executor(handlers):
+    provider = FakeAsyncProvider({"eth_chainId": lambda params: "0xa4b1", **handlers})
+    return AsyncTransactionExecutor(AsyncWeb3(provider), ACCOUNT), provider.fake
+
+
+def test_should_read_at_block():
+    executor, provider = async_executor({"eth_call": answer})
+
+    balance = asyncio.run(AsyncERC20(executor, ASSET).balance_of(MANAGER, 255))
+
+    assert balance == 7
+    calls = [params for method, params in provider.requests if method == "eth_call"]
+    assert [params[1] for params in calls] == ["0xff"]
+
+
+def test_should_prepare_transaction_in_one_batch():
+    executor, provider = async_executor(
+        {
+            "eth_gasPrice": lambda params: hex(10**9),
+            "eth_estimateGas": lambda params: hex(21_000),
+            "eth_getTransactionCount": lambda params: "0x5",
+        }
+    )
+
+    transaction = asyncio.run(executor.prepare_transaction(VAULT, b"\x01"))
+
+    assert provider.batches == [
+        ["eth_gasPrice", "eth_estimateGas", "eth_chainId", "eth_getTransactionCount"]
+    ]
+    assert (transaction["nonce"], transaction["chainId"]) == (5, 42161)
+    assert transaction["gas"] == int(1.25 * 21_000)
+
+
+def test_should_fetch_logs_at_once_and_split_only_rejected_ranges():
+    executor, provider = async_executor(
+        {
+            "eth_blockNumber": lambda params: hex(3_000_000),
+            "eth_getLogs": logs_handler(max_range=10_000_000),
+        }
+    )
+
+    logs = asyncio.run(executor.get_logs(VAULT, []))
+    assert len(logs) == 12_001
+    assert provider.methods().count("eth_getLogs") == 1
+
+    executor, provider = async_executor({"eth_getLogs": logs_handler(1_000)})
+    logs = asyncio.run(executor.get_logs(VAULT, [], 0, 3_999))
+    assert [log["blockNumber"] for log in logs] == list(range(0, 4_000, 250))
+    assert provider.methods().count("eth_getLogs") == 7
+
+
+def test_should_wire_factory_without_sync_providers(monkeypatch):
+    provider = FakeAsyncProvider(
+        {
+            "eth_chainId": lambda params: "0xa4b1",
+            "eth_call": answer,
+            "eth_blockNumber": lambda params: "0x64",
+            "eth_getLogs": lambda params: [],
+        }
+    )
+
+    async def connect(*_args):
+        return AsyncWeb3(provider)
+
+    monkeypatch.setattr(AsyncTransactionExecutor, "connect", connect)
+    factory = AsyncPlasmaVaultSystemFactory("http://127.0.0.1:8545", KEY)
+
+    system = asyncio.run(factory.get(VAULT))
+
+    assert system.chain_id() == 42161
+    assert system.access_manager()._access_manager_address == MANAGER
+    assert system.fuses() == [MANAGER]
+    assert system.usdc()._asset_address == ASSET
+    assert system.alpha() == ACCOUNT.address
+    asyncio.run(factory.close())
+    assert not provider.connected
@@ -0,0 +1,110 @@
+import importlib.util
+
+from eth_abi import encode
+from eth_utils import event_signature_to_log_topic
+
+from ipor_fusion.BindingGenerator import BindingGenerator
+from ipor_fusion.Selectors import Selectors
+
+ABI = [
+    {
+        "type": "function",
+        "name": "totalAssetsInMarket",
+        "inputs": [{"name": "marketId_", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "execute",
+        "inputs": [
+            {
+                "name": "calls_",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "fuse", "type": "address"},
+                    {"name": "data", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+]
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+FUSE = "0x0000000000000000000000000000000000000001"
+
+
+class FakeTransactionExecutor:
+    def __init__(self):
+        self.calls = []
+
+    def read(self, contract, data, block_identifier=None):
+        self.calls.append(("read", contract, data, block_identifier))
+        return encode(["uint256"], [42])
+
+    def execute(self, contract, data):
+        self.calls.append(("execute", contract, data))
+
+
+def load_binding(tmp_path, class_name, abi):
+    path = tmp_path / f"{class_name}.py"
+    path.write_text(BindingGenerator(class_name, abi).generate(), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(class_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+def test_should_encode_calls_like_hand_written_wrappers(tmp_path):
+    binding_class = load_binding(tmp_path, "PlasmaVaultBinding", ABI)
+    executor = FakeTransactionExecutor()
+    binding = binding_class(executor, VAULT)
+
+    assert binding.total_assets_in_market(3, block_identifier=7) == 42
+    binding.execute([(FUSE, b"\x01")])
+
+    assert executor.calls[0] == (
+        "read",
+        VAULT,
+        Selectors.TOTAL_ASSETS_IN_MARKET + encode(["uint256"], [3]),
+        7,
+    )
+    assert executor.calls[1] == (
+        "execute",
+        VAULT,
+        Selectors.EXECUTE + encode(["(address,bytes)[]"], [[(FUSE, b"\x01")]]),
+    )
+
+
+def test_should_keep_every_overloaded_event_topic(tmp_path):
+    abi = [
+        {
+            "type": "event",
+            "name": "Transfer",
+            "inputs": [
+                {"name": "from", "type": "address", "indexed": True},
+                {"name": "to", "type": "address", "indexed": True},
+                {"name": "value", "type": "uint256", "indexed": False},
+            ],
+        },
+        {
+            "type": "event",
+            "name": "Transfer",
+            "inputs": [
+                {"name": "from", "type": "address", "indexed": True},
+                {"name": "to", "type": "address", "indexed": True},
+                {"name": "value", "type": "uint256", "indexed": False},
+                {"name": "data", "type": "bytes", "indexed": False},
+            ],
+        },
+    ]
+
+    binding_class = load_binding(tmp_path, "TokenBinding", abi)
+
+    assert binding_class.TRANSFER_TOPIC == "0x" + (
+        event_signature_to_log_topic("Transfer(address,address,uint256)").hex()
+    )
+    assert binding_class.TRANSFER_2_TOPIC == "0x" + (
+        event_signature_to_log_topic("Transfer(address,address,uint256,bytes)").hex()
+    )
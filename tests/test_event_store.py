@@ -0,0 +1,74 @@
+from eth_account import Account
+from hexbytes import HexBytes
+
+from fake_web3 import FakeProvider, fake_web3
+from ipor_fusion.EventStore import EventStore
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+TOPIC = "0x" + "ab" * 32
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+
+
+class FakeEth:
+    chain_id = 42161
+
+    def __init__(self, head):
+        self.block_number = head
+        self.ranges = []
+
+    def get_logs(self, filter_params):
+        start, end = filter_params["fromBlock"], filter_params["toBlock"]
+        self.ranges.append((start, end))
+        return [log(number) for number in range(start, end + 1) if number % 100 == 0]
+
+
+def log(block_number):
+    return {
+        "address": VAULT,
+        "blockNumber": block_number,
+        "logIndex": 0,
+        "topics": [HexBytes(TOPIC)],
+        "data": HexBytes(b"\x01"),
+        "blockHash": HexBytes(block_number.to_bytes(32, "big")),
+        "transactionHash": HexBytes(b"\x02" * 32),
+    }
+
+
+def block_numbers(logs):
+    return [entry["blockNumber"] for entry in logs]
+
+
+def test_should_resume_from_last_confirmed_block(tmp_path):
+    path = str(tmp_path / "events.sqlite")
+    eth = FakeEth(head=1_000)
+    executor = TransactionExecutor(
+        fake_web3(eth, FakeProvider()), ACCOUNT, event_store=EventStore(path, 64)
+    )
+
+    assert block_numbers(executor.get_logs(VAULT, [TOPIC])) == list(
+        range(0, 1_001, 100)
+    )
+    assert eth.ranges == [(0, 936), (937, 1_000)]
+
+    eth.block_number, eth.ranges = 1_100, []
+    executor = TransactionExecutor(
+        fake_web3(eth, FakeProvider()), ACCOUNT, event_store=EventStore(path, 64)
+    )
+    logs = executor.get_logs(VAULT, [TOPIC])
+
+    assert block_numbers(logs) == list(range(0, 1_101, 100))
+    assert eth.ranges == [(937, 1_036), (1_037, 1_100)]
+    assert logs[0]["topics"] == [HexBytes(TOPIC)]
+
+
+def test_should_not_store_logs_above_confirmations():
+    store = EventStore(":memory:", confirmations=64)
+    executor = TransactionExecutor(
+        fake_web3(FakeEth(head=1_000), FakeProvider()), ACCOUNT, event_store=store
+    )
+
+    executor.get_logs(VAULT, [TOPIC])
+
+    assert store.last_synced_block(42161, VAULT, TOPIC) == 936
+    assert block_numbers(store.load(42161, VAULT, TOPIC)) == list(range(0, 901, 100))
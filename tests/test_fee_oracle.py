@@ -0,0 +1,81 @@
+from eth_account import Account
+from hexbytes import HexBytes
+
+from fake_web3 import FakeChainEth, executor_provider, fake_web3
+from ipor_fusion.FeeOracle import FeeOracle
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+GWEI = 10**9
+FEE_HISTORY = {
+    "oldestBlock": hex(99),
+    "baseFeePerGas": [hex(10 * GWEI), hex(10 * GWEI), hex(12 * GWEI)],
+    "reward": [
+        [hex(1 * GWEI), hex(2 * GWEI), hex(3 * GWEI)],
+        [hex(1 * GWEI), hex(4 * GWEI), hex(5 * GWEI)],
+    ],
+}
+
+
+class FixedHeadEth(FakeChainEth):
+    @property
+    def block_number(self):
+        return self.head
+
+
+def receipt(tx_hash, block_number):
+    return {"transactionHash": HexBytes(tx_hash), "blockNumber": block_number}
+
+
+def test_should_price_target_from_fee_history():
+    oracle = FeeOracle(target_blocks=FeeOracle.WITHIN_3_BLOCKS)
+    oracle.update(FEE_HISTORY)
+
+    assert oracle.fees() == (int(12 * GWEI * 1.125**3) + 3 * GWEI, 3 * GWEI)
+    assert oracle.fees(FeeOracle.NEXT_BLOCK)[1] == 4 * GWEI
+
+
+def test_should_raise_priority_fee_after_missed_target():
+    oracle = FeeOracle(target_blocks=FeeOracle.NEXT_BLOCK)
+    oracle.update(FEE_HISTORY)
+
+    oracle.track(b"\x01" * 32)
+    oracle.observe_receipt(receipt(b"\x01" * 32, 105))
+    assert oracle.fees()[1] == 5 * GWEI
+
+    oracle.track(b"\x02" * 32)
+    oracle.observe_receipt(receipt(b"\x02" * 32, 101))
+    assert oracle.fees()[1] == int(4 * GWEI * 1.25 * 0.95)
+
+
+def test_should_fetch_fee_history_once_per_head():
+    eth = FixedHeadEth(outcome=lambda transaction: None, head=100)
+    provider = executor_provider()
+    provider.handlers["eth_feeHistory"] = lambda params: FEE_HISTORY
+    oracle = FeeOracle()
+    executor = TransactionExecutor(fake_web3(eth, provider), ACCOUNT, fee_oracle=oracle)
+
+    for index in range(3):
+        executor.submit(VAULT, bytes([index]))
+    assert provider.methods().count("eth_feeHistory") == 1
+
+    oracle.observe_block(101)
+    executor.submit(VAULT, b"\x09")
+    assert provider.methods().count("eth_feeHistory") == 2
+
+
+def test_should_forget_versions_that_lost_to_a_replacement():
+    eth = FakeChainEth(outcome=lambda transaction: None)
+    provider = executor_provider()
+    provider.handlers["eth_feeHistory"] = lambda params: FEE_HISTORY
+    oracle = FeeOracle()
+    executor = TransactionExecutor(fake_web3(eth, provider), ACCOUNT, fee_oracle=oracle)
+    handle = executor.submit(VAULT, b"\x01")
+    eth.outcome = lambda transaction: (1, 21_000)
+
+    executor.speed_up(handle)
+
+    assert handle.wait(timeout=5)["status"] == 1
+    assert handle.tx_hash() == handle.versions()[1]
+    assert not oracle._tracked
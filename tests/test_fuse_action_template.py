@@ -0,0 +1,44 @@
+import pytest
+
+from ipor_fusion.MarketId import MarketId
+from ipor_fusion.fuse.AaveV3SupplyFuse import AaveV3SupplyFuse
+from ipor_fusion.fuse.GearboxSupplyFuse import GearboxSupplyFuse
+
+TOKEN = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+FUSE = "0x0000000000000000000000000000000000000001"
+FARM_FUSE = "0x0000000000000000000000000000000000000002"
+FARMD_TOKEN = "0x0000000000000000000000000000000000000003"
+
+
+def test_should_patch_amount_like_full_encoding():
+    fuse = AaveV3SupplyFuse(FUSE, TOKEN)
+    market_id = MarketId(AaveV3SupplyFuse.PROTOCOL_ID, TOKEN)
+    template = fuse.supply_template(market_id)
+
+    for amount in (1, 10**18, 2**256 - 1):
+        action = template.action(amount=amount)
+        expected = fuse.supply(market_id, amount)
+        assert (action.fuse, action.data) == (expected.fuse, expected.data)
+
+
+def test_should_patch_composed_actions_like_full_encoding():
+    fuse = GearboxSupplyFuse(TOKEN, FUSE, FARMD_TOKEN, FARM_FUSE)
+    market_id = MarketId(GearboxSupplyFuse.PROTOCOL_ID, TOKEN)
+    template = fuse.supply_and_stake_template(market_id)
+
+    for amount in (1, 10**18, 2**256 - 1):
+        actions = template.actions(amount=amount)
+        expected = fuse.supply_and_stake(market_id, amount)
+        assert [(action.fuse, action.data) for action in actions] == [
+            (action.fuse, action.data) for action in expected
+        ]
+    with pytest.raises(ValueError):
+        template.action(amount=1)
+
+
+def test_should_reject_unknown_fields():
+    fuse = AaveV3SupplyFuse(FUSE, TOKEN)
+    template = fuse.supply_template(MarketId(AaveV3SupplyFuse.PROTOCOL_ID, TOKEN))
+
+    with pytest.raises(ValueError):
+        template.action(shares=1)
@@ -0,0 +1,71 @@
+import pytest
+from eth_abi import encode
+from eth_account import Account
+
+from fake_web3 import FakeChainEth, executor_provider, fake_web3
+from ipor_fusion.GasModel import GasModel
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+FUSE = "0x0000000000000000000000000000000000000001"
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+
+
+def execute_data(amount):
+    return Selectors.EXECUTE + encode(
+        ["(address,bytes)[]"], [[(FUSE, amount.to_bytes(32, "big"))]]
+    )
+
+
+def trained_model(gas):
+    gas_model = GasModel()
+    for _ in range(GasModel.DEFAULT_MIN_SAMPLES):
+        gas_model.record(VAULT, execute_data(1), gas)
+    return gas_model
+
+
+def out_of_gas_first(transaction):
+    if transaction["nonce"] == 0:
+        return 0, transaction["gas"]
+    return 1, transaction["gas"] // 2
+
+
+def test_should_predict_stable_shapes_only():
+    gas_model = GasModel()
+
+    for gas in (100_000, 104_000):
+        gas_model.record(VAULT, execute_data(1), gas)
+    assert gas_model.predict(VAULT, execute_data(2)) is None
+    gas_model.record(VAULT, execute_data(3), 102_000)
+    assert gas_model.predict(VAULT, execute_data(2)) == 130_000
+    gas_model.record(VAULT, execute_data(3), 200_000)
+    assert gas_model.predict(VAULT, execute_data(2)) is None
+
+
+def test_should_resend_with_estimate_when_predicted_limit_runs_out():
+    eth = FakeChainEth(outcome=out_of_gas_first)
+    provider = executor_provider(estimated_gas=300_000)
+    executor = TransactionExecutor(
+        fake_web3(eth, provider), ACCOUNT, gas_model=trained_model(100_000)
+    )
+
+    receipt = executor.execute(VAULT, execute_data(5))
+
+    assert receipt["status"] == 1
+    assert [transaction["gas"] for transaction in eth.sent] == [125_000, 375_000]
+    assert provider.methods().count("eth_estimateGas") == 1
+
+
+def test_should_not_resend_when_estimated_limit_runs_out():
+    eth = FakeChainEth(outcome=out_of_gas_first)
+    executor = TransactionExecutor(
+        fake_web3(eth, executor_provider(estimated_gas=100_000)),
+        ACCOUNT,
+        gas_model=GasModel(),
+    )
+
+    with pytest.raises(AssertionError):
+        executor.execute(VAULT, execute_data(5))
+
+    assert len(eth.sent) == 1
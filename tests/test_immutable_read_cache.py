@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+from eth_abi import encode
+from eth_account import Account
+from hexbytes import HexBytes
+from web3.exceptions import Web3RPCError
+
+from fake_web3 import executor_provider, fake_web3
+from ipor_fusion.ImmutableReadCache import ImmutableReadCache
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+BLOCK_HASH = HexBytes(b"\xab" * 32)
+RESULT = HexBytes(encode(["uint256"], [7]))
+
+
+def executor(get_block, path=None):
+    provider = executor_provider()
+    provider.handlers["eth_call"] = lambda params: RESULT.to_0x_hex()
+    eth = SimpleNamespace(chain_id=1, get_block=get_block)
+    cache = ImmutableReadCache(path=path)
+    return TransactionExecutor(fake_web3(eth, provider), ACCOUNT, read_cache=cache)
+
+
+def test_should_serve_finalized_and_hash_reads_from_cache():
+    transaction_executor = executor(lambda tag: {"number": 100})
+    provider = transaction_executor._web3.provider
+
+    for block_identifier in (100, 100, BLOCK_HASH, BLOCK_HASH):
+        assert transaction_executor.read(VAULT, b"\x01", block_identifier) == RESULT
+    assert provider.methods().count("eth_call") == 2
+
+    transaction_executor.read(VAULT, b"\x01", 101)
+    transaction_executor.read(VAULT, b"\x01", 101)
+    assert provider.methods().count("eth_call") == 4
+
+
+def test_should_keep_entries_across_restarts(tmp_path):
+    path = str(tmp_path / "reads.sqlite")
+    executor(lambda tag: {"number": 100}, path).read(VAULT, b"\x01", 90)
+
+    restarted = executor(lambda tag: {"number": 100}, path)
+    assert restarted.read(VAULT, b"\x01", 90) == RESULT
+    assert "eth_call" not in restarted._web3.provider.methods()
+
+
+def test_should_read_through_when_node_lacks_finalized_tag():
+    def get_block(tag):
+        raise Web3RPCError("unknown block tag finalized")
+
+    transaction_executor = executor(get_block)
+    provider = transaction_executor._web3.provider
+
+    assert transaction_executor.read(VAULT, b"\x01", 50) == RESULT
+    assert transaction_executor.read(VAULT, b"\x01", 50) == RESULT
+    assert provider.methods().count("eth_call") == 2
@@ -0,0 +1,83 @@
+import pytest
+from eth_account import Account
+from web3.exceptions import ContractLogicError, Web3RPCError
+
+from fake_web3 import FakeProvider, FakeRpcError, fake_web3
+from ipor_fusion.JsonRpcBatch import JsonRpcBatch
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+
+
+def reverting(params):
+    raise FakeRpcError("execution reverted: too much")
+
+
+def preparation_handlers():
+    return {
+        "eth_chainId": lambda params: "0xa4b1",
+        "eth_estimateGas": lambda params: "0x186a0",
+        "eth_gasPrice": lambda params: "0x3b9aca00",
+        "eth_getTransactionCount": lambda params: "0x7",
+    }
+
+
+def test_should_return_results_in_request_order_from_one_batch():
+    provider = FakeProvider(preparation_handlers())
+    batch = JsonRpcBatch(fake_web3(provider=provider))
+    gas_request = batch.add("eth_estimateGas", [{}])
+    chain_request = batch.add("eth_chainId", [])
+
+    results = batch.execute()
+
+    assert results[gas_request] == "0x186a0"
+    assert results[chain_request] == "0xa4b1"
+    assert provider.batches == [["eth_estimateGas", "eth_chainId"]]
+    assert not provider.requests
+
+
+def test_should_fall_back_to_single_requests_without_batch_support():
+    provider = FakeProvider(preparation_handlers(), batch_supported=False)
+    batch = JsonRpcBatch(fake_web3(provider=provider))
+    batch.add("eth_chainId", [])
+    batch.add("eth_gasPrice", [])
+
+    assert batch.execute() == ["0xa4b1", "0x3b9aca00"]
+    assert provider.methods() == ["eth_chainId", "eth_gasPrice"]
+
+
+def test_should_raise_contract_logic_error_on_revert():
+    provider = FakeProvider({"eth_estimateGas": reverting, "eth_chainId": str})
+    batch = JsonRpcBatch(fake_web3(provider=provider))
+    batch.add("eth_estimateGas", [{}])
+
+    with pytest.raises(ContractLogicError):
+        batch.execute()
+    batch.add("eth_chainId", [])
+    batch.add("eth_estimateGas", [{}])
+    with pytest.raises(ContractLogicError):
+        batch.execute()
+
+
+def test_should_raise_rpc_error_on_other_errors():
+    provider = FakeProvider({"eth_chainId": reverting})
+    batch = JsonRpcBatch(fake_web3(provider=provider))
+    batch.add("eth_chainId", [])
+
+    with pytest.raises(Web3RPCError):
+        batch.execute()
+
+
+def test_should_prepare_transaction_with_one_batch():
+    provider = FakeProvider(preparation_handlers())
+    executor = TransactionExecutor(fake_web3(provider=provider), ACCOUNT)
+
+    transaction = executor.prepare_transaction(VAULT, b"\x01")
+
+    assert len(provider.batches) == 1 and not provider.requests
+    assert transaction["chainId"] == 0xA4B1
+    assert transaction["nonce"] == 7
+    assert transaction["gas"] == int(1.25 * 100_000)
+    assert transaction["maxFeePerGas"] == 1_250_000_000
+    assert transaction["data"] == b"\x01"
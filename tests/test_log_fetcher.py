@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+from web3.exceptions import Web3RPCError
+
+from fake_web3 import fake_web3
+from ipor_fusion.LogFetcher import LogFetcher
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+
+
+class FakeEth:
+    block_number = 12_000
+
+    def __init__(self, max_range=None, error=None):
+        self.max_range = max_range
+        self.error = error
+        self.lock = threading.Lock()
+        self.ranges = []
+
+    def get_logs(self, filter_params):
+        start, end = filter_params["fromBlock"], filter_params["toBlock"]
+        with self.lock:
+            self.ranges.append((start, end))
+        if self.error is not None:
+            raise Web3RPCError(self.error)
+        if self.max_range is not None and end - start + 1 > self.max_range:
+            raise Web3RPCError("query returned more than 10000 results")
+        return [
+            {"blockNumber": number}
+            for number in range(-(-start // 500) * 500, end + 1, 500)
+        ]
+
+
+def test_should_fetch_whole_range_in_one_request():
+    eth = FakeEth()
+    eth.block_number = 250_000_000
+
+    logs = LogFetcher(fake_web3(eth)).get_logs(VAULT, [], 0, "latest")
+
+    assert len(logs) == 500_001
+    assert eth.ranges == [(0, 250_000_000)]
+
+
+def test_should_split_only_rejected_ranges():
+    eth = FakeEth(max_range=3_000_000)
+    eth.block_number = 10_000_000
+
+    logs = LogFetcher(fake_web3(eth)).get_logs(VAULT, [], 0, "latest")
+
+    assert [log["blockNumber"] for log in logs] == list(range(0, 10_000_001, 500))
+    assert len(eth.ranges) == 7
+
+
+def test_should_split_ranges_with_too_many_results():
+    eth = FakeEth(max_range=1_000)
+
+    logs = LogFetcher(fake_web3(eth), max_chunk_size=4_000).get_logs(
+        VAULT, [], 0, 12_000
+    )
+
+    assert [log["blockNumber"] for log in logs] == list(range(0, 12_001, 500))
+    assert max(end - start + 1 for start, end in eth.ranges) == 4_000
+    assert min(end - start + 1 for start, end in eth.ranges) <= 1_000
+
+
+def test_should_not_split_on_rate_limit_errors():
+    eth = FakeEth(error="rate limit exceeded, too many requests")
+
+    with pytest.raises(Web3RPCError):
+        LogFetcher(fake_web3(eth), max_chunk_size=4_000).get_logs(VAULT, [], 0, 12_000)
+
+    assert len(eth.ranges) <= LogFetcher.DEFAULT_MAX_WORKERS
@@ -0,0 +1,107 @@
+import pytest
+from eth_account import Account
+from hexbytes import HexBytes
+from web3.exceptions import TransactionNotFound, Web3RPCError
+
+from fake_web3 import FakeProvider, fake_web3
+from ipor_fusion.NonceManager import NonceManager
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+
+
+class FakeEth:
+    account = Account
+    block_number = 100
+
+    def __init__(self, send_errors=()):
+        self.send_errors = list(send_errors)
+        self.pending_nonce = 5
+        self.nonce_queries = 0
+        self.sent = []
+
+    def get_transaction_count(self, _address, _block_identifier):
+        self.nonce_queries += 1
+        return self.pending_nonce
+
+    def send_raw_transaction(self, raw_transaction):
+        # pylint: disable=no-value-for-parameter
+        self.sent.append(Account.recover_transaction(raw_transaction))
+        if self.send_errors:
+            raise Web3RPCError(self.send_errors.pop(0))
+        return HexBytes(b"\x01" * 32)
+
+    def get_transaction_receipt(self, tx_hash):
+        raise TransactionNotFound("pending")
+
+
+def executor_for(eth):
+    provider = FakeProvider(
+        {
+            "eth_chainId": lambda params: "0x1",
+            "eth_estimateGas": lambda params: "0x5208",
+            "eth_gasPrice": lambda params: "0x1",
+        }
+    )
+    return TransactionExecutor(fake_web3(eth, provider), ACCOUNT)
+
+
+def test_should_hand_out_consecutive_nonces_and_resync():
+    eth = FakeEth()
+    nonce_manager = NonceManager(fake_web3(eth))
+
+    assert [nonce_manager.next_nonce(ACCOUNT.address) for _ in range(3)] == [5, 6, 7]
+    nonce_manager.release(ACCOUNT.address, 7)
+    assert nonce_manager.next_nonce(ACCOUNT.address) == 7
+    nonce_manager.release(ACCOUNT.address, 6)
+    eth.pending_nonce = 9
+    assert nonce_manager.next_nonce(ACCOUNT.address) == 9
+    assert eth.nonce_queries == 2
+
+
+def test_should_only_treat_nonce_messages_as_nonce_errors():
+    nonce_manager = NonceManager(fake_web3())
+
+    assert nonce_manager.is_nonce_error(Web3RPCError("nonce too low: next 3"))
+    assert nonce_manager.is_nonce_error(Web3RPCError("Nonce too high"))
+    assert not nonce_manager.is_nonce_error(Web3RPCError("already known"))
+    assert not nonce_manager.is_nonce_error(
+        Web3RPCError("replacement transaction underpriced")
+    )
+
+
+def test_should_resync_and_resend_on_nonce_too_low():
+    eth = FakeEth(send_errors=["nonce too low"])
+    executor = executor_for(eth)
+
+    handle = executor.submit(VAULT, b"\x01")
+
+    assert len(eth.sent) == 2
+    assert eth.nonce_queries == 2
+    assert handle.nonce() == 5
+
+
+def test_should_treat_already_known_as_sent():
+    eth = FakeEth(send_errors=["already known"])
+    executor = executor_for(eth)
+
+    handle = executor.submit(VAULT, b"\x01")
+    # pylint: disable=no-value-for-parameter
+    signed = Account.sign_transaction(handle.transaction(), ACCOUNT.key)
+
+    assert len(eth.sent) == 1
+    assert handle.tx_hash() == HexBytes(signed.hash)
+    assert executor.submit(VAULT, b"\x02").nonce() == 6
+
+
+def test_should_not_resend_underpriced_transactions():
+    eth = FakeEth(send_errors=["replacement transaction underpriced"])
+    executor = executor_for(eth)
+
+    with pytest.raises(Web3RPCError):
+        executor.submit(VAULT, b"\x01")
+
+    assert len(eth.sent) == 1
+    assert executor.submit(VAULT, b"\x02").nonce() == 5
+    assert eth.nonce_queries == 1
@@ -0,0 +1,84 @@
+from eth_abi import decode, encode
+from eth_account import Account
+from web3.exceptions import ContractLogicError
+
+from fake_web3 import FakeMulticallEth, FakeProvider, fake_web3
+from ipor_fusion.PlasmaVault import PlasmaVault
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3f97cea640b8b93472143f87a96d5a86f1f5167f"
+ASSET = "0xaf88d065e77c8cc2239327c5edb3a432268e5831"
+MARKET_FUSES = {
+    "0x0000000000000000000000000000000000000001": 1,
+    "0x0000000000000000000000000000000000000002": 2,
+    "0x0000000000000000000000000000000000000003": 2,
+}
+CLAIM_FUSE = "0x0000000000000000000000000000000000000004"
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+
+
+def uint(value):
+    return encode(["uint256"], [value])
+
+
+def argument(arguments):
+    (value,) = decode(["uint256"], arguments)
+    return value
+
+
+def answer(target, data):
+    selector, arguments = data[:4], data[4:]
+    if target in MARKET_FUSES and selector == Selectors.MARKET_ID:
+        return uint(MARKET_FUSES[target])
+    if target == CLAIM_FUSE:
+        raise ContractLogicError("execution reverted")
+    if target == ASSET and selector == Selectors.BALANCE_OF:
+        return uint(50)
+    vault_answers = {
+        Selectors.TOTAL_ASSETS: lambda: uint(1_000),
+        Selectors.DECIMALS: lambda: uint(6),
+        Selectors.ASSET: lambda: encode(["address"], [ASSET]),
+        Selectors.GET_FUSES: lambda: encode(
+            ["address[]"], [[*MARKET_FUSES, CLAIM_FUSE]]
+        ),
+        Selectors.TOTAL_ASSETS_IN_MARKET: lambda: uint(100 * argument(arguments)),
+        Selectors.CONVERT_TO_ASSETS: lambda: uint(argument(arguments) * 101 // 100),
+    }
+    return vault_answers[selector]()
+
+
+def test_should_read_every_market_at_one_block():
+    eth = FakeMulticallEth(answer, head=123)
+    executor = TransactionExecutor(fake_web3(eth, FakeProvider()), ACCOUNT)
+
+    snapshot = PlasmaVault(executor, VAULT).snapshot()
+
+    assert snapshot.block_number == 123
+    assert snapshot.total_assets == 1_000
+    assert dict(snapshot.total_assets_in_market) == {1: 100, 2: 200}
+    assert snapshot.underlying_asset_address.lower() == ASSET
+    assert snapshot.underlying_balance == 50
+    assert snapshot.decimals == 6
+    assert snapshot.assets_per_share == 1_010_000
+    assert set(eth.requests) == {123}
+    assert len(eth.requests) == 3
+
+
+def test_should_ask_each_fuse_for_its_market_once():
+    eth = FakeMulticallEth(answer, head=123)
+    plasma_vault = PlasmaVault(
+        TransactionExecutor(fake_web3(eth, FakeProvider()), ACCOUNT), VAULT
+    )
+
+    plasma_vault.snapshot()
+    eth.block_number = 124
+    snapshot = plasma_vault.snapshot(block=130)
+
+    market_id_calls = [
+        call for call in eth.calls if call[1] == bytes(Selectors.MARKET_ID)
+    ]
+    assert len(market_id_calls) == 4
+    assert {block for _, _, block in market_id_calls} == {123}
+    assert snapshot.block_number == 130
+    assert set(eth.requests[3:]) == {130}
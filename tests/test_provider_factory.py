@@ -0,0 +1,42 @@
+import pytest
+from web3 import HTTPProvider, IPCProvider, LegacyWebSocketProvider
+
+from ipor_fusion.ProviderFactory import ProviderFactory
+from ipor_fusion.RoutingProvider import RoutingProvider
+from ipor_fusion.SessionRegistry import SessionRegistry
+
+
+@pytest.mark.parametrize(
+    "uri, provider_type",
+    [
+        ("http://127.0.0.1:8545", HTTPProvider),
+        ("HTTPS://rpc.example.org/key", HTTPProvider),
+        ("ws://127.0.0.1:8546", LegacyWebSocketProvider),
+        ("wss://rpc.example.org/ws", LegacyWebSocketProvider),
+        ("ipc:///tmp/node/geth.ipc", IPCProvider),
+        ("/tmp/node/geth.ipc", IPCProvider),
+    ],
+)
+def test_should_build_provider_for_uri(uri, provider_type, monkeypatch):
+    monkeypatch.setattr(SessionRegistry, "_sessions", {})
+
+    provider = ProviderFactory.from_uri(uri)
+
+    assert isinstance(provider, provider_type)
+    if provider_type is IPCProvider:
+        assert provider.ipc_path == "/tmp/node/geth.ipc"
+
+
+def test_should_pass_built_providers_through_and_route_lists(monkeypatch):
+    monkeypatch.setattr(SessionRegistry, "_sessions", {})
+    provider = IPCProvider("/tmp/node/geth.ipc")
+
+    assert ProviderFactory.create(provider) is provider
+    routing = ProviderFactory.create([provider, "http://127.0.0.1:8545"])
+    assert isinstance(routing, RoutingProvider)
+
+
+@pytest.mark.parametrize("uri", ["ftp://rpc.example.org", "127.0.0.1:8545"])
+def test_should_reject_unsupported_uris(uri):
+    with pytest.raises(ValueError, match="Unsupported provider URI"):
+        ProviderFactory.from_uri(uri)
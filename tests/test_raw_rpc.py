@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from eth_abi import encode
+from eth_account import Account
+from hexbytes import HexBytes
+from web3 import HTTPProvider
+from web3.exceptions import ContractLogicError
+
+from fake_web3 import FakeProvider, FakeRpcError, fake_web3
+from ipor_fusion.RawRpc import RawRpc
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+BLOCK_HASH = HexBytes(b"\xab" * 32)
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+
+
+def answer(params):
+    if params[0]["data"] == "0xdead":
+        raise FakeRpcError("execution reverted")
+    return "0x" + encode(["uint256", "address"], [7, VAULT]).hex()
+
+
+@pytest.mark.parametrize(
+    "block_identifier, tag",
+    [
+        (None, "latest"),
+        (255, "0xff"),
+        ("finalized", "finalized"),
+        (BLOCK_HASH, BLOCK_HASH.to_0x_hex()),
+        (bytes(BLOCK_HASH), BLOCK_HASH.to_0x_hex()),
+    ],
+)
+def test_should_normalize_block_identifiers(block_identifier, tag):
+    provider = FakeProvider({"eth_call": answer})
+
+    view = RawRpc(fake_web3(provider=provider)).call(VAULT, b"\x01", block_identifier)
+
+    assert provider.requests[0][1][1] == tag
+    assert RawRpc.uint(view, 0) == 7
+    assert RawRpc.address(view, 1) == VAULT
+
+
+def test_should_post_hash_block_identifiers_over_http():
+    raw_rpc = RawRpc(fake_web3(provider=HTTPProvider("http://127.0.0.1:1")))
+    payloads = []
+
+    def post(payload):
+        payloads.append(json.loads(payload))
+        return b'{"jsonrpc":"2.0","id":1,"result":"0x' + b"00" * 31 + b'2a"}'
+
+    raw_rpc._post = post
+
+    assert RawRpc.uint(raw_rpc.call(VAULT, b"\x01", BLOCK_HASH)) == 42
+    assert payloads[0]["params"] == [
+        {"to": VAULT, "data": "0x01"},
+        BLOCK_HASH.to_0x_hex(),
+    ]
+
+
+def test_should_read_through_raw_path_and_keep_reverts():
+    provider = FakeProvider({"eth_call": answer})
+    executor = TransactionExecutor(fake_web3(provider=provider), ACCOUNT)
+
+    result = executor.read(VAULT, b"\x01", block_identifier=BLOCK_HASH)
+
+    assert isinstance(result, HexBytes)
+    assert result == encode(["uint256", "address"], [7, VAULT])
+    with pytest.raises(ContractLogicError):
+        executor.read(VAULT, HexBytes("0xdead"))
@@ -0,0 +1,158 @@
+import threading
+
+from eth_abi import encode, decode
+from eth_account import Account
+from eth_utils import function_signature_to_4byte_selector
+from web3.exceptions import ContractLogicError
+
+from fake_web3 import FakeMulticallEth, FakeProvider, fake_web3
+from ipor_fusion.Multicall3 import Multicall3
+from ipor_fusion.ReadBatch import ReadBatch
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+AGGREGATE3 = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+REVERTING = "0x0000000000000000000000000000000000000001"
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+
+
+class FakeEth:
+    def __init__(self):
+        self.calls = []
+
+    def call(self, transaction, block_identifier=None):
+        self.calls.append((transaction, block_identifier))
+        data = bytes(transaction["data"])
+        if data[:4] != AGGREGATE3:
+            return self._answer(transaction["to"], data)
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        results = []
+        for target, _, call_data in calls:
+            try:
+                results.append([True, self._answer(target, call_data)])
+            except ContractLogicError:
+                results.append([False, b""])
+        return encode(["(bool,bytes)[]"], [results])
+
+    @staticmethod
+    def _answer(target, data):
+        if target.lower() == REVERTING:
+            raise ContractLogicError("execution reverted")
+        return encode(["uint256"], [len(data)])
+
+
+class FakeWeb3:
+    def __init__(self):
+        self.eth = FakeEth()
+
+
+def read_length(web3, contract, data):
+    batch = ReadBatch.current()
+    read = batch.read(contract, data) if batch else web3.eth.call({"data": data})
+    (result,) = decode(["uint256"], read)
+    return result
+
+
+def test_should_aggregate_reads_of_one_round_into_single_call():
+    web3 = FakeWeb3()
+    with ReadBatch(web3, Multicall3(web3)) as batch:
+        futures = [
+            batch.submit(read_length, web3, VAULT, b"\x01" * i) for i in range(5)
+        ]
+
+    assert [future.result() for future in futures] == [0, 1, 2, 3, 4]
+    assert len(web3.eth.calls) == 1
+    assert web3.eth.calls[0][0]["to"] == Multicall3.MULTICALL3_ADDRESS
+
+
+def test_should_fail_only_reverted_call():
+    web3 = FakeWeb3()
+    with ReadBatch(web3, Multicall3(web3), block_identifier=100) as batch:
+        ok = batch.submit(read_length, web3, VAULT, b"\x01\x02")
+        reverted = batch.submit(read_length, web3, REVERTING, b"\x01")
+
+    assert ok.result() == 2
+    assert isinstance(reverted.exception(), ContractLogicError)
+    assert web3.eth.calls[0][1] == 100
+
+
+def length_answer(target, data):
+    if target == REVERTING:
+        raise ContractLogicError("execution reverted")
+    return encode(["uint256"], [len(data)])
+
+
+def chain_executor(**kwargs):
+    """Executor whose multicalls go to eth.call and unbatched reads to the provider."""
+    eth = FakeMulticallEth(length_answer)
+    provider = FakeProvider(
+        {
+            "eth_call": lambda params: "0x"
+            + length_answer(
+                params[0]["to"].lower(), bytes.fromhex(params[0]["data"][2:])
+            ).hex()
+        }
+    )
+    return TransactionExecutor(fake_web3(eth, provider), ACCOUNT, **kwargs)
+
+
+def executor_read_length(executor, data):
+    (result,) = decode(["uint256"], executor.read(VAULT, data))
+    return result
+
+
+def test_should_batch_executor_reads_in_an_explicit_batch():
+    executor = chain_executor()
+    eth, provider = executor._web3.eth, executor._web3.provider
+
+    with executor.batch(block_identifier=90) as batch:
+        futures = [
+            batch.submit(executor_read_length, executor, b"\x01" * i) for i in (1, 2, 3)
+        ]
+
+    assert [future.result() for future in futures] == [1, 2, 3]
+    assert eth.requests == [90]
+    assert not provider.requests
+
+
+def test_should_read_directly_without_a_batch():
+    executor = chain_executor()
+    eth, provider = executor._web3.eth, executor._web3.provider
+
+    assert executor_read_length(executor, b"\x01\x02") == 2
+
+    assert not eth.requests
+    assert provider.methods() == ["eth_call"]
+    assert provider.requests[0][1][1] == "latest"
+
+
+def test_should_not_join_a_batch_of_another_web3():
+    executor, other = chain_executor(), chain_executor()
+
+    with executor.batch() as batch:
+        mine = batch.submit(executor_read_length, executor, b"\x01")
+        theirs = batch.submit(executor_read_length, other, b"\x01\x02")
+
+    assert (mine.result(), theirs.result()) == (1, 2)
+    assert len(executor._web3.eth.calls) == 1
+    assert not other._web3.eth.requests
+    assert other._web3.provider.methods() == ["eth_call"]
+
+
+def test_should_coalesce_concurrent_reads_within_window():
+    executor = chain_executor(read_batch_window=0.2)
+    eth = executor._web3.eth
+    results = {}
+
+    def read(size):
+        results[size] = executor_read_length(executor, b"\x01" * size)
+
+    threads = [threading.Thread(target=read, args=(size,)) for size in (1, 2, 3, 4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == {1: 1, 2: 2, 3: 3, 4: 4}
+    assert len(eth.requests) == 1
+    assert len(eth.calls) == 4
@@ -0,0 +1,96 @@
+from hexbytes import HexBytes
+from web3.exceptions import MethodUnavailable, TransactionNotFound, Web3RPCError
+
+from fake_web3 import fake_web3
+from ipor_fusion.ReceiptWatcher import ReceiptWatcher
+
+TX_HASH = HexBytes(b"\x01" * 32)
+RECEIPT = {"transactionHash": TX_HASH, "blockNumber": 111, "status": 1}
+
+
+class FakeEth:
+    def __init__(self, heads, mined_from_head):
+        self.heads = list(heads)
+        self.head = None
+        self.mined_from_head = mined_from_head
+        self.receipt_queries = 0
+
+    @property
+    def block_number(self):
+        if self.heads:
+            self.head = self.heads.pop(0)
+        return self.head
+
+    def get_transaction_receipt(self, _tx_hash):
+        self.receipt_queries += 1
+        if self.head < self.mined_from_head:
+            raise TransactionNotFound("pending")
+        return RECEIPT
+
+
+class FakeBlockReceiptsEth(FakeEth):
+    def __init__(self, heads, mined_from_head, errors):
+        super().__init__(heads, mined_from_head)
+        self.errors = list(errors)
+        self.block_queries = []
+
+    def get_block_receipts(self, block_number):
+        self.block_queries.append(block_number)
+        if self.errors:
+            raise self.errors.pop(0)
+        return [RECEIPT] if block_number == self.mined_from_head else []
+
+
+class UnindexedReceiptsEth(FakeBlockReceiptsEth):
+    """Finds receipts only through eth_getBlockReceipts."""
+
+    def get_transaction_receipt(self, _tx_hash):
+        self.receipt_queries += 1
+        raise TransactionNotFound("not indexed yet")
+
+
+def test_should_poll_pending_hashes_once_per_new_head():
+    eth = FakeEth(heads=[100, 110, 111], mined_from_head=111)
+    watcher = ReceiptWatcher(fake_web3(eth), poll_interval=0.01)
+
+    assert watcher.wait(TX_HASH, timeout=5) == RECEIPT
+    assert eth.receipt_queries == 2
+
+
+def test_should_keep_block_receipts_after_transient_error():
+    eth = FakeBlockReceiptsEth(
+        heads=[100, 110, 111],
+        mined_from_head=111,
+        errors=[Web3RPCError("upstream timeout")],
+    )
+    watcher = ReceiptWatcher(fake_web3(eth), poll_interval=0.01)
+
+    assert watcher.wait(TX_HASH, timeout=5) == RECEIPT
+    assert eth.block_queries[:2] == [99, 99]
+    assert eth.block_queries[-1] == 111
+    assert eth.receipt_queries == 1
+
+
+def test_should_retry_a_block_whose_receipts_failed():
+    eth = UnindexedReceiptsEth(
+        heads=[100, 111],
+        mined_from_head=100,
+        errors=[Web3RPCError("upstream timeout")] * 3,
+    )
+    watcher = ReceiptWatcher(fake_web3(eth), poll_interval=0.01)
+
+    assert watcher.wait(TX_HASH, timeout=5) == RECEIPT
+    assert eth.block_queries.count(100) == 1
+
+
+def test_should_fall_back_to_polling_when_method_is_unavailable():
+    eth = FakeBlockReceiptsEth(
+        heads=[100, 110, 111],
+        mined_from_head=111,
+        errors=[MethodUnavailable("the method does not exist")],
+    )
+    watcher = ReceiptWatcher(fake_web3(eth), poll_interval=0.01)
+
+    assert watcher.wait(TX_HASH, timeout=5) == RECEIPT
+    assert eth.block_queries == [99]
+    assert eth.receipt_queries == 2
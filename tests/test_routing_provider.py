@@ -0,0 +1,57 @@
+import time
+
+from ipor_fusion.RoutingProvider import RoutingProvider
+
+
+class FakeEndpoint:
+    def __init__(self, name, delay=0.0, failing=False, response=None):
+        self.name = name
+        self.delay = delay
+        self.failing = failing
+        self.response = response
+        self.methods = []
+
+    def make_request(self, method, _params):
+        self.methods.append(method)
+        time.sleep(self.delay)
+        if self.failing:
+            raise ConnectionError(f"{self.name} is down")
+        return self.response or {"jsonrpc": "2.0", "id": 1, "result": self.name}
+
+
+def test_should_fail_over_and_prefer_healthy_endpoints():
+    down = FakeEndpoint("down", failing=True)
+    up = FakeEndpoint("up")
+    provider = RoutingProvider([down, up], max_error_rate=0.1)
+
+    assert provider.make_request("eth_blockNumber", [])["result"] == "up"
+    assert provider.make_request("eth_blockNumber", [])["result"] == "up"
+    assert len(down.methods) == 1
+
+
+def test_should_hedge_slow_reads_to_runner_up():
+    slow = FakeEndpoint("slow", delay=1.0)
+    fast = FakeEndpoint("fast")
+    provider = RoutingProvider([slow, fast], hedge=True, min_hedge_delay=0.05)
+
+    start = time.monotonic()
+    response = provider.make_request("eth_call", [])
+
+    assert response["result"] == "fast"
+    assert time.monotonic() - start < 0.5
+    assert slow.methods == ["eth_call"]
+
+
+def test_should_broadcast_to_all_and_return_accepted_send():
+    known = FakeEndpoint(
+        "known",
+        response={"jsonrpc": "2.0", "id": 1, "error": {"message": "already known"}},
+    )
+    accepting = FakeEndpoint("accepting", delay=0.05)
+    down = FakeEndpoint("down", failing=True)
+    provider = RoutingProvider([known, accepting, down])
+
+    response = provider.make_request("eth_sendRawTransaction", ["0x01"])
+
+    assert response["result"] == "accepting"
+    assert known.methods == accepting.methods == down.methods
@@ -0,0 +1,48 @@
+from fake_web3 import fake_web3
+from ipor_fusion.RpcCache import RpcCache
+
+
+class FakeEth:
+    def __init__(self):
+        self.head_queries = 0
+
+    @property
+    def block_number(self):
+        self.head_queries += 1
+        return 100
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+def test_should_keep_constants_without_block_cache():
+    cache = RpcCache(fake_web3(FakeEth()))
+    fetch = Counter()
+
+    assert cache.constant("eth_chainId", fetch) == 1
+    assert cache.constant("eth_chainId", fetch) == 1
+    assert cache.block_scoped("eth_gasPrice", fetch) == 2
+    assert cache.block_scoped("eth_gasPrice", fetch) == 3
+
+
+def test_should_reuse_block_values_until_newer_block_or_invalidation():
+    eth = FakeEth()
+    cache = RpcCache(fake_web3(eth), block_time=60)
+    fetch = Counter()
+
+    assert cache.block_scoped("eth_gasPrice", fetch) == 1
+    assert cache.block_scoped("eth_gasPrice", fetch) == 1
+    cache.observe_block(100)
+    assert cache.block_scoped("eth_gasPrice", fetch) == 1
+    cache.observe_block(101)
+    assert cache.block_scoped("eth_gasPrice", fetch) == 2
+    cache.invalidate()
+    assert cache.block_scoped("eth_gasPrice", fetch) == 3
+    assert eth.head_queries == 1
+    assert cache.stats().block_number == 101
@@ -0,0 +1,52 @@
+from fake_web3 import FakeProvider, fake_web3
+from ipor_fusion.InstrumentedProvider import InstrumentedProvider
+from ipor_fusion.RpcMetrics import RpcMetrics
+from ipor_fusion.Selectors import Selectors
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+HISTOGRAM_SUFFIXES = ("_bucket", "_sum", "_count")
+
+
+def families(text):
+    """Metric family of every sample line, in order, checked against its TYPE."""
+    order = []
+    current, kind = None, None
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            current, kind = line.split()[2:4]
+            order.append(current)
+            continue
+        name = line.split("{")[0]
+        if kind == "histogram":
+            assert name in [current + suffix for suffix in HISTOGRAM_SUFFIXES], line
+        else:
+            assert name == current, line
+    return order
+
+
+def test_should_emit_each_family_as_one_block():
+    metrics = RpcMetrics()
+    metrics.observe(RpcMetrics.RPC, ("eth_call",), 0.02)
+    metrics.observe(RpcMetrics.RPC, ("eth_chainId",), 0.001, error=True)
+    metrics.observe(RpcMetrics.CONTRACT, ("read", VAULT, 'odd"name'), 0.3)
+
+    text = metrics.to_prometheus()
+    order = families(text)
+
+    assert len(order) == len(set(order)) == 6
+    assert 'ipor_fusion_rpc_errors_total{method="eth_chainId"} 1' in text
+    assert 'function="odd\\"name"' in text
+
+
+def test_should_record_provider_requests_and_name_functions():
+    metrics = RpcMetrics()
+    provider = InstrumentedProvider(
+        FakeProvider({"eth_chainId": lambda params: "0x1"}), metrics
+    )
+    fake_web3(provider=provider).provider.make_request("eth_chainId", [])
+    provider.make_batch_request([("eth_chainId", []), ("eth_chainId", [])])
+
+    assert metrics.counts(RpcMetrics.RPC) == {("eth_chainId",): 3}
+    assert metrics.function_label(Selectors.EXECUTE + b"\x00") == (
+        "execute((address,bytes)[])"
+    )
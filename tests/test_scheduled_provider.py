@@ -0,0 +1,76 @@
+import threading
+import time
+
+from ipor_fusion.ScheduledProvider import ScheduledProvider
+
+RATE_LIMITED = {"jsonrpc": "2.0", "id": 1, "error": {"code": 429, "message": "slow"}}
+OK = {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+
+class FakeEndpoint:
+    def __init__(self, responses=(), gate=None):
+        self.responses = list(responses)
+        self.gate = gate
+        self.methods = []
+
+    def make_request(self, method, _params):
+        if self.gate is not None and not self.methods:
+            self.methods.append(method)
+            self.gate.wait(5)
+            return OK
+        self.methods.append(method)
+        return self.responses.pop(0) if self.responses else OK
+
+
+def test_should_halve_window_on_rate_limit_and_grow_back(monkeypatch):
+    monkeypatch.setattr(ScheduledProvider, "BACKOFF", 0.001)
+    endpoint = FakeEndpoint([RATE_LIMITED])
+    provider = ScheduledProvider(endpoint, max_concurrency=32)
+
+    assert provider.make_request("eth_call", []) == OK
+    assert len(endpoint.methods) == 2
+    assert provider.concurrency() == 16
+    for _ in range(20):
+        provider.make_request("eth_call", [])
+    assert provider.concurrency() == 17
+
+
+def test_should_send_transactions_before_queued_reads():
+    gate = threading.Event()
+    endpoint = FakeEndpoint(gate=gate)
+    provider = ScheduledProvider(endpoint, max_concurrency=1)
+    threads = []
+    for method in ("eth_blockNumber", "eth_getLogs", "eth_call"):
+        threads.append(
+            threading.Thread(target=provider.make_request, args=(method, []))
+        )
+        threads[-1].start()
+        time.sleep(0.05)
+    threads.append(
+        threading.Thread(
+            target=provider.make_request, args=("eth_sendRawTransaction", [])
+        )
+    )
+    threads[-1].start()
+    time.sleep(0.05)
+
+    gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert endpoint.methods == [
+        "eth_blockNumber",
+        "eth_sendRawTransaction",
+        "eth_call",
+        "eth_getLogs",
+    ]
+
+
+def test_should_pace_requests_to_rate():
+    provider = ScheduledProvider(FakeEndpoint(), requests_per_second=20, burst=1)
+
+    start = time.monotonic()
+    for _ in range(4):
+        provider.make_request("eth_call", [])
+
+    assert time.monotonic() - start >= 0.14
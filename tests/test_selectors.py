@@ -0,0 +1,52 @@
+import pytest
+from eth_utils import function_signature_to_4byte_selector, keccak
+
+from ipor_fusion.EventTopics import EventTopics
+from ipor_fusion.Selectors import Selectors
+
+
+@pytest.mark.parametrize(
+    "selector, signature",
+    [
+        (Selectors.BALANCE_OF, "balanceOf(address)"),
+        (Selectors.CONVERT_TO_ASSETS, "convertToAssets(uint256)"),
+        (Selectors.EXECUTE, "execute((address,bytes)[])"),
+        (Selectors.TOTAL_ASSETS_IN_MARKET, "totalAssetsInMarket(uint256)"),
+        (Selectors.GET_FUSES, "getFuses()"),
+        (Selectors.HAS_ROLE, "hasRole(uint64,address)"),
+        (Selectors.GRANT_ROLE, "grantRole(uint64,address,uint32)"),
+        (Selectors.CLAIM_REWARDS, "claimRewards((address,bytes)[])"),
+        (Selectors.AAVE_V3_SUPPLY_ENTER, "enter((address,uint256,uint256))"),
+        (Selectors.GEARBOX_SUPPLY_ENTER, "enter((uint256,address))"),
+    ],
+)
+def test_should_match_recomputed_selectors(selector, signature):
+    assert selector == function_signature_to_4byte_selector(signature)
+
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [
+        (Selectors.TRANSFER, "a9059cbb"),
+        (Selectors.APPROVE, "095ea7b3"),
+        (Selectors.DECIMALS, "313ce567"),
+        (Selectors.TOTAL_ASSETS, "01e1d114"),
+        (Selectors.DEPOSIT, "6e553f65"),
+        (Selectors.AGGREGATE3, "82ad56cb"),
+    ],
+)
+def test_should_match_well_known_selectors(selector, expected):
+    assert selector.hex() == expected
+
+
+@pytest.mark.parametrize(
+    "topic, signature",
+    [
+        (EventTopics.ROLE_GRANTED, "RoleGranted(uint64,address,uint32,uint48,bool)"),
+        (EventTopics.WITHDRAW_MANAGER_CHANGED, "WithdrawManagerChanged(address)"),
+        (EventTopics.FUSE_ADDED, "FuseAdded(address)"),
+        (EventTopics.FUSE_REMOVED, "FuseRemoved(address)"),
+    ],
+)
+def test_should_match_recomputed_topics(topic, signature):
+    assert topic == "0x" + keccak(text=signature).hex()
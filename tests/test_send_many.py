@@ -0,0 +1,101 @@
+import pytest
+from eth_account import Account
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3.exceptions import Web3RPCError
+
+from fake_web3 import FakeChainEth, executor_provider, fake_web3
+from ipor_fusion.CheatingTransactionExecutor import CheatingTransactionExecutor
+from ipor_fusion.TransactionExecutor import TransactionExecutor
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+OWNER = "0x1F7bc4dA1a0c2e49d7eF542F74CD46a3FE592cb1"
+ACCOUNT = Account.from_key("0x" + "11" * 32)  # pylint: disable=no-value-for-parameter
+CALLS = [(VAULT, bytes([i])) for i in range(3)]
+
+
+class FailingSecondSendEth(FakeChainEth):
+    failed = False
+
+    def send_raw_transaction(self, raw_transaction):
+        if len(self.sent) == 1 and not self.failed:
+            self.failed = True
+            raise Web3RPCError("insufficient funds")
+        return super().send_raw_transaction(raw_transaction)
+
+
+class NodeSigningEth(FakeChainEth):
+    def send_transaction(self, transaction):
+        self.sent.append(transaction)
+        return HexBytes(len(self.sent).to_bytes(32, "big"))
+
+
+def nonces(raw_transactions):
+    return [
+        TypedTransaction.from_bytes(HexBytes(raw)).as_dict()["nonce"]
+        for raw in raw_transactions
+    ]
+
+
+def test_should_sign_in_spawned_processes_without_keeping_nonces(monkeypatch):
+    monkeypatch.setattr(TransactionExecutor, "MIN_PARALLEL_SIGNING", 2)
+    eth = FakeChainEth()
+    eth.pending_nonce = 4
+    executor = TransactionExecutor(fake_web3(eth, executor_provider()), ACCOUNT)
+
+    raw_transactions = executor.sign_many(CALLS, max_workers=2)
+
+    assert nonces(raw_transactions) == [4, 5, 6]
+    assert executor.submit(VAULT, b"\x09").nonce() == 4
+
+
+def test_should_reuse_signing_processes_until_closed(monkeypatch):
+    monkeypatch.setattr(TransactionExecutor, "MIN_PARALLEL_SIGNING", 2)
+    eth = FakeChainEth()
+    executor = TransactionExecutor(fake_web3(eth, executor_provider()), ACCOUNT)
+
+    handles = executor.send_many(CALLS, max_workers=2)
+    pool = executor._signing_pool
+    raw_transactions = executor.sign_many(CALLS, max_workers=2)
+
+    assert executor._signing_pool is pool
+    assert [handle.nonce() for handle in handles] == [0, 1, 2]
+    assert [transaction["nonce"] for transaction in eth.sent] == [0, 1, 2]
+    assert nonces(raw_transactions) == [3, 4, 5]
+    executor.close()
+    assert executor._signing_pool is None
+
+
+def test_should_broadcast_with_consecutive_nonces():
+    eth = FakeChainEth()
+    executor = TransactionExecutor(fake_web3(eth, executor_provider()), ACCOUNT)
+
+    handles = executor.send_many(CALLS)
+
+    assert [handle.nonce() for handle in handles] == [0, 1, 2]
+    assert [transaction["nonce"] for transaction in eth.sent] == [0, 1, 2]
+    assert executor.submit(VAULT, b"\x09").nonce() == 3
+
+
+def test_should_resync_nonces_when_a_send_fails():
+    eth = FailingSecondSendEth()
+    executor = TransactionExecutor(fake_web3(eth, executor_provider()), ACCOUNT)
+
+    with pytest.raises(Web3RPCError):
+        executor.send_many(CALLS)
+    eth.pending_nonce = 1
+
+    assert executor.submit(VAULT, b"\x09").nonce() == 1
+
+
+def test_should_send_pranked_transactions_through_the_node():
+    eth = NodeSigningEth()
+    executor = CheatingTransactionExecutor(fake_web3(eth, executor_provider()), ACCOUNT)
+    executor.prank(OWNER)
+
+    executor.send_many(CALLS[:2])
+
+    assert [transaction["from"] for transaction in eth.sent] == [OWNER, OWNER]
+    assert [transaction["nonce"] for transaction in eth.sent] == [0, 1]
+    with pytest.raises(NotImplementedError):
+        executor.sign_many(CALLS)
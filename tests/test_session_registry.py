@@ -0,0 +1,54 @@
+import threading
+
+from requests import Response, Session
+
+from ipor_fusion.SessionRegistry import SessionRegistry
+
+ENDPOINT = "https://rpc.example.org"
+
+
+class RecordingSession(Session):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        # Holds every request until all four are in flight on their own threads
+        self.barrier = threading.Barrier(4)
+        self.posts = []
+
+    def post(self, url, data=None, json=None, **kwargs):
+        with self.lock:
+            self.posts.append((url, threading.get_ident()))
+        self.barrier.wait(5)
+        response = Response()
+        response.status_code = 200
+        response._content = b'{"jsonrpc":"2.0","id":0,"result":"0x1"}'
+        return response
+
+
+def test_should_share_one_session_across_providers_and_threads(monkeypatch):
+    sessions = []
+
+    def create_session():
+        sessions.append(RecordingSession())
+        return sessions[-1]
+
+    monkeypatch.setattr(SessionRegistry, "_sessions", {})
+    monkeypatch.setattr(SessionRegistry, "_create_session", create_session)
+    providers = [
+        SessionRegistry.http_provider(f"{ENDPOINT}/a"),
+        SessionRegistry.http_provider(f"{ENDPOINT}/b"),
+    ]
+
+    threads = [
+        threading.Thread(target=provider.make_request, args=("eth_chainId", []))
+        for provider in providers * 2
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(sessions) == 1
+    assert len(sessions[0].posts) == 4
+    assert len({thread for _, thread in sessions[0].posts}) == 4
+    assert {url for url, _ in sessions[0].posts} == {f"{ENDPOINT}/a", f"{ENDPOINT}/b"}
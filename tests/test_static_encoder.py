@@ -0,0 +1,44 @@
+import pytest
+from eth_abi import encode
+from eth_abi.exceptions import ValueOutOfBounds
+
+from ipor_fusion.StaticEncoder import StaticEncoder
+from ipor_fusion.fuse.FuseAction import FuseAction
+
+TOKEN = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+FUSE = "0x0000000000000000000000000000000000000001"
+
+
+def test_should_encode_like_eth_abi():
+    encoder = StaticEncoder("(address,uint24,int24,bool,bytes4,uint256)")
+    values = [TOKEN, 3000, -887220, True, b"\x01\x02", 2**256 - 1]
+
+    assert encoder.encode(values) == encode(encoder.types, values)
+
+
+def test_should_reject_out_of_range_values():
+    encoder = StaticEncoder("(uint24,int24)")
+
+    with pytest.raises(ValueOutOfBounds):
+        encoder.encode([2**24, 0])
+    with pytest.raises(ValueOutOfBounds):
+        encoder.encode([0, -(2**23) - 1])
+
+
+def test_should_reject_dynamic_signatures():
+    with pytest.raises(ValueError):
+        StaticEncoder("(uint256[])")
+
+
+@pytest.mark.parametrize("type_str", ["uint7", "uint0", "int0", "uint512", "int264"])
+def test_should_reject_invalid_integer_sizes(type_str):
+    with pytest.raises(ValueError):
+        StaticEncoder(f"({type_str})")
+
+
+def test_should_encode_fuse_actions_like_eth_abi():
+    actions = [FuseAction(FUSE, b""), FuseAction(TOKEN, bytes(range(70)))]
+
+    assert FuseAction.encode_many(actions) == encode(
+        ["(address,bytes)[]"], [[(action.fuse, action.data) for action in actions]]
+    )
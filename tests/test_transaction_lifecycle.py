@@ -0,0 +1,114 @@
+import threading
+import time
+
+from hexbytes import HexBytes
+
+from ipor_fusion.TransactionHandle import TransactionHandle
+from ipor_fusion.TransactionLifecycle import TransactionLifecycle
+
+OWNER = "0x1F7bc4dA1a0c2e49d7eF542F74CD46a3FE592cb1"
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+TRANSACTION = {
+    "from": OWNER,
+    "to": VAULT,
+    "nonce": 3,
+    "gas": 100_000,
+    "maxFeePerGas": 100,
+    "maxPriorityFeePerGas": 10,
+    "data": b"\x01",
+}
+
+
+class FakeReceiptWatcher:
+    def __init__(self, lookup_delay=0.0):
+        self.lookup_delay = lookup_delay
+        self.receipts = {}
+        self.forgotten = []
+
+    def watch(self, _tx_hash):
+        event = threading.Event()
+        event.set()
+        return event
+
+    def receipt(self, tx_hash):
+        time.sleep(self.lookup_delay)
+        return self.receipts.get(HexBytes(tx_hash))
+
+    def forget(self, tx_hash):
+        self.forgotten.append(HexBytes(tx_hash))
+
+    def mine(self, tx_hash, block_number=110):
+        self.receipts[HexBytes(tx_hash)] = {
+            "transactionHash": HexBytes(tx_hash),
+            "blockNumber": block_number,
+            "status": 1,
+        }
+
+
+class FakeSender:
+    def __init__(self):
+        self.sent = []
+
+    def __call__(self, transaction):
+        self.sent.append(transaction)
+        return HexBytes(bytes([len(self.sent) + 1]) * 32)
+
+
+def test_should_resolve_once_when_raced_by_watcher_and_waiter():
+    watcher = FakeReceiptWatcher(lookup_delay=0.05)
+    resolved = []
+    handle = TransactionHandle(
+        watcher,
+        b"\x01" * 32,
+        TRANSACTION,
+        lambda resolved_handle, receipt: resolved.append(receipt),
+    )
+    watcher.mine(b"\x01" * 32)
+
+    threads = [threading.Thread(target=handle.receipt, args=(5,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(resolved) == 1
+    assert watcher.forgotten == [HexBytes(b"\x01" * 32)]
+
+
+def test_should_speed_up_stuck_transaction_and_resolve_with_replacement():
+    watcher = FakeReceiptWatcher()
+    send = FakeSender()
+    lifecycle = TransactionLifecycle(send, replace_after_blocks=2)
+    handle = lifecycle.track(TransactionHandle(watcher, b"\x01" * 32, TRANSACTION))
+
+    for block_number in (100, 101):
+        lifecycle.on_block(block_number)
+    assert not send.sent
+    lifecycle.on_block(102)
+
+    assert len(send.sent) == 1
+    assert send.sent[0]["nonce"] == 3
+    assert send.sent[0]["maxFeePerGas"] == 114
+    assert send.sent[0]["maxPriorityFeePerGas"] == 12
+    watcher.mine(handle.versions()[1])
+    lifecycle.on_block(103)
+
+    assert lifecycle.pending() == 0
+    assert handle.tx_hash() == handle.versions()[1]
+    assert handle.transaction() == send.sent[0]
+
+
+def test_should_cancel_with_zero_value_transfer_to_sender():
+    send = FakeSender()
+    lifecycle = TransactionLifecycle(send)
+    handle = lifecycle.track(
+        TransactionHandle(FakeReceiptWatcher(), b"\x01" * 32, TRANSACTION)
+    )
+
+    lifecycle.cancel(handle)
+
+    assert send.sent[0]["to"] == OWNER
+    assert send.sent[0]["value"] == 0
+    assert send.sent[0]["data"] == b""
+    assert send.sent[0]["nonce"] == 3
+    assert len(handle.versions()) == 2
@@ -0,0 +1,113 @@
+from eth_abi import encode
+from hexbytes import HexBytes
+
+from fake_web3 import fake_web3
+from ipor_fusion.EventTopics import EventTopics
+from ipor_fusion.LogFetcher import LogFetcher
+from ipor_fusion.PlasmaVaultDataReader import PlasmaVaultDataReader
+from ipor_fusion.Selectors import Selectors
+from ipor_fusion.VaultMetadataCache import VaultMetadataCache
+
+VAULT = "0x3F97CEa640B8B93472143f87a96d5A86f1F5167F"
+ASSET = "0xaf88d065e77c8cC2239327C5EDb3A432268e5831"
+MANAGER = "0x1F7bc4dA1a0c2e49d7eF542F74CD46a3FE592cb1"
+FUSE = "0x4A42E4a5cbE1a2C0C2A3D39E3A47e0Fe0C1f7d2d"
+ANSWERS = {
+    bytes(Selectors.GET_ACCESS_MANAGER_ADDRESS): encode(["address"], [MANAGER]),
+    bytes(Selectors.ASSET): encode(["address"], [ASSET]),
+    bytes(Selectors.GET_REWARDS_CLAIM_MANAGER_ADDRESS): encode(["address"], [MANAGER]),
+    bytes(Selectors.GET_FUSES): encode(["address[]"], [[FUSE]]),
+    bytes(Selectors.DECIMALS): encode(["uint256"], [6]),
+}
+
+
+class FakeVaultExecutor:
+    """
+    Answers vault reads; `changes` are the block numbers of change events. Logs go
+    through a LogFetcher with this object as its eth module.
+    """
+
+    def __init__(self, head=100):
+        self.head = head
+        self.changes = []
+        self.reads = []
+        self.log_queries = []
+
+    def chain_id(self):
+        return 1
+
+    def block_number(self):
+        return self.head
+
+    def read(self, _contract, data, _block_identifier=None):
+        self.reads.append(bytes(HexBytes(data)[:4]))
+        return HexBytes(ANSWERS[bytes(HexBytes(data)[:4])])
+
+    def iter_logs(self, contract_address, topics, from_block=0, to_block="latest"):
+        to_block = self.head if to_block == "latest" else to_block
+        return LogFetcher(fake_web3(self)).iter_logs(
+            contract_address, topics, from_block, to_block
+        )
+
+    def get_logs(self, filter_params):
+        start, end = filter_params["fromBlock"], filter_params["toBlock"]
+        self.log_queries.append((filter_params["topics"], start, end))
+        if filter_params["topics"] == [EventTopics.WITHDRAW_MANAGER_CHANGED]:
+            return []
+        return [
+            {"blockNumber": block} for block in self.changes if start <= block <= end
+        ]
+
+
+def test_should_reuse_entry_until_a_change_event():
+    executor = FakeVaultExecutor()
+    reader = PlasmaVaultDataReader(executor, VaultMetadataCache(":memory:"))
+
+    first = reader.read(VAULT)
+    assert first.fuses == [FUSE] and first.asset_decimals == 6
+    reads = len(executor.reads)
+
+    executor.head = 110
+    assert reader.read(VAULT) == first
+    assert len(executor.reads) == reads
+    assert executor.log_queries[-1][1:] == (101, 110)
+
+    executor.changes.append(115)
+    executor.head = 120
+    reader.read(VAULT)
+    assert len(executor.reads) > reads
+
+
+def test_should_revalidate_a_long_range_with_one_request():
+    executor = FakeVaultExecutor()
+    reader = PlasmaVaultDataReader(executor, VaultMetadataCache(":memory:"))
+    reader.read(VAULT)
+    queries = len(executor.log_queries)
+
+    executor.head = 3_000_100
+    reader.read(VAULT)
+
+    assert executor.log_queries[queries:] == [
+        ([PlasmaVaultDataReader.CHANGE_EVENTS], 101, 3_000_100)
+    ]
+
+
+def test_should_reread_when_head_is_behind_cached_block():
+    executor = FakeVaultExecutor(head=100)
+    reader = PlasmaVaultDataReader(executor, VaultMetadataCache(":memory:"))
+    reader.read(VAULT)
+    reads = len(executor.reads)
+
+    executor.head = 90
+    reader.read(VAULT)
+
+    assert len(executor.reads) > reads
+
+
+def test_should_skip_decimals_without_cache():
+    executor = FakeVaultExecutor()
+
+    data = PlasmaVaultDataReader(executor).read(VAULT)
+
+    assert data.decimals is None and data.asset_decimals is None
+    assert bytes(Selectors.DECIMALS) not in executor.reads